@@ -122,12 +122,20 @@ XMLStyle_saxdom.  However, since the pyxb.xmlschema.structures classes require
 a DOM model, XMLStyle_saxdom will be used for pyxb.utils.domutils.StringToDOM
 if this style is selected."""
 
+XMLStyle_expat = 3
+"""Use pyxb.binding.saxer with callbacks invoked directly by pyexpat when
+converting documents to binding instances.  This produces the same bindings
+as XMLStyle_saxer, but avoids the per-event overhead of the xml.sax
+interface layer.  As with XMLStyle_saxer, XMLStyle_saxdom will be used for
+pyxb.utils.domutils.StringToDOM if this style is selected."""
+
 _XMLStyle = XMLStyle_saxer
 """The current XML processing style."""
 
 _XMLStyleMap = { 'minidom' : XMLStyle_minidom,
                  'saxdom' : XMLStyle_saxdom,
-                 'saxer' : XMLStyle_saxer }
+                 'saxer' : XMLStyle_saxer,
+                 'expat' : XMLStyle_expat }
 _XMLStyleMapReverse = dict([ (_v, _k) for (_k, _v) in six.iteritems(_XMLStyleMap) ])
 
 _XMLStyle_envvar = 'PYXB_XML_STYLE'
@@ -137,10 +145,12 @@ def _SetXMLStyle (style=None):
 
     This can be invoked within code.  The system default of L{XMLStyle_saxer}
     can also be overridden at runtime by setting the environment variable
-    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, or C{saxer}.
+    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, C{saxer}, or
+    C{expat}.
 
     @param style: One of L{XMLStyle_minidom}, L{XMLStyle_saxdom},
-    L{XMLStyle_saxer}.  If not provided, the system default is used.
+    L{XMLStyle_saxer}, L{XMLStyle_expat}.  If not provided, the system
+    default is used.
     """
     global _XMLStyle
     if style is None:
@@ -235,6 +245,26 @@ class ValidationConfig (object):
         return value
     forDocument = property(_getForDocument)
 
+    __deferAttributeConversion = False
+    def _getDeferAttributeConversion (self):
+        """C{True} iff attribute values in parsed documents are kept in
+        lexical form until first accessed.
+
+        When set, conversion to the attribute datatype (including checks
+        of facet constraints) is performed when the value is read through
+        the generated property, when the instance is validated, or when a
+        document is generated from it.  Errors in attribute values are
+        diagnosed at that point rather than while parsing."""
+        return self.__deferAttributeConversion
+    def _setDeferAttributeConversion (self, value):
+        """Configure whether attribute values from parsed documents are
+        converted when first accessed."""
+        if not isinstance(value, bool):
+            raise TypeError(value)
+        self.__deferAttributeConversion = value
+        return value
+    deferAttributeConversion = property(_getDeferAttributeConversion)
+
     ALWAYS = -1
     """Always do it."""
 
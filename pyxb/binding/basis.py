@@ -517,6 +517,12 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
 
         if bds is None:
             bds = domutils.BindingDOMSupport()
+        element = self.__createDOMElement(bds, parent, element_name)
+        self._toDOM_csc(bds, element)
+        bds.finalize()
+        return bds.document()
+
+    def __createDOMElement (self, bds, parent, element_name):
         need_xsi_type = bds.requireXSIType()
         if isinstance(element_name, six.string_types):
             element_name = pyxb.namespace.ExpandedName(bds.defaultNamespace(), element_name)
@@ -529,11 +535,31 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         element = bds.createChildElement(element_name, parent)
         if need_xsi_type:
             bds.addAttribute(element, XSI.type, self._ExpandedName)
-        self._toDOM_csc(bds, element)
+        return element
+
+    def _toDOM_iter (self, bds, parent=None, element_name=None):
+        """Generator equivalent of L{toDOM}.
+
+        The tree is generated in the same order as by L{toDOM}, but control
+        returns to the caller after each child element of a complex type
+        instance has been added.  This is used by
+        L{pyxb.utils.domutils.BindingXMLWriter} to produce output before the
+        whole instance has been visited.  The values yielded carry no
+        information."""
+        element = self.__createDOMElement(bds, parent, element_name)
+        for _ in self._toDOM_csc_iter(bds, element):
+            yield _
         bds.finalize()
-        return bds.document()
 
-    def toxml (self, encoding=None, bds=None, root_only=False, element_name=None):
+    def _toDOM_csc_iter (self, dom_support, parent):
+        """Generator equivalent of L{_toDOM_csc}.
+
+        Complex types override this to yield after each child; all other
+        types add their content at once."""
+        self._toDOM_csc(dom_support, parent)
+        return iter(())
+
+    def toxml (self, encoding=None, bds=None, root_only=False, element_name=None, stream=None):
         """Shorthand to get the object as an XML document.
 
         If you want to set the default namespace, pass in a pre-configured
@@ -556,12 +582,54 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         @param element_name: This value is passed through to L{toDOM}, and is
         useful when the value has no bound element but you want to convert it
         to XML anyway.
+
+        @keyword stream: If provided, the document is written to this object
+        using a L{pyxb.utils.domutils.BindingXMLWriter} rather than being
+        returned, and no DOM tree is built.  Text is written if C{encoding} is
+        C{None}, otherwise bytes.  If C{bds} is provided it must be a
+        L{BindingXMLWriter<pyxb.utils.domutils.BindingXMLWriter>}.
         """
+        if stream is not None:
+            if bds is None:
+                bds = domutils.BindingXMLWriter()
+            if not isinstance(bds, domutils.BindingXMLWriter):
+                raise pyxb.UsageError('toxml to stream requires a BindingXMLWriter')
+            bds.write(self, stream, encoding=encoding, xml_declaration=not root_only, element_name=element_name)
+            return None
         dom = self.toDOM(bds, element_name=element_name)
         if root_only:
             dom = dom.documentElement
         return dom.toxml(encoding)
 
+    def toxml_iter (self, chunk_size=None, encoding='utf-8', bds=None, root_only=False, element_name=None):
+        """Generate the object as an XML document in chunks.
+
+        The document is produced incrementally as the instance is visited:
+        the first chunk is available before the content of the instance has
+        been examined.  This is useful when the document is to be returned
+        through an interface that consumes an iterable, such as a WSGI
+        response.  The concatenation of the chunks is the document that would
+        be written by L{toxml} with C{stream}.
+
+        @keyword chunk_size: The approximate size of each chunk other than
+        the last, in characters.  Defaults to
+        L{BindingXMLWriter.BufferSize<pyxb.utils.domutils.BindingXMLWriter.BufferSize>}.
+
+        @keyword encoding: The encoding for the chunks (default C{'utf-8'}).
+        If C{None}, the chunks are text.
+
+        @keyword bds: Optional L{pyxb.utils.domutils.BindingXMLWriter} to use.
+
+        @keyword root_only: If C{True}, the XML declaration is omitted.
+
+        @keyword element_name: As with L{toxml}.
+        """
+        if bds is None:
+            bds = domutils.BindingXMLWriter()
+        if not isinstance(bds, domutils.BindingXMLWriter):
+            raise pyxb.UsageError('toxml_iter requires a BindingXMLWriter')
+        return bds.iterwrite(self, chunk_size=chunk_size, encoding=encoding, xml_declaration=not root_only, element_name=element_name)
+
     def _toDOM_csc (self, dom_support, parent):
         assert parent is not None
         if self.__xsiNil:
@@ -1031,14 +1099,9 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     __ClassFacetSequence = { }
 
     @classmethod
-    def XsdConstraintsOK (cls, value, location=None):
-        """Validate the given value against the constraints on this class.
-
-        @raise pyxb.SimpleTypeValueError: if any constraint is violated.
-        """
-
-        value = cls._XsdConstraintsPreCheck_vb(value)
-
+    def _FacetSequence (cls):
+        """Return the facets that constrain values of this class, in the
+        order they are checked by L{XsdConstraintsOK}."""
         facet_values = cls.__ClassFacetSequence.get(cls)
         if facet_values is None:
             # Constraints for simple type definitions are inherited.  Check them
@@ -1064,7 +1127,17 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
                         facet_values.append(v)
             if cache_result:
                 cls.__ClassFacetSequence[cls] = facet_values
-        for f in facet_values:
+        return facet_values
+
+    @classmethod
+    def XsdConstraintsOK (cls, value, location=None):
+        """Validate the given value against the constraints on this class.
+
+        @raise pyxb.SimpleTypeValueError: if any constraint is violated.
+        """
+
+        value = cls._XsdConstraintsPreCheck_vb(value)
+        for f in cls._FacetSequence():
             if not f.validateConstraint(value):
                 raise pyxb.SimpleFacetValueError(cls, value, f, location)
         return value
@@ -1121,8 +1194,11 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
 
     def _toDOM_csc (self, dom_support, parent):
         assert parent is not None
+        # Attributes (e.g. xsi:nil) are added before the content so the
+        # element can be written as it is generated.
+        getattr(super(simpleTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
         dom_support.appendTextChild(self, parent)
-        return getattr(super(simpleTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+        return dom_support
 
     @classmethod
     def _IsSimpleTypeContent (cls):
@@ -1152,9 +1228,7 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         if issubclass(cls, STD_list):
             if not isinstance(value, collections.Iterable):
                 raise pyxb.SimpleTypeValueError(cls, value)
-            for v in value:
-                if not cls._ItemType._IsValidValue(v):
-                    raise pyxb.SimpleListValueError(cls, v)
+            cls._CheckValidItems(value)
         else:
             if issubclass(cls, STD_union):
                 value_class = None
@@ -1175,7 +1249,7 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     def _isValidValue (self):
         self._IsValidValue(self)
 
-    def _setAttribute (self, attr_en, value_lex):
+    def _setAttribute (self, attr_en, value_lex, _defer_conversion=False):
         # Simple types have no attributes, but the parsing infrastructure
         # might invoke this to delegate responsibility for notifying the user
         # of the failure.
@@ -1300,12 +1374,25 @@ class STD_union (simpleTypeDefinition):
         return cls._ValidatedMember(value).xsdLiteral()
 
 
+def _CompactDecimal (value):
+    """Convert a value to a C{decimal.Decimal} that is permitted as an
+    XMLSchema decimal."""
+    if isinstance(value, float):
+        value = repr(value)
+    rv = decimal.Decimal(value)
+    if not (rv.is_normal() or rv.is_zero()):
+        raise ValueError(value)
+    return rv
+
 class STD_list (simpleTypeDefinition, six.list_type):
     """Base class for collection datatypes.
 
     This class descends from the Python list type, and incorporates
     simpleTypeDefinition.  Subclasses must define a class variable _ItemType
-    which is a reference to the class of which members must be instances."""
+    which is a reference to the class of which members must be instances.
+
+    Lists with a numeric item type may instead hold their items as plain
+    Python numbers; see L{_SetCompactItems}."""
 
     _ItemType = None
     """A reference to the binding class for items within this list."""
@@ -1314,6 +1401,157 @@ class STD_list (simpleTypeDefinition, six.list_type):
     # initialized.  Alternative is to not descend from simpleTypeDefinition.
     __FacetMap = {}
 
+    # A singleton tuple holding the function that converts an item to a plain
+    # Python number, or None if items are instances of _ItemType.  The tuple
+    # prevents Python from treating the function as a method.
+    __CompactConverter = None
+
+    # Map from the local name of an XMLSchema primitive type to the function
+    # that converts values of types derived from it to plain Python numbers.
+    __CompactPrimitives = { 'float': float, 'double': float, 'decimal': _CompactDecimal }
+
+    # Facets that are satisfied by every item of a list if they are satisfied
+    # by its least and greatest items.
+    __RangeFacetNames = frozenset([ 'minInclusive', 'maxInclusive', 'minExclusive', 'maxExclusive' ])
+
+    # Facets that never constrain numeric values.  Patterns are ignored for
+    # values that are not strings.
+    __IgnoredFacetNames = frozenset([ 'whiteSpace', 'pattern' ])
+
+    @classmethod
+    def __CompactConverterFor (cls, item_type):
+        if (not issubclass(item_type, simpleTypeDefinition)) or issubclass(item_type, (STD_union, STD_list)):
+            return None
+        super_type = item_type
+        while super_type is not None:
+            name = getattr(super_type, '_ExpandedName', None)
+            if (name is not None) and (name.namespace() == pyxb.namespace.XMLSchema):
+                converter = cls.__CompactPrimitives.get(name.localName())
+                if converter is not None:
+                    if issubclass(item_type, six.integer_types):
+                        converter = int
+                    return converter
+            super_type = super_type.XsdSuperType()
+        return None
+
+    @classmethod
+    def _SetCompactItems (cls, compact=True):
+        """Select how items are held in instances of this list type.
+
+        By default each item is an instance of L{_ItemType}.  If C{compact}
+        is C{True} and the item type derives from XMLSchema decimal, float, or
+        double, items are instead held as plain Python C{int}, C{float}, or
+        C{decimal.Decimal} values.  Text is then converted for the list as a
+        whole, and range facets on the item type are checked against the
+        least and greatest items rather than against each one.  This greatly
+        reduces the time and memory needed for long numeric lists such as
+        GML coordinate lists.
+
+        The selection applies to subclasses that do not make their own, and
+        should be made before any instances are created.
+
+        @raise pyxb.UsageError: C{compact} is C{True} and the item type is
+        not numeric
+        """
+        converter = None
+        if compact:
+            converter = cls.__CompactConverterFor(cls._ItemType)
+            if converter is None:
+                raise pyxb.UsageError('%s items of type %s cannot be held compactly' % (cls._Name(), cls._ItemType._Name()))
+            converter = (converter,)
+        cls.__CompactConverter = converter
+        return cls
+
+    @classmethod
+    def _CompactItems (cls):
+        """Return C{True} iff items of this list type are held as plain
+        Python numbers.  See L{_SetCompactItems}."""
+        return cls.__CompactConverter is not None
+
+    @classmethod
+    def __CompactItems (cls, converter, values, kw=None, validate=True):
+        location = None
+        if kw is not None:
+            location = kw.get('_location')
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        try:
+            items = list(map(converter, values))
+        except (ValueError, TypeError, ArithmeticError):
+            for v in values:
+                try:
+                    converter(v)
+                except (ValueError, TypeError, ArithmeticError):
+                    raise pyxb.SimpleListValueError(cls, v, location)
+            raise
+        if validate:
+            cls.__CheckCompactItems(items, location)
+        return items
+
+    @classmethod
+    def __CheckCompactItems (cls, items, location):
+        item_type = cls._ItemType
+        extremes = None
+        instances = None
+        for f in item_type._FacetSequence():
+            name = f.Name()
+            if name in cls.__IgnoredFacetNames:
+                continue
+            collection = getattr(f, '_items', None)
+            if collection is not None:
+                if not collection():
+                    continue
+            elif f.value() is None:
+                continue
+            if name in cls.__RangeFacetNames:
+                if extremes is None:
+                    # NaN is not ordered with respect to other values, so it
+                    # must be checked separately
+                    extremes = [ _v for _v in items if _v != _v ]
+                    ordered = items
+                    if extremes:
+                        ordered = [ _v for _v in items if _v == _v ]
+                    if ordered:
+                        extremes.extend([ min(ordered), max(ordered) ])
+                candidates = extremes
+            else:
+                if instances is None:
+                    try:
+                        instances = [ item_type(_v, _validate_constraints=False) for _v in items ]
+                    except pyxb.SimpleTypeValueError as e:
+                        raise pyxb.SimpleListValueError(cls, e.value, location)
+                candidates = instances
+            for v in candidates:
+                if not f.validateConstraint(v):
+                    raise pyxb.SimpleListValueError(cls, v, location)
+
+    @classmethod
+    def _CheckValidItems (cls, value):
+        """Verify that every item in C{value} is permitted as an item of
+        this list.
+
+        @raise pyxb.SimpleListValueError: an item is not permitted
+        """
+        converter = cls.__CompactConverter
+        if converter is None:
+            for v in value:
+                if not cls._ItemType._IsValidValue(v):
+                    raise pyxb.SimpleListValueError(cls, v)
+        else:
+            cls.__CompactItems(converter[0], value)
+
+    @classmethod
+    def _ValidatedItems (cls, values, kw=None):
+        """Return a list holding the result of L{_ValidatedItem} for each
+        of the given values.
+
+        When items are compact the values are converted and checked together.
+        """
+        converter = cls.__CompactConverter
+        if converter is None:
+            return [ cls._ValidatedItem(_v, kw) for _v in values ]
+        return cls.__CompactItems(converter[0], values, kw, cls._ItemType._GetValidationConfig().forBinding)
+
     @classmethod
     def _ValidatedItem (cls, value, kw=None):
         """Verify that the given value is permitted as an item of this list.
@@ -1327,6 +1565,9 @@ class STD_list (simpleTypeDefinition, six.list_type):
         when exceptions must be built.  In particular, C{_location} may be
         useful.
         """
+        converter = cls.__CompactConverter
+        if converter is not None:
+            return cls.__CompactItems(converter[0], (value,), kw, cls._ItemType._GetValidationConfig().forBinding)[0]
         if isinstance(value, cls._ItemType):
             pass
         elif issubclass(cls._ItemType, STD_union):
@@ -1351,8 +1592,7 @@ class STD_list (simpleTypeDefinition, six.list_type):
                 args = (arg1.split(),) + args[1:]
                 arg1 = args[0]
             if isinstance(arg1, collections.Iterable):
-                new_arg1 = [ cls._ValidatedItem(_v, kw) for _v in arg1 ]
-                args = (new_arg1,) + args[1:]
+                args = (cls._ValidatedItems(arg1, kw),) + args[1:]
         super_fn = getattr(super(STD_list, cls), '_ConvertArguments_vx', lambda *a,**kw: args)
         return super_fn(args, kw)
 
@@ -1380,7 +1620,7 @@ class STD_list (simpleTypeDefinition, six.list_type):
 
     # Convert a sequence of values to the required type, if not already instances
     def __convertMany (self, values):
-        return [ self._ValidatedItem(_v) for _v in values ]
+        return self._ValidatedItems(values)
 
     def __setitem__ (self, key, value):
         if isinstance(key, slice):
@@ -1586,6 +1826,24 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         self.__xsdLocation = location
         super(element, self).__init__()
 
+    def __reduce_ex__ (self, protocol):
+        """Pickling support.
+
+        Element bindings are defined by the generated binding modules, so
+        are represented by a reference to their definition: the complex
+        type and element use id of a local element, or the namespace URI
+        and local name of a global element.  Global elements in an absent
+        namespace are pickled by value."""
+        if self.__scope is not None:
+            for eu in six.itervalues(self.__scope._ElementMap):
+                if eu.elementBinding() is self:
+                    return (_ElementForReference, (self.__scope, eu.id()))
+        else:
+            ns = self.__name.namespace()
+            if (ns is not None) and not ns.isAbsentNamespace():
+                return (_ElementForReference, (None, ns.uri(), self.__name.localName()))
+        return super(element, self).__reduce_ex__(protocol)
+
     def __call__ (self, *args, **kw):
         """Invoke the Factory method on the type associated with this element.
 
@@ -1845,6 +2103,31 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
             desc.extend(["\n", self.documentation() ])
         return six.u('').join(desc)
 
+def _ElementForReference (scope, *args):
+    """Return the element binding identified by the pickled value of an
+    L{element}.
+
+    @param scope: The complex type within which a local element is defined,
+    or C{None} for a global element.
+
+    @param args: The L{id<pyxb.binding.content.ElementDeclaration.id>} of
+    the local element use, or the namespace URI and local name of the global
+    element."""
+    rv = None
+    if scope is None:
+        (uri, local_name) = args
+        ns = pyxb.namespace.NamespaceForURI(uri, create_if_missing=True)
+        rv = ns.createExpandedName(local_name).elementBinding()
+    else:
+        (use_id,) = args
+        for eu in six.itervalues(scope._ElementMap):
+            if eu.id() == use_id:
+                rv = eu.elementBinding()
+                break
+    if rv is None:
+        raise pyxb.UsageError('Unable to locate element binding for %s' % (args,))
+    return rv
+
 class enumeration_mixin (pyxb.cscRoot):
     """Marker in case we need to know that a PST has an enumeration constraint facet."""
 
@@ -2130,6 +2413,12 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     # the content model for the type.
     _Automaton = None
 
+    # None, or a tuple of (ElementDeclaration, minOccurs, maxOccurs) triples
+    # when the content model is a plain sequence of elements.  Generated
+    # bindings set this so that content can be ordered for output without
+    # replaying the automaton.
+    _ElementSequence = None
+
     @classmethod
     def _AddElement (cls, element):
         """Method used by generated code to associate the element binding with a use in this type.
@@ -2189,8 +2478,68 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         """
         if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
             return []
+        cache = self.__validatedChildrenCache
+        if (cache is not None) and self.__validatedChildrenCacheValid(cache[0]):
+            return list(cache[1])
         self._resetAutomaton()
-        return self.__automatonConfiguration.sequencedChildren()
+        order = self.__automatonConfiguration.sequencedChildren()
+        state = self.__validatedChildrenState()
+        if state is not None:
+            self.__validatedChildrenCache = (state, tuple(order))
+        return order
+
+    # None, or a pair comprising the state of the content when
+    # _validatedChildren was last invoked and the sequence it returned.
+    __validatedChildrenCache = None
+
+    def _invalidateValidatedChildren (self):
+        """Discard any cached result of L{_validatedChildren}.
+
+        This is invoked whenever element content is added or reset.  Changes
+        to the lists holding values of plural elements are detected
+        separately."""
+        self.__validatedChildrenCache = None
+
+    def __validatedChildrenState (self):
+        # Capture the aspects of the content that affect _validatedChildren
+        # and are not covered by _invalidateValidatedChildren, or return None
+        # if the result should not be cached.  When the recorded order of
+        # content influences generation the result is not cached, since the
+        # list returned by orderedContent may be changed by the caller.
+        import pyxb.binding.content
+        vc = self._validationConfig
+        if (vc.ALWAYS == vc.contentInfluencesGeneration) or ((self._CT_MIXED == self._ContentTypeTag) and (vc.MIXED_ONLY == vc.contentInfluencesGeneration)):
+            return None
+        plurals = []
+        for ed in six.itervalues(self._ElementMap):
+            if ed.isPlural():
+                values = ed.value(self)
+                if not isinstance(values, pyxb.binding.content._PluralBinding):
+                    return None
+                plurals.append((ed, values, values._mutationCount()))
+        wce = self.__wildcardElements
+        if wce is not None:
+            wce = tuple(wce)
+        return (vc, tuple(plurals), wce)
+
+    def __validatedChildrenCacheValid (self, state):
+        (vc, plurals, wce) = state
+        if vc is not self._validationConfig:
+            return False
+        if (vc.ALWAYS == vc.contentInfluencesGeneration) or ((self._CT_MIXED == self._ContentTypeTag) and (vc.MIXED_ONLY == vc.contentInfluencesGeneration)):
+            return False
+        for (ed, values, mutations) in plurals:
+            current = ed.value(self)
+            if (current is not values) or (current._mutationCount() != mutations):
+                return False
+        if wce is not None:
+            current = self.__wildcardElements
+            if len(current) != len(wce):
+                return False
+            for (v1, v2) in zip(current, wce):
+                if v1 is not v2:
+                    return False
+        return True
 
     def _symbolSet (self):
         """Return a map from L{content.ElementDeclaration} instances to a list of
@@ -2227,9 +2576,9 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             rv[None] = wce[:]
         return rv
 
-    def _validateAttributes (self):
+    def _validateAttributes (self, convert_deferred=True):
         for au in six.itervalues(self._AttributeMap):
-            au.validate(self)
+            au.validate(self, convert_deferred=convert_deferred)
 
     def _validateBinding_vx (self):
         if self._isNil():
@@ -2249,12 +2598,14 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         self._validateAttributes()
         return True
 
-    def _setAttribute (self, attr_en, value_lex):
+    def _setAttribute (self, attr_en, value_lex, _defer_conversion=False):
         au = self._AttributeMap.get(attr_en)
         if au is None:
             if self._AttributeWildcard is None:
                 raise pyxb.UnrecognizedAttributeError(type(self), attr_en, self)
             self.__wildcardAttributeMap[attr_en] = value_lex
+        elif _defer_conversion:
+            au.setLexical(self, value_lex)
         else:
             au.set(self, value_lex, from_xml=True)
         return au
@@ -2410,6 +2761,166 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         self._resetAutomaton()
         return self
 
+    @classmethod
+    def __UseForId (cls, use_id):
+        # Per-class map from the id of each attribute and element use to the
+        # use, for restoring pickled instances.
+        use_map = cls.__dict__.get('_complexTypeDefinition__UseMap')
+        if use_map is None:
+            use_map = dict((_u.id(), _u) for _u in six.itervalues(cls._ElementMap))
+            use_map.update((_u.id(), _u) for _u in six.itervalues(cls._AttributeMap))
+            cls.__UseMap = use_map
+        return use_map[use_id]
+
+    # Keys of the instance dictionary of simple type values that hold state
+    # from the creation of the value, which is not pickled.
+    __TransientSimpleKeys = frozenset(['_Locatable_mixin__location', '_TypeBinding_mixin__namespaceContext'])
+
+    @classmethod
+    def __PickleValue (cls, value, value_map):
+        # Simple type instances are stored as the reduction of the value
+        # without its transient state; DOM nodes as serialized XML.  The
+        # same object is used for each appearance of a value, so its identity
+        # is preserved.
+        if not isinstance(value, (simpleTypeDefinition, xml.dom.Node)):
+            return value
+        rv = value_map.get(id(value))
+        if rv is not None:
+            return rv
+        if isinstance(value, xml.dom.Node):
+            bds = domutils.BindingDOMSupport()
+            bds.appendChild(value, bds.document())
+            rv = bds.finalize().toxml('utf-8')
+        else:
+            reduction = value.__reduce_ex__(2)
+            state = None
+            if (2 < len(reduction)) and reduction[2]:
+                state = dict((_k, _v) for (_k, _v) in six.iteritems(reduction[2]) if _k not in cls.__TransientSimpleKeys)
+            items = None
+            if (3 < len(reduction)) and (reduction[3] is not None):
+                items = list(reduction[3])
+            rv = (reduction[0], reduction[1], state, items)
+        value_map[id(value)] = rv
+        return rv
+
+    @classmethod
+    def __UnpickleValue (cls, value, value_map, is_wildcard=False):
+        if is_wildcard and (type(value) is six.binary_type):
+            rv = value_map.get(id(value))
+            if rv is None:
+                rv = value_map[id(value)] = domutils.StringToDOM(value).documentElement
+            return rv
+        if type(value) is not tuple:
+            return value
+        rv = value_map.get(id(value))
+        if rv is None:
+            (factory, args, state, items) = value
+            rv = value_map[id(value)] = factory(*args)
+            if state is not None:
+                rv.__dict__.update(state)
+            if items is not None:
+                rv.extend(items)
+        return rv
+
+    def __reduce__ (self):
+        """Pickling support.
+
+        The pickled state holds only the element and nil status of the
+        instance, the values of its provided attributes and its elements,
+        its content in order, and its wildcard attributes and elements.  The
+        namespace context and location of the instance and of the simple
+        type values it holds are not preserved.  The content model state is
+        not pickled either; it is rebuilt from the content when the instance
+        is restored, so further content is appended where it would have been
+        in the original instance.
+
+        Wildcard elements that are DOM nodes are stored as serialized XML."""
+        from pyxb.utils.six.moves import copyreg
+        value_map = {}
+        attributes = []
+        for au in six.itervalues(self._AttributeMap):
+            if au.prohibited() or not au.provided(self):
+                continue
+            attributes.append((au.id(), self.__PickleValue(au.value(self), value_map)))
+        elements = []
+        for ed in six.itervalues(self._ElementMap):
+            value = ed.value(self)
+            if ed.isPlural():
+                if 0 == len(value):
+                    continue
+                value = [ self.__PickleValue(_v, value_map) for _v in value ]
+            elif value is None:
+                continue
+            else:
+                value = self.__PickleValue(value, value_map)
+            elements.append((ed.id(), value))
+        content = self.__content
+        if self._CT_SIMPLE == self._ContentTypeTag:
+            content = self.__PickleValue(self.value(), value_map)
+        elif content is not None:
+            content = []
+            for c in self.__content:
+                if isinstance(c, NonElementContent):
+                    content.append(c.value)
+                    continue
+                ed = c.elementDeclaration
+                content.append(((ed is not None) and ed.id() or None, self.__PickleValue(c.value, value_map)))
+        wildcard_attributes = self.__wildcardAttributeMap
+        if wildcard_attributes:
+            wildcard_attributes = [ (_n.uriTuple(), _v) for (_n, _v) in six.iteritems(wildcard_attributes) ]
+        wildcard_elements = self.__wildcardElements
+        if wildcard_elements:
+            wildcard_elements = [ self.__PickleValue(_v, value_map) for _v in wildcard_elements ]
+        state = (self._element(), self._isNil(), attributes, elements, content, wildcard_attributes, wildcard_elements)
+        return (copyreg.__newobj__, (type(self),), state)
+
+    def __setstate__ (self, state):
+        (element, is_nil, attributes, elements, content, wildcard_attributes, wildcard_elements) = state
+        value_map = {}
+        args = ()
+        if (self._CT_SIMPLE == self._ContentTypeTag) and (content is not None):
+            args = (self.__UnpickleValue(content, value_map),)
+        self.__init__(*args, _element=element, _nil=bool(is_nil))
+        for (use_id, value) in attributes:
+            self.__UseForId(use_id).set(self, self.__UnpickleValue(value, value_map))
+        for (use_id, value) in elements:
+            ed = self.__UseForId(use_id)
+            if ed.isPlural():
+                value = [ self.__UnpickleValue(_v, value_map) for _v in value ]
+            else:
+                value = self.__UnpickleValue(value, value_map)
+            ed._setRestoredValue(self, value)
+        if (self._CT_SIMPLE != self._ContentTypeTag) and (content is not None):
+            restored = []
+            for c in content:
+                if isinstance(c, six.string_types):
+                    restored.append(NonElementContent(c))
+                    continue
+                (use_id, value) = c
+                if use_id is None:
+                    restored.append(ElementContent(self.__UnpickleValue(value, value_map, is_wildcard=True)))
+                else:
+                    restored.append(ElementContent(self.__UnpickleValue(value, value_map), self.__UseForId(use_id)))
+            self.__setContent(restored)
+            if self.__automatonConfiguration is not None:
+                self.__automatonConfiguration.replay(restored)
+        if wildcard_attributes:
+            self.__wildcardAttributeMap.update((pyxb.namespace.ExpandedName(_n), _v) for (_n, _v) in wildcard_attributes)
+        if wildcard_elements:
+            self.__wildcardElements.extend(self.__UnpickleValue(_v, value_map, is_wildcard=True) for _v in wildcard_elements)
+
+    def __copy__ (self):
+        rv = type(self).__new__(type(self))
+        rv.__dict__.update(self.__dict__)
+        return rv
+
+    def __deepcopy__ (self, memo):
+        import copy
+        rv = type(self).__new__(type(self))
+        memo[id(self)] = rv
+        rv.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return rv
+
     @classmethod
     def _ElementBindingDeclForName (cls, element_name):
         """Determine what the given name means as an element in this type.
@@ -2599,6 +3110,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         return self
 
     def __setContent (self, value):
+        self.__validatedChildrenCache = None
         self.__content = value
         return self.__content
 
@@ -2608,6 +3120,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         #assert self._IsMixed() or (not self._performValidation()) or isinstance(child, _TypeBinding_mixin) or isinstance(child, six.string_types), 'Unrecognized child %s type %s' % (child, type(child))
         assert not (self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE))
         assert isinstance(wrapped_value, _Content)
+        self.__validatedChildrenCache = None
         self.__content.append(wrapped_value)
         if isinstance(wrapped_value, ElementContent):
             value = wrapped_value.value
@@ -2616,6 +3129,49 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                 assert isinstance(ed.elementBinding(), element)
                 value._setElement(ed.elementBinding())
 
+    def _detachElementContent (self, value):
+        """Remove element content from this instance without changing the
+        state of its content model.
+
+        This is used by L{pyxb.binding.saxer.iterparse} to release a completed
+        child element once it has been handed to the caller.  The automaton
+        configuration retains the effect of having accepted the value, so
+        subsequent content continues to be validated.  The instance itself
+        will no longer validate as a whole, since the detached value is no
+        longer present.
+
+        @param value: The binding instance to be removed, identified by object
+        identity.
+
+        @return: C{True} iff the value was found and removed.  A value that
+        has not yet been stored because the content model has not resolved a
+        nondeterminism will not be found.
+        """
+        content = self.__content
+        if not content:
+            return False
+        for ci in six.moves.xrange(len(content) - 1, -1, -1):
+            wrapped_value = content[ci]
+            if isinstance(wrapped_value, ElementContent) and (wrapped_value.value is value):
+                break
+        else:
+            return False
+        del content[ci]
+        self.__validatedChildrenCache = None
+        ed = wrapped_value.elementDeclaration
+        if ed is None:
+            values = self.__wildcardElements
+        elif ed.isPlural():
+            values = ed.value(self)
+        else:
+            ed.reset(self)
+            return True
+        for vi in six.moves.xrange(len(values) - 1, -1, -1):
+            if values[vi] is value:
+                del values[vi]
+                break
+        return True
+
     @classmethod
     def _IsMixed (cls):
         return (cls._CT_MIXED == cls._ContentTypeTag)
@@ -2635,7 +3191,9 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                     if self._IsSimpleTypeContent():
                         raise pyxb.SimpleContentAbsentError(self, self._location())
                     self.__automatonConfiguration.diagnoseIncompleteContent()
-            self._validateAttributes()
+            # Attribute values with deferred conversion are checked when
+            # they are used.
+            self._validateAttributes(convert_deferred=False)
         return self
 
     def _setDOMFromAttributes (self, dom_support, element):
@@ -2651,37 +3209,104 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     def _toDOM_csc (self, dom_support, parent):
         """Create a DOM element with the given tag holding the content of this instance."""
+        if not (self._isNil() or self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE)):
+            for _ in self.__generateDOMContent(dom_support, parent, False):
+                pass
+            return dom_support
         element = parent
         self._setDOMFromAttributes(dom_support, element)
-        if self._isNil():
-            pass
-        elif self._CT_EMPTY == self._ContentTypeTag:
-            pass
-        elif self._CT_SIMPLE == self._ContentTypeTag:
+        if (self._CT_SIMPLE == self._ContentTypeTag) and not self._isNil():
             if self.__content is None:
                 raise pyxb.SimpleContentAbsentError(self, self._location())
             dom_support.appendTextChild(self.value(), element)
-        else:
-            if pyxb.GlobalValidationConfig.forDocument:
+        return getattr(super(complexTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+
+    def _toDOM_csc_iter (self, dom_support, parent):
+        if self._isNil() or not (self._ContentTypeTag in (self._CT_MIXED, self._CT_ELEMENT_ONLY)):
+            self._toDOM_csc(dom_support, parent)
+            return iter(())
+        return self.__generateDOMContent(dom_support, parent, True)
+
+    def __generateDOMContent (self, dom_support, parent, incremental):
+        """Add the attributes and the mixed or element-only content of this
+        instance to the DOM element, yielding after each child element.
+
+        @param incremental: If C{True}, child elements are themselves
+        generated incrementally; otherwise each child is added at once."""
+        element = parent
+        self._setDOMFromAttributes(dom_support, element)
+        for content in self._orderedChildrenForGeneration():
+            assert id(content.value) != id(self)
+            if isinstance(content, NonElementContent):
+                dom_support.appendTextChild(content.value, element)
+                continue
+            if content.elementDeclaration is None:
+                if isinstance(content.value, xml.dom.Node):
+                    dom_support.appendChild(content.value, element)
+                elif incremental:
+                    for _ in content.value._toDOM_iter(dom_support, parent):
+                        yield _
+                else:
+                    content.value.toDOM(dom_support, parent)
+            elif incremental:
+                for _ in content.elementDeclaration._toDOM_iter(dom_support, parent, content.value):
+                    yield _
+            else:
+                content.elementDeclaration.toDOM(dom_support, parent, content.value)
+            yield content
+        getattr(super(complexTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+
+    def _orderedChildrenForGeneration (self):
+        """The element and non-element content in the order in which it is
+        placed in a generated document.
+
+        @return: A list of L{ElementContent} and L{NonElementContent}
+        instances.
+        """
+        if pyxb.GlobalValidationConfig.forDocument:
+            order = None
+            if self._ElementSequence is not None:
+                order = self.__sequencedChildren()
+            if order is None:
                 order = self._validatedChildren()
+        else:
+            order = self.__childrenForDOM()
+        return order
+
+    def __sequencedChildren (self):
+        """Provide the child elements in the order required by
+        L{_ElementSequence}.
+
+        This is equivalent to L{_validatedChildren} for instances with
+        content that satisfies the model, without replaying the automaton.
+
+        @return: C{None} if the content does not satisfy the model or the
+        order is influenced by the content, in which case
+        L{_validatedChildren} should be used.  Otherwise a list as described
+        there.
+        """
+        if self._CT_ELEMENT_ONLY != self._ContentTypeTag:
+            return None
+        vc = self._validationConfig
+        if vc.ALWAYS == vc.contentInfluencesGeneration:
+            return None
+        if self.__wildcardElements or (len(self._ElementSequence) != len(self._ElementMap)):
+            return None
+        order = []
+        for (ed, min_occurs, max_occurs) in self._ElementSequence:
+            value = ed.value(self)
+            if value is None:
+                values = ()
+            elif ed.isPlural():
+                values = value
             else:
-                order = self.__childrenForDOM()
-            for content in order:
-                assert id(content.value) != id(self)
-                if isinstance(content, NonElementContent):
-                    dom_support.appendTextChild(content.value, element)
-                    continue
-                if content.elementDeclaration is None:
-                    if isinstance(content.value, xml.dom.Node):
-                        dom_support.appendChild(content.value, element)
-                    else:
-                        content.value.toDOM(dom_support, parent)
-                else:
-                    content.elementDeclaration.toDOM(dom_support, parent, content.value)
-            mixed_content = self.orderedContent()
-            for mc in mixed_content:
-                pass
-        return getattr(super(complexTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+                values = (value,)
+            if (len(values) < min_occurs) or ((max_occurs is not None) and (len(values) > max_occurs)):
+                return None
+            if values:
+                converter = ed.elementBinding().compatibleValue
+                order.extend([ ElementContent(converter(_v), ed) for _v in values ])
+        return order
 
     @classmethod
     def _IsSimpleTypeContent (cls):
@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+# Copyright 2009-2013, Peter A. Bigot
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain a
+# copy of the License at:
+#
+#            http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""This module contains support for a compact, schema-informed binary
+representation of binding instances.
+
+The representation relies on the generated bindings to supply the
+information that XML text repeats in every document.  An element that
+appears in the content of a complex type is identified by its position in
+the table of element uses of that type, and an attribute by its position in
+the table of attribute uses, so neither requires its name.  Simple type
+values are held in a form determined by their datatype: integers as
+variable-length integers, floating point values as IEEE doubles, dateTime
+values as their fields, and so on.  Everything else falls back to the
+lexical representation.
+
+The content is decoded through the same interfaces used when parsing a
+document, so the resulting binding is validated as it is constructed.  An
+instance that is encoded and then decoded with the same bindings produces
+the same document as the original.
+
+An example of its use is::
+
+  import pyxb.binding.binary
+
+  data = pyxb.binding.binary.encode(instance)
+  instance = pyxb.binding.binary.decode(data)
+
+The representation is only meaningful to a decoder that has the bindings
+used by the encoder; it is not a substitute for XML as an interchange
+format.
+"""
+
+import logging
+import datetime
+import struct
+import xml.dom
+import pyxb
+import pyxb.namespace
+import pyxb.utils.domutils
+import pyxb.utils.utility
+from pyxb.utils import six
+from pyxb.binding import basis
+from pyxb.binding import datatypes
+
+_log = logging.getLogger(__name__)
+
+# Leading bytes of every encoded instance: an identifier and the format
+# version.
+_Signature = six.b('PyXB\x01')
+
+# Flags following the introduction of an element
+_Flag_nil = 0x01
+_Flag_type = 0x02
+
+# Event codes in the content of a complex type.  Element uses are
+# identified by _Event_elementUse plus their position in the table of
+# element uses.
+_Event_end = 0
+_Event_text = 1
+_Event_wildcardElement = 2
+_Event_wildcardNode = 3
+_Event_substitutedElement = 4
+_Event_elementUse = 5
+
+# Codes for the representation of a simple type value.
+_Value_lexical = 0
+_Value_boolean = 1
+_Value_integer = 2
+_Value_double = 3
+_Value_text = 4
+_Value_bytes = 5
+_Value_dateTime = 6
+_Value_qname = 7
+_Value_list = 8
+
+_Double = struct.Struct('>d')
+
+def _ValueCode (std):
+    """Return the code for the representation of values of the simple type
+    C{std}."""
+    if issubclass(std, basis.STD_list):
+        return _Value_list
+    if issubclass(std, basis.STD_union):
+        return _Value_lexical
+    if issubclass(std, datatypes.boolean):
+        return _Value_boolean
+    if issubclass(std, six.integer_types):
+        return _Value_integer
+    if issubclass(std, six.float_type):
+        return _Value_double
+    if issubclass(std, six.text_type):
+        return _Value_text
+    if issubclass(std, six.binary_type):
+        return _Value_bytes
+    if issubclass(std, datatypes.dateTime):
+        return _Value_dateTime
+    if issubclass(std, datatypes.QName):
+        return _Value_qname
+    return _Value_lexical
+
+class _TypeTables (object):
+    """The tables that identify the element and attribute uses of a complex
+    type definition by position.
+
+    Uses are ordered by name, so the tables are the same for every process
+    that uses the same bindings."""
+
+    __Tables = {}
+
+    @classmethod
+    def _NameKey (cls, expanded_name):
+        return (expanded_name.namespaceURI() or '', expanded_name.localName())
+
+    @classmethod
+    def ForType (cls, ctd):
+        rv = cls.__Tables.get(ctd)
+        if rv is None:
+            rv = cls.__Tables[ctd] = cls(ctd)
+        return rv
+
+    def __init__ (self, ctd):
+        self.elementUses = sorted(six.itervalues(ctd._ElementMap), key=lambda _ed: self._NameKey(_ed.name()))
+        self.elementIndex = dict([ (_ed, _i) for (_i, _ed) in enumerate(self.elementUses) ])
+        self.attributeUses = sorted(six.itervalues(ctd._AttributeMap), key=lambda _au: self._NameKey(_au.name()))
+
+class _Encoder (object):
+    """Encode a binding instance into the binary representation."""
+
+    def __init__ (self):
+        self.__data = bytearray(_Signature)
+        self.__names = {}
+        self.__valueCodes = {}
+
+    def data (self):
+        return bytes(self.__data)
+
+    def __unsigned (self, value):
+        data = self.__data
+        while 0x80 <= value:
+            data.append(0x80 | (value & 0x7f))
+            value >>= 7
+        data.append(value)
+
+    def __signed (self, value):
+        if 0 > value:
+            self.__unsigned(((-value) << 1) - 1)
+        else:
+            self.__unsigned(value << 1)
+
+    def __bytes (self, value):
+        self.__unsigned(len(value))
+        self.__data.extend(value)
+
+    def __text (self, value):
+        self.__bytes(value.encode('utf-8'))
+
+    def __name (self, expanded_name):
+        # Names are recorded on first use and referenced by position
+        # thereafter.
+        ns = expanded_name.namespace()
+        if (ns is None) or ns.isAbsentNamespace():
+            key = (None, expanded_name.localName())
+        else:
+            key = (ns.uri(), expanded_name.localName())
+        index = self.__names.get(key)
+        if index is not None:
+            self.__unsigned(index + 1)
+            return
+        self.__names[key] = len(self.__names)
+        self.__unsigned(0)
+        if key[0] is None:
+            self.__data.append(0)
+        else:
+            self.__data.append(1)
+            self.__text(key[0])
+        self.__text(key[1])
+
+    def value (self, std, value):
+        code = self.__valueCodes.get(std)
+        if code is None:
+            code = self.__valueCodes[std] = _ValueCode(std)
+        if _Value_integer == code:
+            self.__signed(value)
+        elif _Value_text == code:
+            self.__text(value)
+        elif _Value_boolean == code:
+            self.__data.append(1 if value else 0)
+        elif _Value_double == code:
+            self.__data.extend(_Double.pack(value))
+        elif _Value_bytes == code:
+            self.__bytes(value)
+        elif _Value_dateTime == code:
+            for fv in (value.month, value.day, value.hour, value.minute, value.second, value.microsecond):
+                self.__unsigned(fv)
+            self.__signed(value.year)
+            offset = value.utcoffset()
+            if offset is None:
+                self.__data.append(0)
+            else:
+                self.__data.append(1)
+                self.__signed(offset.days * 1440 + offset.seconds // 60)
+        elif _Value_qname == code:
+            self.__name(value)
+        elif _Value_list == code:
+            self.__unsigned(len(value))
+            for item in value:
+                self.value(std._ItemType, item)
+        else:
+            if isinstance(value, basis.simpleTypeDefinition):
+                value = value.xsdLiteral()
+            self.__text(six.text_type(value))
+
+    def __attributes (self, instance, tables):
+        for (index, au) in enumerate(tables.attributeUses):
+            if au.prohibited() or not au.provided(instance):
+                continue
+            value = au.value(instance)
+            if value is None:
+                continue
+            self.__unsigned(index + 1)
+            self.value(au.dataType(), value)
+        wam = instance.wildcardAttributeMap()
+        if wam:
+            for (name, value) in six.iteritems(wam):
+                self.__unsigned(len(tables.attributeUses) + 1)
+                self.__name(name)
+                self.__text(six.text_type(value))
+        self.__unsigned(0)
+
+    def __node (self, node):
+        bds = pyxb.utils.domutils.BindingDOMSupport()
+        bds.appendChild(node, bds.document())
+        self.__bytes(bds.finalize().toxml('utf-8'))
+
+    def __content (self, instance, tables):
+        for content in instance._orderedChildrenForGeneration():
+            if isinstance(content, basis.NonElementContent):
+                self.__unsigned(_Event_text)
+                self.__text(content.value)
+                continue
+            value = content.value
+            ed = content.elementDeclaration
+            if ed is None:
+                if isinstance(value, xml.dom.Node):
+                    if xml.dom.Node.ELEMENT_NODE != value.nodeType:
+                        continue
+                    self.__unsigned(_Event_wildcardNode)
+                    self.__node(value)
+                    continue
+                element_binding = value._element()
+                if element_binding is None:
+                    raise pyxb.UnboundElementError(value)
+                self.__unsigned(_Event_wildcardElement)
+                self.__name(element_binding.name())
+                self.element(element_binding, value)
+                continue
+            element_binding = ed.elementBinding()
+            if isinstance(value, basis._TypeBinding_mixin) and (value._element() is not None) and (value._element() is not element_binding):
+                # A member of the substitution group of the declared element
+                element_binding = value._element()
+                self.__unsigned(_Event_substitutedElement)
+                self.__unsigned(tables.elementIndex[ed])
+                self.__name(element_binding.name())
+            else:
+                self.__unsigned(_Event_elementUse + tables.elementIndex[ed])
+            self.element(element_binding, value)
+        self.__unsigned(_Event_end)
+
+    def element (self, element_binding, instance):
+        """Encode an element with the given binding holding the given
+        instance."""
+        type_class = type(instance)
+        flags = 0
+        if instance._isNil():
+            flags |= _Flag_nil
+        declared_type = None
+        if element_binding is not None:
+            declared_type = element_binding.typeDefinition()
+        if (type_class is not declared_type) and (type_class._ExpandedName is not None):
+            flags |= _Flag_type
+        self.__data.append(flags)
+        if flags & _Flag_type:
+            self.__name(type_class._ExpandedName)
+        elif declared_type is not None:
+            type_class = declared_type
+        if not issubclass(type_class, basis.complexTypeDefinition):
+            if not instance._isNil():
+                self.value(type_class, instance)
+            return
+        tables = _TypeTables.ForType(type_class)
+        self.__attributes(instance, tables)
+        if instance._isNil():
+            return
+        if type_class._CT_SIMPLE == type_class._ContentTypeTag:
+            self.value(type_class._TypeDefinition, instance.value())
+        elif type_class._CT_EMPTY != type_class._ContentTypeTag:
+            self.__content(instance, tables)
+
+    def document (self, instance, element_name=None):
+        if element_name is None:
+            element_binding = instance._element()
+            if element_binding is None:
+                raise pyxb.UnboundElementError(instance)
+            element_name = element_binding.name()
+        else:
+            element_name = pyxb.namespace.ExpandedName(element_name)
+            element_binding = element_name.elementBinding()
+        self.__name(element_name)
+        self.element(element_binding, instance)
+        return self
+
+class _Decoder (object):
+    """Create a binding instance from its binary representation."""
+
+    def __init__ (self, data, default_namespace):
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
+        if data[:len(_Signature)] != _Signature:
+            raise pyxb.BadDocumentError('Data is not a binary-encoded binding instance')
+        self.__data = data
+        self.__position = len(_Signature)
+        self.__defaultNamespace = default_namespace
+        self.__names = []
+        self.__valueCodes = {}
+
+    def __byte (self):
+        try:
+            rv = self.__data[self.__position]
+        except IndexError:
+            raise pyxb.BadDocumentError('Binary-encoded binding instance is truncated')
+        self.__position += 1
+        return rv
+
+    def __unsigned (self):
+        rv = 0
+        shift = 0
+        while True:
+            octet = self.__byte()
+            rv |= (octet & 0x7f) << shift
+            if not (octet & 0x80):
+                return rv
+            shift += 7
+
+    def __signed (self):
+        value = self.__unsigned()
+        if value & 1:
+            return -((value + 1) >> 1)
+        return value >> 1
+
+    def __bytes (self):
+        length = self.__unsigned()
+        end = self.__position + length
+        if end > len(self.__data):
+            raise pyxb.BadDocumentError('Binary-encoded binding instance is truncated')
+        rv = bytes(self.__data[self.__position:end])
+        self.__position = end
+        return rv
+
+    def __text (self):
+        return self.__bytes().decode('utf-8')
+
+    def __name (self):
+        index = self.__unsigned()
+        if 0 < index:
+            try:
+                return self.__names[index - 1]
+            except IndexError:
+                raise pyxb.BadDocumentError('Invalid name reference %d' % (index,))
+        uri = None
+        if self.__byte():
+            uri = self.__text()
+        local = self.__text()
+        if uri is not None:
+            rv = pyxb.namespace.ExpandedName(uri, local)
+        elif self.__defaultNamespace is not None:
+            rv = pyxb.namespace.ExpandedName(self.__defaultNamespace, local)
+        else:
+            rv = pyxb.namespace.ExpandedName(local)
+        self.__names.append(rv)
+        return rv
+
+    def value (self, std):
+        """Decode a value of the simple type C{std}.
+
+        @return: A pair C{(args, kw)} that, passed to the factory for
+        C{std} or for a complex type with simple content of that type,
+        creates the value.
+        """
+        code = self.__valueCodes.get(std)
+        if code is None:
+            code = self.__valueCodes[std] = _ValueCode(std)
+        if _Value_integer == code:
+            return ((self.__signed(),), {})
+        if _Value_text == code:
+            return ((self.__text(),), {})
+        if _Value_boolean == code:
+            return ((bool(self.__byte()),), {})
+        if _Value_double == code:
+            end = self.__position + _Double.size
+            if end > len(self.__data):
+                raise pyxb.BadDocumentError('Binary-encoded binding instance is truncated')
+            value = _Double.unpack(bytes(self.__data[self.__position:end]))[0]
+            self.__position = end
+            return ((value,), {})
+        if _Value_bytes == code:
+            return ((self.__bytes(),), {})
+        if _Value_dateTime == code:
+            fields = [ self.__unsigned() for _ in range(6) ]
+            year = self.__signed()
+            tzinfo = None
+            if self.__byte():
+                tzinfo = pyxb.utils.utility.UTCOffsetTimeZone.Shared(self.__signed())
+            return ((datetime.datetime(year, *fields, tzinfo=tzinfo),), {})
+        if _Value_qname == code:
+            return ((self.__name(),), {})
+        if _Value_list == code:
+            item_type = std._ItemType
+            items = []
+            for _ in range(self.__unsigned()):
+                (args, kw) = self.value(item_type)
+                items.append(item_type.Factory(*args, **kw))
+            return ((items,), {})
+        return ((self.__text(),), { '_from_xml' : True })
+
+    def __attributes (self, tables):
+        attributes = []
+        wildcard_code = len(tables.attributeUses) + 1
+        while True:
+            code = self.__unsigned()
+            if 0 == code:
+                return attributes
+            if wildcard_code == code:
+                attributes.append((self.__name(), self.__text()))
+                continue
+            try:
+                au = tables.attributeUses[code - 1]
+            except IndexError:
+                raise pyxb.BadDocumentError('Invalid attribute code %d' % (code,))
+            data_type = au.dataType()
+            (args, kw) = self.value(data_type)
+            attributes.append((au, data_type.Factory(*args, **kw)))
+
+    def __content (self, instance, tables):
+        while True:
+            code = self.__unsigned()
+            if _Event_end == code:
+                return
+            if _Event_text == code:
+                instance.append(self.__text(), _maybe_element=False)
+                continue
+            if _Event_wildcardNode == code:
+                node = pyxb.utils.domutils.StringToDOM(self.__bytes()).documentElement
+                instance.append(node)
+                continue
+            if _Event_wildcardElement == code:
+                element_binding = self.__name().elementBinding()
+                if element_binding is None:
+                    raise pyxb.BadDocumentError('No binding for wildcard element')
+                instance.append(self.element(element_binding))
+                continue
+            if _Event_substitutedElement == code:
+                ed = self.__elementUse(tables, self.__unsigned())
+                element_binding = self.__name().elementBinding()
+                if element_binding is None:
+                    raise pyxb.BadDocumentError('No binding for substituted element')
+            else:
+                ed = self.__elementUse(tables, code - _Event_elementUse)
+                element_binding = ed.elementBinding()
+            instance.append(self.element(element_binding), _element_decl=ed)
+
+    def __elementUse (self, tables, index):
+        if (0 > index) or (index >= len(tables.elementUses)):
+            raise pyxb.BadDocumentError('Invalid element use %d' % (index,))
+        return tables.elementUses[index]
+
+    def element (self, element_binding):
+        """Decode the binding instance for an element with the given
+        binding."""
+        flags = self.__byte()
+        type_class = element_binding.typeDefinition()
+        factory = element_binding
+        if flags & _Flag_type:
+            type_class = self.__name().typeBinding()
+            factory = type_class.Factory
+        kw = {}
+        if flags & _Flag_nil:
+            kw['_nil'] = True
+        if not issubclass(type_class, basis.complexTypeDefinition):
+            args = ()
+            if not (flags & _Flag_nil):
+                (args, value_kw) = self.value(type_class)
+                kw.update(value_kw)
+            instance = factory(*args, **kw)
+        else:
+            tables = _TypeTables.ForType(type_class)
+            attributes = self.__attributes(tables)
+            args = ()
+            if (not (flags & _Flag_nil)) and (type_class._CT_SIMPLE == type_class._ContentTypeTag):
+                (args, value_kw) = self.value(type_class._TypeDefinition)
+                kw.update(value_kw)
+            instance = factory(*args, **kw)
+            for (au, value) in attributes:
+                if isinstance(au, pyxb.namespace.ExpandedName):
+                    instance._setAttribute(au, value)
+                else:
+                    au.set(instance, value)
+            if (not (flags & _Flag_nil)) and (type_class._ContentTypeTag in (type_class._CT_MIXED, type_class._CT_ELEMENT_ONLY)):
+                self.__content(instance, tables)
+        if instance._element() is None:
+            instance._setElement(element_binding)
+        return instance._postDOMValidate()
+
+    def document (self):
+        element_binding = self.__name().elementBinding()
+        if element_binding is None:
+            raise pyxb.BadDocumentError('No binding for document element')
+        instance = self.element(element_binding)
+        if self.__position != len(self.__data):
+            raise pyxb.BadDocumentError('Unexpected data following binary-encoded binding instance')
+        return instance
+
+def encode (instance, element_name=None):
+    """Encode a binding instance in the binary representation.
+
+    @param instance: The binding instance for the document element.
+
+    @keyword element_name: As for L{toxml
+    <pyxb.binding.basis._TypeBinding_mixin.toxml>}.  The element must have
+    a binding in the namespace of its name.
+
+    @return: The representation, as bytes.
+    @raise pyxb.UnboundElementError: the instance has no element and no
+    C{element_name} was provided.
+    """
+    return _Encoder().document(instance, element_name).data()
+
+def decode (data, default_namespace=None):
+    """Create a binding instance from its binary representation.
+
+    @param data: The representation, as produced by L{encode}.
+    @type data: C{bytes} or C{bytearray}
+
+    @keyword default_namespace: The namespace used for element and type
+    names that were not in a namespace when encoded.  Use the namespace of
+    bindings generated from a schema without a target namespace.
+    @type default_namespace: L{pyxb.namespace.Namespace}
+
+    @return: The binding instance for the document element.
+    @raise pyxb.BadDocumentError: the data is not a valid representation,
+    or uses an element or type for which no binding is available.
+    @raise pyxb.ValidationError: the decoded content does not satisfy the
+    bindings.
+    """
+    return _Decoder(data, default_namespace).document()
@@ -46,7 +46,10 @@ class AttributeUse (pyxb.cscRoot):
     provided externally, and C{value} is an instance of the attribute
     datatype.  The C{provided} flag is used to determine whether an XML
     attribute should be added to a created DOM node when generating the XML
-    corresponding to a binding instance.
+    corresponding to a binding instance.  When conversion of a value from a
+    parsed document has been deferred (see
+    L{pyxb.ValidationConfig.deferAttributeConversion}) the value is stored
+    as a triple C{(True, None, lexical)} until it is first retrieved.
     """
 
     __name = None
@@ -196,10 +199,25 @@ class AttributeUse (pyxb.cscRoot):
         C{value} is C{None} or an instance of the attribute's datatype.
 
         """
-        return getattr(ctd_instance, self.__key, (False, None))
+        rv = getattr(ctd_instance, self.__key, (False, None))
+        if 3 == len(rv):
+            rv = (True, self.__convertDeferred(ctd_instance, rv[2]))
+        return rv
+
+    def __convertDeferred (self, ctd_instance, value_lex):
+        # QName values are resolved relative to the context in which the
+        # attribute appeared.
+        ns_ctx = ctd_instance._namespaceContext()
+        if ns_ctx is not None:
+            pyxb.namespace.NamespaceContext.PushContext(ns_ctx)
+        try:
+            return self.set(ctd_instance, value_lex, from_xml=True)
+        finally:
+            if ns_ctx is not None:
+                pyxb.namespace.NamespaceContext.PopContext()
 
     def __getProvided (self, ctd_instance):
-        return self.__getValue(ctd_instance)[0]
+        return getattr(ctd_instance, self.__key, (False, None))[0]
 
     def value (self, ctd_instance):
         """Get the value of the attribute from the instance."""
@@ -222,7 +240,7 @@ class AttributeUse (pyxb.cscRoot):
             dom_support.addAttribute(element, self.__name, value)
         return self
 
-    def validate (self, ctd_instance):
+    def validate (self, ctd_instance, convert_deferred=True):
         """Validate the instance against the requirements imposed by this
         attribute use.
 
@@ -231,12 +249,18 @@ class AttributeUse (pyxb.cscRoot):
 
         @param ctd_instance : An instance of a complex type definition.
 
+        @keyword convert_deferred : If C{False}, a value for which conversion
+        has been deferred is not converted or checked.  By default it is
+        converted.
+
         @raise pyxb.ProhibitedAttributeError: when instance has attribute but must not
         @raise pyxb.MissingAttributeError: when instance lacks attribute but
         must have it (including when a required fixed-value attribute is
         missing).
         @raise pyxb.BatchContentValidationError: when instance has attribute but its value is not acceptable
         """
+        if (not convert_deferred) and (3 == len(getattr(ctd_instance, self.__key, (False, None)))):
+            return
         (provided, value) = self.__getValue(ctd_instance)
         if value is not None:
             if self.__prohibited:
@@ -281,6 +305,19 @@ class AttributeUse (pyxb.cscRoot):
         self.__setValue(ctd_instance, new_value, provided)
         return new_value
 
+    def setLexical (self, ctd_instance, value_lex):
+        """Record the lexical value of the attribute from a parsed document,
+        deferring its conversion to the attribute datatype until it is first
+        retrieved.
+
+        @param ctd_instance: The binding instance for which the attribute
+        value is to be set
+        @param value_lex: The value of the attribute in the document
+        """
+        if self.__prohibited:
+            raise pyxb.ProhibitedAttributeError(type(ctd_instance), self.__name, ctd_instance)
+        setattr(ctd_instance, self.__key, (True, None, value_lex))
+
     def _description (self, name_only=False, user_documentation=True):
         if name_only:
             return six.text_type(self.__name)
@@ -353,7 +390,7 @@ class AutomatonConfiguration (object):
             return 1
         return len(self.__multi)
 
-    def step (self, value, element_decl):
+    def step (self, value, element_decl, store=True):
         """Attempt a transition from the current state.
 
         @param value: the content to be supplied.  For success the value must
@@ -364,26 +401,68 @@ class AutomatonConfiguration (object):
         L{pyxb.binding.content.ElementDeclaration} that is the preferred
         symbol for the transition.
 
+        @keyword store: If C{False}, the value is already held by the
+        instance, and only the automaton state is updated.
+
         @return: the cardinal number of successful transitions from the
         current configuration based on the parameters."""
 
+        # A compiled automaton has a precomputed map from element declaration
+        # to the unique transition consuming it.  When the content is
+        # identified by its declaration, as it is when parsing, the transition
+        # can be found directly.
+        automaton = self.__instance._Automaton
+        if (element_decl is not None) and (self.__multi is None) and automaton.isCompiled:
+            transition = self.__cfg.tableTransition(element_decl)
+            if transition is None:
+                return 0
+            self.__cfg = transition.apply(self.__cfg)
+            if store:
+                element_decl.setOrAppend(self.__instance, value)
+            return 1
+
         sym = (value, element_decl)
 
-        # Start with the current configuration(s), assuming we might see
-        # non-determinism.
-        new_multi = []
+        # The states that match a binding instance with a known element
+        # declaration depend only on that declaration and, for wildcards, on
+        # the namespace of the instance.  This allows candidate transitions
+        # to be cached if the automaton supports it.  The key is built only
+        # when a cache is enabled, since this is the per-element path.
+        symbol_key = None
+        if (automaton.transitionCache is not None) and (element_decl is not None) and isinstance(value, basis._TypeBinding_mixin):
+            symbol_key = (element_decl, value._element(), type(value))
+
         if self.__multi is None:
-            multi = [ (self.__cfg, ()) ]
+            cand = self.__cfg.candidateTransitions(sym, symbol_key)
+            if 1 >= len(cand):
+                if 0 == len(cand):
+                    return 0
+                # Deterministic transition from a deterministic state.  The
+                # current configuration is not needed for anything else, so
+                # the transition is applied to it in place and the content
+                # stored immediately.
+                transition = cand[0]
+                self.__cfg = transition.apply(self.__cfg)
+                if store:
+                    transition.consumedSymbol().consume(self.__instance, sym)
+                return 1
+            multi = [ (self.__cfg, (), cand) ]
         else:
-            multi = self.__multi[:]
-        # Collect the complete set of reachable configurations along with the
-        # closures that will update the instance content based on the path.
-        for (cfg, pending) in multi:
-            cand = cfg.candidateTransitions(sym)
+            multi = [ (_cfg, _pending, _cfg.candidateTransitions(sym, symbol_key)) for (_cfg, _pending) in self.__multi ]
+
+        # Non-determinism is present or is about to appear.  Collect the
+        # complete set of reachable configurations along with the closures
+        # that will update the instance content based on the path.
+        new_multi = []
+        for (cfg, pending, cand) in multi:
             for transition in cand:
                 clone_map = {}
                 ccfg = cfg.clone(clone_map)
-                new_multi.append( (transition.apply(ccfg, clone_map), pending+(transition.consumedSymbol().consumingClosure(sym),)) )
+                if store:
+                    actions = pending+(transition.consumedSymbol().consumingClosure(sym),)
+                else:
+                    actions = pending
+                new_multi.append( (transition.apply(ccfg, clone_map), actions) )
         rv = len(new_multi)
         if 0 == rv:
             # No candidate transitions.  Do not change the state.
@@ -403,6 +482,29 @@ class AutomatonConfiguration (object):
             self.__multi = new_multi
         return rv
 
+    def replay (self, content):
+        """Bring the automaton to the state reached by content that the
+        instance already holds.
+
+        This is used for instances restored from a pickle, which does not
+        include the automaton state.  Each element of C{content} is supplied
+        to L{step} without being stored in the instance again.
+
+        @param content: a sequence of L{pyxb.binding.basis.ElementContent}
+        and L{pyxb.binding.basis.NonElementContent} instances, in order.
+
+        @return: C{True} iff all the element content was accepted.  If it
+        was not (e.g. the content was assigned out of order), the automaton
+        is left in its initial state."""
+        self.reset()
+        for c in content:
+            if isinstance(c, basis.NonElementContent):
+                continue
+            if 0 == self.step(c.value, c.elementDeclaration, store=False):
+                self.reset()
+                return False
+        return True
+
     def resolveNondeterminism (self, prefer_accepting=True):
         """Resolve any non-determinism in the automaton state.
 
@@ -686,6 +788,14 @@ class _FACSymbol (pyxb.utils.fac.SymbolMatch_mixin):
         appropriate slot."""
         raise NotImplementedError('%s._consumingClosure' % (type(self).__name__,))
 
+    def consume (self, instance, sym):
+        """Store the value from C{sym} into C{instance}.
+
+        This has the same effect as invoking the result of
+        L{consumingClosure}, and is used when the transition is known to be
+        taken so there is no need to defer the update."""
+        raise NotImplementedError('%s.consume' % (type(self).__name__,))
+
     def __init__ (self, xsd_location):
         """@param xsd_location: the L{location<pyxb.utils.utility.Location>} of the element use or wildcard declaration."""
         self.__xsdLocation = xsd_location
@@ -734,6 +844,9 @@ class ElementUse (_FACSymbol):
         # the closure is applied.
         return lambda _inst,_eu=self,_sy=sym: _eu.__elementDeclaration.setOrAppend(_inst, _eu.matchValue(_sy))
 
+    def consume (self, instance, sym):
+        self.__elementDeclaration.setOrAppend(instance, self.matchValue(sym))
+
     def match (self, symbol):
         """Satisfy L{pyxb.utils.fac.SymbolMatch_mixin}.
 
@@ -775,6 +888,9 @@ class WildcardUse (_FACSymbol):
         """Create a closure that will apply the value accepted by L{match} to a to-be-supplied instance."""
         return lambda _inst,_av=self.matchValue(sym): _inst._appendWildcardElement(_av)
 
+    def consume (self, instance, sym):
+        instance._appendWildcardElement(self.matchValue(sym))
+
     def match (self, symbol):
         """Satisfy L{pyxb.utils.fac.SymbolMatch_mixin}.
 
@@ -814,6 +930,14 @@ class _PluralBinding (collections.MutableSequence):
     __list = None
     __elementBinding = None
 
+    # The number of operations that have changed the list, used to detect
+    # changes since an ordering of element content was computed.
+    __mutations = 0
+
+    def _mutationCount (self):
+        """The number of times the content of this list has been changed."""
+        return self.__mutations
+
     def __init__ (self, *args, **kw):
         element_binding = kw.pop('element_binding', None)
         if not isinstance(element_binding, basis.element):
@@ -832,12 +956,14 @@ class _PluralBinding (collections.MutableSequence):
         return self.__list.__getitem__(key)
 
     def __setitem__ (self, key, value):
+        self.__mutations += 1
         if isinstance(key, slice):
             self.__list.__setitem__(key, [ self.__convert(_v) for _v in value])
         else:
             self.__list.__setitem__(key, self.__convert(value))
 
     def __delitem__ (self, key):
+        self.__mutations += 1
         self.__list.__delitem__(key)
 
     def __iter__ (self):
@@ -851,9 +977,11 @@ class _PluralBinding (collections.MutableSequence):
 
     # The mutable sequence type methods
     def append (self, x):
+        self.__mutations += 1
         self.__list.append(self.__convert(x))
 
     def extend (self, x):
+        self.__mutations += 1
         self.__list.extend(map(self.__convert, x))
 
     def count (self, x):
@@ -863,18 +991,23 @@ class _PluralBinding (collections.MutableSequence):
         return self.__list.index(x, i, j)
 
     def insert (self, i, x):
+        self.__mutations += 1
         self.__list.insert(i, self.__convert(x))
 
     def pop (self, i=-1):
+        self.__mutations += 1
         return self.__list.pop(i)
 
     def remove (self, x):
+        self.__mutations += 1
         self.__list.remove(x)
 
     def reverse (self):
+        self.__mutations += 1
         self.__list.reverse()
 
     def sort (self, key=None, reverse=False):
+        self.__mutations += 1
         self.__list.sort(key=key, reverse=reverse)
 
     def __str__ (self):
@@ -1030,6 +1163,7 @@ class ElementDeclaration (object):
     def reset (self, ctd_instance):
         """Set the value for this use in the given element to its default."""
         setattr(ctd_instance, self.__key, self.resetValue())
+        ctd_instance._invalidateValidatedChildren()
         return self
 
     def set (self, ctd_instance, value):
@@ -1045,6 +1179,16 @@ class ElementDeclaration (object):
         ctd_instance._addContent(basis.ElementContent(value, self))
         return self
 
+    def _setRestoredValue (self, ctd_instance, value):
+        """Set the value of this element in an instance restored from a
+        pickle.  The value was taken from an instance of the same type, so it
+        is not validated, and it is not added to the instance content.  For
+        plural elements the value is a list."""
+        if self.isPlural():
+            value = _PluralBinding(*value, element_binding=self.__elementBinding)
+        setattr(ctd_instance, self.__key, value)
+        return self
+
     def setOrAppend (self, ctd_instance, value):
         """Invoke either L{set} or L{append}, depending on whether the element
         use is plural."""
@@ -1081,33 +1225,52 @@ class ElementDeclaration (object):
         @raise pyxb.AbstractElementError: the binding to be used is abstract
         """
         if isinstance(value, basis._TypeBinding_mixin):
-            element_binding = self.__elementBinding
-            if value._substitutesFor(element_binding):
-                element_binding = value._element()
-            assert element_binding is not None
-            if element_binding.abstract():
-                raise pyxb.AbstractElementError(self, value)
-            element = dom_support.createChildElement(element_binding.name(), parent)
-            elt_type = element_binding.typeDefinition()
-            val_type = type(value)
-            if isinstance(value, basis.complexTypeDefinition):
-                if not (isinstance(value, elt_type) or elt_type._RequireXSIType(val_type)):
-                    raise pyxb.LogicError('toDOM with implicit value type %s unrecoverable from %s' % (type(value), elt_type))
-            else:
-                if isinstance(value, basis.STD_union) and isinstance(value, elt_type._MemberTypes):
-                    val_type = elt_type
-            if dom_support.requireXSIType() or elt_type._RequireXSIType(val_type):
-                dom_support.addAttribute(element, pyxb.namespace.XMLSchema_instance.createExpandedName('type'), value._ExpandedName)
+            element = self.__createDOMElement(dom_support, parent, value)
             value._toDOM_csc(dom_support, element)
         elif isinstance(value, six.string_types):
             element = dom_support.createChildElement(self.name(), parent)
-            element.appendChild(dom_support.document().createTextNode(value))
+            dom_support.appendTextChild(value, element)
         elif isinstance(value, _PluralBinding):
             for v in value:
                 self.toDOM(dom_support, parent, v)
         else:
             raise pyxb.LogicError('toDOM with unrecognized value type %s: %s' % (type(value), value))
 
+    def _toDOM_iter (self, dom_support, parent, value):
+        """Generator equivalent of L{toDOM}.
+
+        See L{pyxb.binding.basis._TypeBinding_mixin._toDOM_iter}."""
+        if isinstance(value, basis._TypeBinding_mixin):
+            element = self.__createDOMElement(dom_support, parent, value)
+            for _ in value._toDOM_csc_iter(dom_support, element):
+                yield _
+        elif isinstance(value, _PluralBinding):
+            for v in value:
+                for _ in self._toDOM_iter(dom_support, parent, v):
+                    yield _
+        else:
+            self.toDOM(dom_support, parent, value)
+
+    def __createDOMElement (self, dom_support, parent, value):
+        element_binding = self.__elementBinding
+        if value._substitutesFor(element_binding):
+            element_binding = value._element()
+        assert element_binding is not None
+        if element_binding.abstract():
+            raise pyxb.AbstractElementError(self, value)
+        element = dom_support.createChildElement(element_binding.name(), parent)
+        elt_type = element_binding.typeDefinition()
+        val_type = type(value)
+        if isinstance(value, basis.complexTypeDefinition):
+            if not (isinstance(value, elt_type) or elt_type._RequireXSIType(val_type)):
+                raise pyxb.LogicError('toDOM with implicit value type %s unrecoverable from %s' % (type(value), elt_type))
+        else:
+            if isinstance(value, basis.STD_union) and isinstance(value, elt_type._MemberTypes):
+                val_type = elt_type
+        if dom_support.requireXSIType() or elt_type._RequireXSIType(val_type):
+            dom_support.addAttribute(element, pyxb.namespace.XMLSchema_instance.createExpandedName('type'), value._ExpandedName)
+        return element
+
     def _description (self, name_only=False, user_documentation=True):
         if name_only:
             return six.text_type(self.__name)
@@ -390,8 +390,9 @@ class _PyXBDateTime_base (basis.simpleTypeDefinition, basis._RepresentAsXsdLiter
     # Fields extracted by parsing that have an integer value
     __LexicalIntegerFields = ( 'year', 'month', 'day', 'hour', 'minute', 'second' )
 
-    _UTCTimeZone = pyxb.utils.utility.UTCOffsetTimeZone(0)
-    """A L{datetime.tzinfo} instance representing UTC."""
+    _UTCTimeZone = pyxb.utils.utility.UTCOffsetTimeZone.Shared(0)
+    """A L{datetime.tzinfo} instance representing UTC.  This is the shared
+    L{pyxb.utils.utility.UTCOffsetTimeZone} instance for offset zero."""
 
     _LocalTimeZone = pyxb.utils.utility.LocalTimeZone()
     """A L{datetime.tzinfo} instance representing the local time zone."""
@@ -400,8 +401,59 @@ class _PyXBDateTime_base (basis.simpleTypeDefinition, basis._RepresentAsXsdLiter
     _DefaultMonth = 1
     _DefaultDay = 1
 
+    @classmethod
+    def _FastLexicalToKeywords (cls, text):
+        """Extract the keywords from the common lexical forms of a value
+        without the general regular expression.
+
+        Subclasses override this to handle values with fixed-width fields
+        (four-digit years), optional fractional seconds, and an optional
+        time zone.
+
+        @return: The keywords as L{_LexicalToKeywords} would produce them,
+        or C{None} if the text is not in a form handled by this method.
+        """
+        return None
+
+    @classmethod
+    def _FastTailToKeywords (cls, text, start, kw, with_fraction=True):
+        """Update C{kw} with the fractional seconds and time zone that
+        follow the fixed-width fields of C{text} at C{start}.
+
+        @return: C{kw}, or C{None} if the text does not end in this form.
+        """
+        tail = text[start:]
+        if not tail:
+            return kw
+        tz = None
+        if tail.endswith('Z'):
+            tz = 'Z'
+            tail = tail[:-1]
+        elif (6 <= len(tail)) and (tail[-6] in '+-'):
+            tz = tail[-6:]
+            if (':' != tz[3]) or not (tz[1:3] + tz[4:6]).isdigit():
+                return None
+            tail = tail[:-6]
+        if tail:
+            if (not with_fraction) or ('.' != tail[0]) or not tail[1:].isdigit():
+                return None
+            fraction = tail[1:]
+            if 6 >= len(fraction):
+                kw['microsecond'] = six.int_type(fraction + '000000'[len(fraction):])
+            else:
+                kw['microsecond'] = six.int_type(round(1000000 * six.float_type('0%s' % (tail,))))
+        if tz is not None:
+            kw['tzinfo'] = pyxb.utils.utility.UTCOffsetTimeZone.Shared(tz)
+        return kw
+
     @classmethod
     def _LexicalToKeywords (cls, text):
+        try:
+            kw = cls._FastLexicalToKeywords(text)
+        except ValueError:
+            kw = None
+        if kw is not None:
+            return kw
         lexical_re = cls.__LexicalREMap.get(cls)
         if lexical_re is None:
             pattern = '^' + cls._Lexical_fmt + '%Z?$'
@@ -425,7 +477,7 @@ class _PyXBDateTime_base (basis.simpleTypeDefinition, basis._RepresentAsXsdLiter
             # Discard any bogosity passed in by the caller
             kw.pop('microsecond', None)
         if match_map.get('tzinfo') is not None:
-            kw['tzinfo'] = pyxb.utils.utility.UTCOffsetTimeZone(match_map['tzinfo'])
+            kw['tzinfo'] = pyxb.utils.utility.UTCOffsetTimeZone.Shared(match_map['tzinfo'])
         else:
             kw.pop('tzinfo', None)
         return kw
@@ -446,6 +498,11 @@ class _PyXBDateTime_base (basis.simpleTypeDefinition, basis._RepresentAsXsdLiter
     def __reduce__ (self):
         return (self.__class__, (self.xsdLiteral(),))
 
+    # Python 3 datetime classes define __reduce_ex__, which pickle prefers
+    # to __reduce__.
+    def __reduce_ex__ (self, protocol):
+        return self.__reduce__()
+
     @classmethod
     def _AdjustForTimezone (cls, kw):
         """Update datetime keywords to account for timezone effects.
@@ -510,6 +567,17 @@ class dateTime (_PyXBDateTime_base, datetime.datetime):
     _Lexical_fmt = '%Y-%m-%dT%H:%M:%S'
     __CtorFields = ( 'year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond', 'tzinfo' )
 
+    @classmethod
+    def _FastLexicalToKeywords (cls, text):
+        if (19 > len(text)) or ('-' != text[4]) or ('-' != text[7]) or ('T' != text[10]) or (':' != text[13]) or (':' != text[16]):
+            return None
+        (year, month, day, hour, minute, second) = (text[0:4], text[5:7], text[8:10], text[11:13], text[14:16], text[17:19])
+        if not (year + month + day + hour + minute + second).isdigit():
+            return None
+        kw = { 'year': six.int_type(year), 'month': six.int_type(month), 'day': six.int_type(day),
+               'hour': six.int_type(hour), 'minute': six.int_type(minute), 'second': six.int_type(second) }
+        return cls._FastTailToKeywords(text, 19, kw)
+
     def __new__ (cls, *args, **kw):
         args = cls._ConvertArguments(args, kw)
 
@@ -587,6 +655,16 @@ class time (_PyXBDateTime_base, datetime.time):
     _Lexical_fmt = '%H:%M:%S'
     __CtorFields = ( 'hour', 'minute', 'second', 'microsecond', 'tzinfo' )
 
+    @classmethod
+    def _FastLexicalToKeywords (cls, text):
+        if (8 > len(text)) or (':' != text[2]) or (':' != text[5]):
+            return None
+        (hour, minute, second) = (text[0:2], text[3:5], text[6:8])
+        if not (hour + minute + second).isdigit():
+            return None
+        kw = { 'hour': six.int_type(hour), 'minute': six.int_type(minute), 'second': six.int_type(second) }
+        return cls._FastTailToKeywords(text, 8, kw)
+
     def __new__ (cls, *args, **kw):
         args = cls._ConvertArguments(args, kw)
         ctor_kw = { }
@@ -702,6 +780,16 @@ class date (_PyXBDateOnly_base):
     _Lexical_fmt = '%Y-%m-%d'
     _Fields = ( 'year', 'month', 'day' )
 
+    @classmethod
+    def _FastLexicalToKeywords (cls, text):
+        if (10 > len(text)) or ('-' != text[4]) or ('-' != text[7]):
+            return None
+        (year, month, day) = (text[0:4], text[5:7], text[8:10])
+        if not (year + month + day).isdigit():
+            return None
+        kw = { 'year': six.int_type(year), 'month': six.int_type(month), 'day': six.int_type(day) }
+        return cls._FastTailToKeywords(text, 10, kw, with_fraction=False)
+
     __SecondsPerMinute = 60
     __MinutesPerHalfDay = 12 * 60
     __MinutesPerDay = 24 * 60
@@ -722,7 +810,7 @@ class date (_PyXBDateOnly_base):
         utc_offset = (sdt - self).seconds // self.__SecondsPerMinute
         if utc_offset > self.__MinutesPerHalfDay:
             utc_offset -= self.__MinutesPerDay
-        return pyxb.utils.utility.UTCOffsetTimeZone(utc_offset)
+        return pyxb.utils.utility.UTCOffsetTimeZone.Shared(utc_offset)
 
     @classmethod
     def XsdLiteral (cls, value):
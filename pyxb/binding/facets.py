@@ -594,12 +594,54 @@ class CF_enumeration (ConstrainingFacet, _CollectionFacet_mixin, _LateDatatype_m
             rv = rv.value()
         return rv
 
+    # A tuple (count, permitted, value_type, unhashable) used to validate
+    # values without comparing against each element.  count is the number of
+    # elements when the tuple was built; permitted is a frozenset of the
+    # element values; value_type is the type of those values if they all have
+    # the same type, otherwise None; and unhashable is a list of the elements
+    # with values (e.g. lists) that cannot be hashed.
+    __valueIndex = None
+
+    def __getValueIndex (self):
+        # Elements may be added through _setFromKeywords_vb as well as
+        # addEnumeration, and are never removed, so the index is rebuilt
+        # whenever the number of elements changes.
+        items = self._items()
+        index = self.__valueIndex
+        if (index is None) or (index[0] != len(items)):
+            permitted = set()
+            unhashable = []
+            for ee in items:
+                try:
+                    permitted.add(ee.value())
+                except TypeError:
+                    unhashable.append(ee)
+            types = set([ type(_v) for _v in permitted ])
+            value_type = None
+            if 1 == len(types):
+                value_type = types.pop()
+            index = self.__valueIndex = (len(items), frozenset(permitted), value_type, unhashable)
+        return index
+
     def _validateConstraint_vx (self, value):
         # If validation is inhibited, or if the facet hasn't had any
         # restrictions applied yet, return True.
         if 0 == len(self._items()):
             return True
-        for ee in six.iteritems(self):
+        (_, permitted, value_type, unhashable) = self.__getValueIndex()
+        try:
+            if value in permitted:
+                return True
+            # A value of the same type as the hashed values cannot be equal
+            # to one of them without having the same hash.  Values of other
+            # types may compare equal regardless of hash, so are compared
+            # against each element.
+            candidates = self._items()
+            if type(value) is value_type:
+                candidates = unhashable
+        except TypeError:
+            candidates = self._items()
+        for ee in candidates:
             if ee.value() == value:
                 return True
         return False
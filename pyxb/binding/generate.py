@@ -260,6 +260,73 @@ def pythonLiteral (value, **kw):
 
     raise Exception('Unexpected literal type %s' % (type(value),))
 
+def _AutomatonTableKeys (automaton):
+    """Determine whether the automaton can be compiled into transition
+    tables.
+
+    This is possible when the automaton has no sub-automata (viz., no
+    unordered catenation from an B{all} model group), every state consumes an
+    element declaration (viz., no wildcards), and from the initial
+    configuration and from each state no two transitions consume elements
+    with the same name.  Content identified by its element declaration then
+    has at most one candidate transition, which can be looked up directly.
+
+    @return: C{None} if the automaton cannot be compiled, otherwise a map from
+    each L{pyxb.utils.fac.State} to the expanded name of the element it
+    consumes.
+    """
+    if automaton.containingState is not None:
+        return None
+    keys = {}
+    for st in automaton.states:
+        if (st.subAutomata is not None) or isinstance(st.symbol, xs.structures.ModelGroup):
+            return None
+        (particle, symbol) = st.symbol
+        if not isinstance(symbol, xs.structures.ElementDeclaration):
+            return None
+        keys[st] = symbol.expandedName()
+    for destinations in [ [ _st for _st in automaton.states if _st.isInitial ] ] + [ [ _xit.destination for _xit in _st.transitionSet ] for _st in automaton.states ]:
+        names = set([ keys[_st] for _st in destinations ])
+        if len(names) != len(destinations):
+            return None
+    return keys
+
+def _ElementSequence (particle):
+    """Determine whether a content model is a plain sequence of element
+    declarations.
+
+    This is the case when the particle, and any particle for a nested model
+    group, occurs exactly once and has a B{sequence} term, and all other
+    particles have element declarations as their terms.  No element name may
+    appear more than once.  Instances of types with such content models can
+    be converted to XML by emitting the values of each element in order,
+    checking only the number of values for each.
+
+    @return: C{None} if the content model is not a plain sequence, otherwise
+    a list of C{(element declaration, minOccurs, maxOccurs)} triples in
+    sequence order.
+    """
+    if (1 != particle.minOccurs()) or (1 != particle.maxOccurs()):
+        return None
+    term = particle.term()
+    if not (isinstance(term, xs.structures.ModelGroup) and (term.C_SEQUENCE == term.compositor())):
+        return None
+    sequence = []
+    for p in term.particles():
+        if isinstance(p.term(), xs.structures.ElementDeclaration):
+            if (0 == p.maxOccurs()):
+                continue
+            sequence.append( (p.term(), p.minOccurs(), p.maxOccurs()) )
+            continue
+        nested = _ElementSequence(p)
+        if nested is None:
+            return None
+        sequence.extend(nested)
+    names = set([ _ed.expandedName() for (_ed, _, _) in sequence ])
+    if len(names) != len(sequence):
+        return None
+    return sequence
+
 def _GenerateAutomaton (automaton, template_map, containing_state, lines, **kw):
     binding_module = kw['binding_module']
     name = utility.PrepareIdentifier('BuildAutomaton', binding_module.uniqueInModule(), protected=True)
@@ -308,6 +375,10 @@ def %{name} ():
         counter_map[cc] = cc_id
         au_src.append('    %s = fac.CounterCondition(min=%s, max=%s, metadata=%r)' % (cc_id, repr2to3(cc.min), repr2to3(cc.max), cc.metadata._location()))
         au_src.append('    counters.add(%s)' % (cc_id,))
+    table_keys = _AutomatonTableKeys(automaton)
+    def tableKeyLiteral (st):
+        return templates.replaceInText('%{ctd}._UseForTag(%{field_tag})', field_tag=binding_module.literal(table_keys[st], **kw), **template_map)
+
     state_map = {}
     au_src.append('    states = []')
     sorted_states = sorted(automaton.states, key=stateSortKey)
@@ -339,12 +410,20 @@ def %{name} ():
         au_src.append('    states.append(%s)' % (st_id,))
     for st in sorted_states:
         au_src.append('    transitions = []')
-        for xit in sorted(st.transitionSet, key=transitionSortKey):
+        sorted_transitions = sorted(st.transitionSet, key=transitionSortKey)
+        for xit in sorted_transitions:
             au_src.append('    transitions.append(fac.Transition(%s, [' % (state_map[xit.destination],))
             sorted_ui = sorted(xit.updateInstructions, key=updateInstructionSortKey)
             au_src.append('        %s ]))' % (',\n        '.join(map(lambda _ui: 'fac.UpdateInstruction(%s, %r)' % (counter_map[_ui.counterCondition], _ui.doIncrement), sorted_ui))))
         au_src.append('    %s._set_transitionSet(transitions)' % (state_map[st],))
-    au_src.append('    return fac.Automaton(states, counters, %r, containing_state=%s)' % (automaton.nullable, containing_state))
+        if table_keys is not None:
+            au_src.append('    %s._set_transitionTable({%s })' % (state_map[st], ''.join([ '\n        %s : transitions[%u],' % (tableKeyLiteral(_xit.destination), _xi) for (_xi, _xit) in enumerate(sorted_transitions) ])))
+    if table_keys is None:
+        au_src.append('    return fac.Automaton(states, counters, %r, containing_state=%s)' % (automaton.nullable, containing_state))
+    else:
+        au_src.append('    automaton = fac.Automaton(states, counters, %r, containing_state=%s)' % (automaton.nullable, containing_state))
+        au_src.append('    automaton._set_initialTransitionTable({%s })' % (''.join([ '\n        %s : %s,' % (tableKeyLiteral(_st), state_map[_st]) for _st in sorted_states if _st.isInitial ]),))
+        au_src.append('    return automaton')
     lines.extend(au_src)
     return '%s()' % (name,)
 
@@ -995,6 +1074,15 @@ class %{ctd} (%{superclass}):
             outf.postscript().append(templates.replaceInText('%{ctd}._Automaton = %{automaton_ctor}\n', ctd=template_map['ctd'], automaton_ctor=automaton_ctor))
             outf.postscript().append("\n")
 
+        element_sequence = None
+        if ctd.CT_ELEMENT_ONLY == content_type_tag:
+            element_sequence = _ElementSequence(content_basis)
+        if element_sequence is not None:
+            outf.postscript().append(templates.replaceInText('%{ctd}._ElementSequence = (%{sequence} )\n', ctd=template_map['ctd'], sequence=''.join([ templates.replaceInText('\n    (%{ctd}._UseForTag(%{field_tag}), %{min}, %{max}),', field_tag=binding_module.literal(_ed.expandedName(), **kw), min=repr2to3(_min), max=repr2to3(_max), **template_map) for (_ed, _min, _max) in element_sequence ])))
+        else:
+            # Do not inherit the sequence from a base type
+            outf.postscript().append(templates.replaceInText('%{ctd}._ElementSequence = None\n', **template_map))
+
     # Create definitions for all attributes.
     attribute_uses = []
 
@@ -1598,7 +1686,7 @@ class NamespaceModule (_ModuleNaming_mixin):
     __namespaceGroupModule = None
 
     _UniqueInModule = _ModuleNaming_mixin._UniqueInModule.copy()
-    _UniqueInModule.update([ 'CreateFromDOM', 'CreateFromDocument' ])
+    _UniqueInModule.update([ 'CreateFromDOM', 'CreateFromDocument', 'CreatePushParser', 'CreateFromStream', 'CreateFromFile' ])
 
     def namespaceGroupHead (self):
         return self.__namespaceGroupHead
@@ -1690,12 +1778,15 @@ def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
     the document was obtained.
     """
 
-    if pyxb.XMLStyle_saxer != pyxb._XMLStyle:
+    if pyxb._XMLStyle not in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
         dom = pyxb.utils.domutils.StringToDOM(xml_text)
         return CreateFromDOM(dom.documentElement, default_namespace=default_namespace)
     if default_namespace is None:
         default_namespace = Namespace.fallbackNamespace()
-    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=default_namespace, location_base=location_base)
+    if pyxb.XMLStyle_expat == pyxb._XMLStyle:
+        saxer = pyxb.binding.saxer.make_expat_parser(fallback_namespace=default_namespace, location_base=location_base)
+    else:
+        saxer = pyxb.binding.saxer.make_parser(fallback_namespace=default_namespace, location_base=location_base)
     handler = saxer.getContentHandler()
     xmld = xml_text
     if isinstance(xmld, %{_TextType}):
@@ -1704,6 +1795,72 @@ def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
     instance = handler.rootObject()
     return instance
 
+def CreatePushParser (default_namespace=None, location_base=None):
+    """Create a parser to which an XML document is provided in chunks.
+
+    Pass each chunk of the document to the C{feed} method of the
+    returned parser.  The C{close} method completes processing and
+    returns the Python instance created from the document element.
+
+    @keyword default_namespace The L{pyxb.Namespace} instance to use as the
+    default namespace where there is no default namespace in scope.
+    If unspecified or C{None}, the namespace of the module containing
+    this function will be used.
+
+    @keyword location_base: An object to be recorded as the base of all
+    L{pyxb.utils.utility.Location} instances associated with events and
+    objects handled by the parser.
+
+    @rtype: L{pyxb.binding.saxer.PushParser}
+    """
+    if default_namespace is None:
+        default_namespace = Namespace.fallbackNamespace()
+    return pyxb.binding.saxer.PushParser(fallback_namespace=default_namespace, location_base=location_base)
+
+def CreateFromStream (stream, default_namespace=None, location_base=None, read_size=None):
+    """Parse the XML read from the given file-like object and use the
+    document element to create a Python instance.
+
+    The document is passed to the parser in chunks as it is read,
+    rather than being loaded into memory first.
+
+    @param stream An object with a C{read} method returning data or
+    text in the L{pyxb._InputEncoding} encoding.
+
+    @keyword default_namespace As with L{CreateFromDocument}.
+
+    @keyword location_base As with L{CreateFromDocument}.
+
+    @keyword read_size The number of bytes to read from C{stream} at a
+    time.  Defaults to L{pyxb.binding.saxer.PushParser.DefaultReadSize}.
+    """
+    if pyxb._XMLStyle not in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+        return CreateFromDocument(stream.read(), default_namespace=default_namespace, location_base=location_base)
+    return CreatePushParser(default_namespace=default_namespace, location_base=location_base).parseStream(stream, read_size=read_size)
+
+def CreateFromFile (path, default_namespace=None, location_base=None, read_size=None, use_mmap=True):
+    """Parse the XML in the named file and use the document element to
+    create a Python instance.
+
+    @param path The path to the file.
+
+    @keyword default_namespace As with L{CreateFromDocument}.
+
+    @keyword location_base As with L{CreateFromDocument}.  If
+    unspecified or C{None}, C{path} is used.
+
+    @keyword read_size As with L{CreateFromStream}.
+
+    @keyword use_mmap If C{True} (default) the file is memory-mapped
+    and passed to the parser in chunks of the mapping.
+    """
+    if location_base is None:
+        location_base = path
+    if pyxb._XMLStyle not in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+        with open(path, 'rb') as stream:
+            return CreateFromStream(stream, default_namespace=default_namespace, location_base=location_base)
+    return CreatePushParser(default_namespace=default_namespace, location_base=location_base).parseFile(path, read_size=read_size, use_mmap=use_mmap)
+
 def CreateFromDOM (node, default_namespace=None):
     """Create a Python instance from the given DOM node.
     The node tag must correspond to an element declaration in this module.
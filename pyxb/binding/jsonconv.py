@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+# Copyright 2009-2013, Peter A. Bigot
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain a
+# copy of the License at:
+#
+#            http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""This module contains support for converting binding instances to Python
+dictionaries and to JSON.
+
+The conversion walks the binding instance directly; no XML text or DOM tree
+is created.  JSON text is generated incrementally, so a large document can be
+written to a stream without holding its JSON representation in memory.
+
+The mapping is determined by the bindings, so every instance of a type is
+converted to the same structure:
+
+ - An instance of a complex type is an object.  Each attribute that has a
+   value is a member keyed by C{@} and the attribute name; wildcard
+   attributes are included the same way.
+
+ - Element content is a member keyed by the element name, in the order the
+   elements appear in the document.  The value of an element that may occur
+   more than once is always an array, even if only one value is present.
+   Elements without a value are omitted.
+
+ - Content matching a wildcard is an array under the key C{#any}.  Each
+   entry is an object with one member, keyed by the element name.
+
+ - The content of a type with simple content is the member C{#text}.
+
+ - The content of a type with mixed content is an array under the key
+   C{#content}, holding strings for the character content and single-member
+   objects for the elements, in document order.
+
+ - An instance of a type derived from the type of its element includes the
+   member C{@xsi:type} naming its type.
+
+ - A nil instance is C{None} (C{null}).
+
+Names are the local names of the elements and attributes, except where a
+name is not associated with the bindings (wildcard content and types) or
+the local name is not unique within the type, in which case names in a
+namespace use the Clark notation C{{namespace}local}.
+
+Simple values are converted to Python booleans, integers, floats,
+C{decimal.Decimal} instances and text; list types become arrays.  Values of
+other types (e.g. dates and binary data) are represented by their lexical
+form, and QNames by their Clark notation.  Wildcard content that is a DOM
+node is converted in the same style, with every child element value an
+array.
+
+An example of its use is::
+
+  import pyxb.binding.jsonconv
+
+  data = pyxb.binding.jsonconv.todict(instance)
+  with open('instance.json', 'w') as stream:
+      pyxb.binding.jsonconv.dump(instance, stream)
+"""
+
+import logging
+import decimal
+import json
+import math
+import xml.dom
+import pyxb
+import pyxb.namespace
+from pyxb.utils import six
+from pyxb.binding import basis
+from pyxb.binding import datatypes
+
+_log = logging.getLogger(__name__)
+
+def _NameKey (expanded_name, qualified=True):
+    """Return the key for a name.  If C{qualified}, names in a namespace use
+    Clark notation."""
+    uri = expanded_name.namespaceURI()
+    if qualified and (uri is not None):
+        return six.u('{%s}%s') % (uri, expanded_name.localName())
+    return expanded_name.localName()
+
+class _TypeKeys (object):
+    """The keys used for the attributes and elements of a complex type
+    definition."""
+
+    __Keys = {}
+
+    @classmethod
+    def ForType (cls, ctd):
+        rv = cls.__Keys.get(ctd)
+        if rv is None:
+            rv = cls.__Keys[ctd] = cls(ctd)
+        return rv
+
+    def __init__ (self, ctd):
+        self.elementKeys = self.__keys(six.itervalues(ctd._ElementMap))
+        self.attributes = [ (_au, six.u('@') + _k) for (_au, _k) in six.iteritems(self.__keys(six.itervalues(ctd._AttributeMap))) ]
+        self.attributes.sort(key=lambda _v: _v[1])
+
+    @classmethod
+    def __keys (cls, uses):
+        uses = list(uses)
+        counts = {}
+        for u in uses:
+            ln = u.name().localName()
+            counts[ln] = counts.get(ln, 0) + 1
+        return dict([ (_u, _NameKey(_u.name(), 1 < counts[_u.name().localName()])) for _u in uses ])
+
+def _SimpleValue (value):
+    """Return the Python value used for a simple type value."""
+    if isinstance(value, basis.STD_list):
+        return [ _SimpleValue(_v) for _v in value ]
+    if isinstance(value, (bool, datatypes.boolean)):
+        return bool(value)
+    if isinstance(value, six.integer_types):
+        return int(value)
+    if isinstance(value, float):
+        if math.isinf(value) or math.isnan(value):
+            return datatypes.double.XsdLiteral(value)
+        return float(value)
+    if isinstance(value, decimal.Decimal):
+        return decimal.Decimal(value)
+    if isinstance(value, pyxb.namespace.ExpandedName):
+        return _NameKey(value)
+    if isinstance(value, six.text_type):
+        return six.text_type(value)
+    if isinstance(value, basis.simpleTypeDefinition):
+        return value.xsdLiteral()
+    return value
+
+def _IsNil (value):
+    return isinstance(value, basis._TypeBinding_mixin) and value._isNil()
+
+def _WildcardEntry (value):
+    if isinstance(value, xml.dom.Node):
+        return (_NameKey(pyxb.namespace.ExpandedName(value)), value)
+    element_binding = value._element()
+    if element_binding is None:
+        raise pyxb.UnboundElementError(value)
+    return (_NameKey(element_binding.name()), value)
+
+def _ElementKey (keys, ed, value):
+    # A member of the substitution group of the declared element uses its
+    # own name.
+    element_binding = isinstance(value, basis._TypeBinding_mixin) and value._element()
+    if element_binding and (element_binding is not ed.elementBinding()):
+        return _NameKey(element_binding.name(), False)
+    return keys.elementKeys[ed]
+
+def _ComplexMembers (instance):
+    """Generate the key and value of each member of the object for the
+    complex type instance.
+
+    A value is a binding instance, DOM node, or text; a list of these; or a
+    C{(key, value)} tuple denoting a single-member object."""
+    type_class = type(instance)
+    keys = _TypeKeys.ForType(type_class)
+    element_binding = instance._element()
+    if (element_binding is not None) and (element_binding.typeDefinition() is not type_class) and (type_class._ExpandedName is not None):
+        yield (six.u('@xsi:type'), _NameKey(type_class._ExpandedName))
+    for (au, key) in keys.attributes:
+        if au.prohibited() or not au.provided(instance):
+            continue
+        value = au.value(instance)
+        if value is not None:
+            yield (key, value)
+    wam = instance.wildcardAttributeMap()
+    if wam:
+        for (name, value) in sorted(six.iteritems(wam), key=lambda _v: _NameKey(_v[0])):
+            yield (six.u('@') + _NameKey(name), value)
+    content_type = type_class._ContentTypeTag
+    if type_class._CT_SIMPLE == content_type:
+        yield (six.u('#text'), instance.value())
+    elif type_class._CT_MIXED == content_type:
+        content = []
+        for c in instance._orderedChildrenForGeneration():
+            if isinstance(c, basis.NonElementContent):
+                content.append(c.value)
+            elif c.elementDeclaration is None:
+                content.append(_WildcardEntry(c.value))
+            else:
+                content.append((_ElementKey(keys, c.elementDeclaration, c.value), c.value))
+        yield (six.u('#content'), content)
+    elif type_class._CT_ELEMENT_ONLY == content_type:
+        order = []
+        groups = {}
+        wildcards = []
+        for c in instance._orderedChildrenForGeneration():
+            ed = c.elementDeclaration
+            if ed is None:
+                if isinstance(c.value, xml.dom.Node) and (xml.dom.Node.ELEMENT_NODE != c.value.nodeType):
+                    continue
+                wildcards.append(_WildcardEntry(c.value))
+                continue
+            key = _ElementKey(keys, ed, c.value)
+            group = groups.get(key)
+            if group is None:
+                order.append(key)
+                group = groups[key] = (ed.isPlural(), [])
+            group[1].append(c.value)
+        for key in order:
+            (is_plural, values) = groups[key]
+            yield (key, values if is_plural else values[0])
+        if wildcards:
+            yield (six.u('#any'), wildcards)
+
+def _NodeMembers (node):
+    """Generate the key and value of each member of the object for a DOM
+    element node, as for L{_ComplexMembers}."""
+    attrs = node.attributes
+    xmlns_uri = pyxb.namespace.XMLNamespaces.uri()
+    for ai in six.moves.xrange(attrs.length):
+        attr = attrs.item(ai)
+        if attr.namespaceURI == xmlns_uri:
+            continue
+        yield (six.u('@') + _NameKey(pyxb.namespace.ExpandedName(attr)), attr.value)
+    text = []
+    order = []
+    groups = {}
+    for child in node.childNodes:
+        if child.nodeType in (xml.dom.Node.TEXT_NODE, xml.dom.Node.CDATA_SECTION_NODE):
+            text.append(child.data)
+        elif xml.dom.Node.ELEMENT_NODE == child.nodeType:
+            key = _NameKey(pyxb.namespace.ExpandedName(child))
+            group = groups.get(key)
+            if group is None:
+                order.append(key)
+                group = groups[key] = []
+            group.append(child)
+    text = six.u('').join(text)
+    if text.strip():
+        yield (six.u('#text'), text)
+    for key in order:
+        yield (key, groups[key])
+
+def _Members (value):
+    if isinstance(value, xml.dom.Node):
+        return _NodeMembers(value)
+    return _ComplexMembers(value)
+
+def _IsObject (value):
+    return isinstance(value, (basis.complexTypeDefinition, xml.dom.Node))
+
+def _ToPython (value):
+    if type(value) is tuple:
+        return { value[0]: _ToPython(value[1]) }
+    if type(value) is list:
+        return [ _ToPython(_v) for _v in value ]
+    if _IsNil(value):
+        return None
+    if _IsObject(value):
+        return dict([ (_k, _ToPython(_v)) for (_k, _v) in _Members(value) ])
+    return _SimpleValue(value)
+
+def _ScalarAsJSON (value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, six.integer_types):
+        return six.text_type(value)
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, decimal.Decimal):
+        return six.text_type(value)
+    if isinstance(value, list):
+        return six.u('[%s]') % (six.u(',').join([ _ScalarAsJSON(_v) for _v in value ]),)
+    return json.dumps(six.text_type(value))
+
+def _IterJSON (value):
+    if type(value) is tuple:
+        yield six.u('{%s:') % (json.dumps(value[0]),)
+        for chunk in _IterJSON(value[1]):
+            yield chunk
+        yield six.u('}')
+    elif type(value) is list:
+        separator = six.u('[')
+        for v in value:
+            yield separator
+            separator = six.u(',')
+            for chunk in _IterJSON(v):
+                yield chunk
+        yield six.u(']') if (0 < len(value)) else six.u('[]')
+    elif _IsNil(value):
+        yield six.u('null')
+    elif _IsObject(value):
+        separator = six.u('{')
+        for (key, v) in _Members(value):
+            yield six.u('%s%s:') % (separator, json.dumps(key))
+            separator = six.u(',')
+            for chunk in _IterJSON(v):
+                yield chunk
+        yield six.u('}') if (six.u(',') == separator) else six.u('{}')
+    else:
+        yield _ScalarAsJSON(_SimpleValue(value))
+
+def _RootKey (instance, element_name):
+    if element_name is None:
+        element_binding = instance._element()
+        if element_binding is None:
+            raise pyxb.UnboundElementError(instance)
+        element_name = element_binding.name()
+    return _NameKey(pyxb.namespace.ExpandedName(element_name), False)
+
+def todict (instance, with_root=False, element_name=None):
+    """Convert a binding instance to Python values.
+
+    @param instance: A binding instance.
+
+    @keyword with_root: If C{True}, the return value is a dictionary with a
+    single member, keyed by the name of the element of the instance.
+
+    @keyword element_name: The name to use as the key when C{with_root} is
+    C{True}, as for L{toxml<pyxb.binding.basis._TypeBinding_mixin.toxml>}.
+
+    @return: A dictionary for an instance of a complex type; for an instance
+    of a simple type, the value as described in the module documentation.
+    @raise pyxb.UnboundElementError: wildcard content, or the instance when
+    C{with_root} is C{True} and no C{element_name} is provided, has no
+    element.
+    """
+    rv = _ToPython(instance)
+    if with_root:
+        rv = { _RootKey(instance, element_name): rv }
+    return rv
+
+def iterjson (instance, with_root=False, element_name=None):
+    """Generate the JSON representation of a binding instance.
+
+    The text is generated as the instance is walked; concatenating the
+    generated strings produces the JSON text for the value L{todict} returns
+    for the same arguments.  Non-ASCII characters are escaped, so the text
+    can be written in any encoding.
+
+    @return: An iterator of text strings.
+    """
+    if with_root:
+        return _IterJSON((_RootKey(instance, element_name), instance))
+    return _IterJSON(instance)
+
+def dump (instance, stream, with_root=False, element_name=None, buffer_size=65536):
+    """Write the JSON representation of a binding instance to a stream.
+
+    @param stream: The destination, which must accept text strings.
+
+    @keyword buffer_size: The approximate number of characters accumulated
+    before each write to C{stream}.
+    """
+    pending = []
+    pending_size = 0
+    for chunk in iterjson(instance, with_root=with_root, element_name=element_name):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= buffer_size:
+            stream.write(six.u('').join(pending))
+            pending = []
+            pending_size = 0
+    if pending:
+        stream.write(six.u('').join(pending))
+
+def dumps (instance, with_root=False, element_name=None):
+    """Return the JSON representation of a binding instance as a text
+    string."""
+    return six.u('').join(iterjson(instance, with_root=with_root, element_name=element_name))
@@ -17,11 +17,18 @@
 using a SAX parser."""
 
 import logging
+import io
+import mmap
 import xml.dom
+import xml.sax
+import xml.sax.xmlreader
+import xml.parsers.expat
 import pyxb.namespace
 import pyxb.utils.saxutils
 import pyxb.utils.saxdom
 import pyxb.utils.utility
+from pyxb.utils import six
+from pyxb.utils.six.moves import cPickle as pickle
 from pyxb.binding import basis
 from pyxb.namespace.builtin import XMLSchema_instance as XSI
 
@@ -114,8 +121,8 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         if content is None:
             content = []
         self.__bindingInstance = new_object_factory(*content, **kw)
-        if isinstance(self.__bindingInstance, pyxb.utils.utility.Locatable_mixin):
-            self.__bindingInstance._setLocation(self.location())
+        if (kw['_location'] is not None) and isinstance(self.__bindingInstance, pyxb.utils.utility.Locatable_mixin):
+            self.__bindingInstance._setLocation(kw['_location'])
 
         # Record the namespace context so users of the binding can
         # interpret QNames within the attributes and content.
@@ -125,6 +132,7 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         # NB: attrs implements the SAX AttributesNS interface, meaning
         # that names are pairs of (namespaceURI, localName), just like we
         # want them to be.
+        defer_conversion = self.__bindingInstance._validationConfig.deferAttributeConversion
         for attr_name in self.__attributes.getNames():
             attr_en = pyxb.namespace.ExpandedName(attr_name)
             # Ignore xmlns and xsi attributes; we've already handled those
@@ -132,7 +140,7 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
                 continue
             # The binding instance may be a simple type that does not support
             # attributes; the following raises an exception in that case.
-            self.__bindingInstance._setAttribute(attr_en, attrs.getValue(attr_name))
+            self.__bindingInstance._setAttribute(attr_en, attrs.getValue(attr_name), _defer_conversion=defer_conversion)
 
         return self.__bindingInstance
 
@@ -209,6 +217,35 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
                 pyxb.namespace.NamespaceContext.PopContext()
         return self.__bindingInstance
 
+    def bindingInstance (self):
+        """The binding instance being created for this element.
+
+        This is C{None} for elements with simple content until the end of the
+        element has been reached."""
+        return self.__bindingInstance
+
+    def flushContent (self):
+        """Supply the content accumulated so far to the binding instance.
+
+        Normally content is held until the end of the element, then appended
+        to the binding instance (and so checked against its content model) in
+        document order.  This does the same thing immediately, so that a
+        child binding can be detached while its parent is still being
+        constructed.  It must only be invoked on elements with complex
+        content.
+
+        @return: C{self}
+        """
+        assert self.__delayedConstructor is None
+        content = self.content()
+        for info in content:
+            self.__bindingInstance.append(info.item,
+                                          _element_decl=info.element_decl,
+                                          _maybe_element=info.maybe_element,
+                                          _location=info.location)
+        del content[:]
+        return self
+
     def endBindingElement (self):
         """Perform any end-of-element processing.
 
@@ -231,11 +268,7 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
             finally:
                 pyxb.namespace.NamespaceContext.PopContext()
         else:
-            for info in self.content():
-                self.__bindingInstance.append(info.item,
-                                              _element_decl=info.element_decl,
-                                              _maybe_element=info.maybe_element,
-                                              _location=info.location)
+            self.flushContent()
         parent_state = self.parentState()
         if parent_state is not None:
             parent_state.addElementContent(self.location(), self.__bindingInstance, self.__elementDecl)
@@ -270,6 +303,113 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
     __domHandler = None
     __domDepth = None
 
+    # Element paths identifying elements to be streamed, as a map from path
+    # length to a list of tuples of (namespace URI, local name) pairs.  A
+    # namespace URI of None matches any namespace.
+    __streamPaths = None
+
+    # Element bindings identifying elements to be streamed
+    __streamBindings = None
+
+    # Completed binding instances that matched a stream target and have not
+    # yet been retrieved through takeStreamedObjects.  None unless stream
+    # targets have been set.
+    __streamedObjects = None
+
+    @classmethod
+    def __ParseStreamPath (cls, path):
+        components = []
+        for name in path.strip('/').split('/'):
+            ns_uri = None
+            if name.startswith('{'):
+                (ns_uri, name) = name[1:].split('}', 1)
+            if not name:
+                raise pyxb.UsageError('Invalid element path %s' % (path,))
+            components.append((ns_uri, name))
+        return tuple(components)
+
+    def setStreamTargets (self, targets):
+        """Identify the elements that are to be streamed to the caller.
+
+        When an element that matches a target is completed, its binding
+        instance is added to the content of its parent (so the parent's
+        content model is updated), then removed from the parent and queued
+        for retrieval through L{takeStreamedObjects}.  This allows documents
+        comprising large numbers of repeated elements to be processed without
+        holding the entire tree in memory.
+
+        @param targets: An iterable of targets, each of which is either a
+        L{basis.element} binding or a string path.  A path is a sequence of
+        element names separated by C{/}, starting with the document element.
+        Each name is a local name, which matches an element with that local
+        name in any namespace, or is a qualified name of the form
+        C{{uri}local}.  Pass C{None} to disable streaming.
+
+        @return: C{self}
+        """
+        if targets is None:
+            self.__streamPaths = None
+            self.__streamBindings = None
+            self.__streamedObjects = None
+            return self
+        self.__streamPaths = {}
+        self.__streamBindings = []
+        for target in targets:
+            if isinstance(target, basis.element):
+                self.__streamBindings.append(target)
+            elif isinstance(target, six.string_types):
+                path = self.__ParseStreamPath(target)
+                self.__streamPaths.setdefault(len(path), []).append(path)
+            else:
+                raise pyxb.UsageError('Unrecognized stream target %s' % (target,))
+        self.__streamedObjects = []
+        return self
+
+    def takeStreamedObjects (self):
+        """Return the binding instances that have been streamed since the
+        last call, in document order.
+
+        @see: L{setStreamTargets}
+        @rtype: C{list}
+        """
+        rv = self.__streamedObjects
+        if rv is None:
+            return []
+        self.__streamedObjects = []
+        return rv
+
+    def __isStreamTarget (self, this_state, binding_object):
+        element_binding = binding_object._element()
+        if element_binding is not None:
+            # A reference to a global element is bound to a distinct element
+            # within the scope of the referencing type, so match on name and
+            # type as well as identity.
+            for eb in self.__streamBindings:
+                if (eb is element_binding) or ((eb.name() == element_binding.name()) and (eb.typeDefinition() is element_binding.typeDefinition())):
+                    return True
+        names = []
+        state = this_state
+        while isinstance(state, _SAXElementState) and (state.expandedName() is not None):
+            names.append(state.expandedName())
+            state = state.parentState()
+        for path in self.__streamPaths.get(len(names), ()):
+            for ((ns_uri, local_name), en) in zip(path, reversed(names)):
+                if (local_name != en.localName()) or ((ns_uri is not None) and (ns_uri != en.namespaceURI())):
+                    break
+            else:
+                return True
+        return False
+
+    def __streamObject (self, this_state, binding_object):
+        parent_state = this_state.parentState()
+        parent_instance = parent_state.bindingInstance()
+        if isinstance(parent_instance, basis.complexTypeDefinition) and not parent_state.inDOMMode():
+            # Step the parent's content model with everything up to and
+            # including this element, then release the element.
+            parent_state.flushContent()
+            parent_instance._detachElementContent(binding_object)
+        self.__streamedObjects.append(binding_object)
+
     def rootObject (self):
         """Return the binding object corresponding to the top-most
         element in the document
@@ -294,6 +434,8 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         """
         super(PyXBSAXHandler, self).reset()
         self.__rootObject = None
+        if self.__streamedObjects is not None:
+            self.__streamedObjects = []
         return self
 
     def __init__ (self, **kw):
@@ -302,12 +444,23 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         @keyword element_state_constructor: Overridden with the value
         L{_SAXElementState} before invoking the L{superclass
         constructor<pyxb.utils.saxutils.BaseSAXHandler.__init__>}.
+
+        @keyword stream_targets: Optional targets passed to
+        L{setStreamTargets}.
         """
 
+        stream_targets = kw.pop('stream_targets', None)
         kw.setdefault('element_state_constructor', _SAXElementState)
         super(PyXBSAXHandler, self).__init__(**kw)
+        self.setStreamTargets(stream_targets)
         self.reset()
 
+    def __locateError (self, e):
+        # Without location tracking the objects involved in a validation
+        # error have no location; use the position of the parser instead.
+        if (e.location is None) and not self.tracksLocations():
+            e.location = self.currentLocation()
+
     def startElementNS (self, name, qname, attrs):
         (this_state, parent_state, ns_ctx, name_en) = super(PyXBSAXHandler, self).startElementNS(name, qname, attrs)
 
@@ -367,7 +520,11 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
 
         # Process the element start.  This may or may not return a
         # binding object.
-        binding_object = this_state.startBindingElement(type_class, new_object_factory, element_decl, attrs)
+        try:
+            binding_object = this_state.startBindingElement(type_class, new_object_factory, element_decl, attrs)
+        except pyxb.ValidationError as e:
+            self.__locateError(e)
+            raise
 
         # If the top-level element has complex content, this sets the
         # root object.  If it has simple content, see endElementNS.
@@ -385,7 +542,11 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
             # Process the element end.  This will return a binding object,
             # either the one created at the start or the one created at
             # the end.
-            binding_object = this_state.endBindingElement()
+            try:
+                binding_object = this_state.endBindingElement()
+            except pyxb.ValidationError as e:
+                self.__locateError(e)
+                raise
         assert binding_object is not None
 
         # If we don't have a root object, save it.  No, there is not a
@@ -401,6 +562,10 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         if (self.__rootObject is None) and not this_state.inDOMMode():
             self.__rootObject = binding_object
 
+        if (self.__streamedObjects is not None) and isinstance(binding_object, basis._TypeBinding_mixin):
+            if self.__isStreamTarget(this_state, binding_object):
+                self.__streamObject(this_state, binding_object)
+
 def make_parser (*args, **kw):
     """Extend L{pyxb.utils.saxutils.make_parser} to change the default
     C{content_handler_constructor} to be L{PyXBSAXHandler}.
@@ -408,6 +573,399 @@ def make_parser (*args, **kw):
     kw.setdefault('content_handler_constructor', PyXBSAXHandler)
     return pyxb.utils.saxutils.make_parser(*args, **kw)
 
+class ExpatParser (object):
+    """Drive a L{PyXBSAXHandler} directly from C{pyexpat} callbacks.
+
+    The standard SAX interface wraps each event in several layers of Python
+    code (C{xml.sax.expatreader} translates names and constructs attribute
+    objects before dispatching to the content handler).  This class installs
+    callbacks on an expat parser that split namespace-qualified names at the
+    namespace separator and invoke the handler without that intermediate
+    layer.  Character data is buffered by expat, so adjacent text is
+    delivered in a single event.
+
+    Instances support the subset of the C{xml.sax.xmlreader.IncrementalParser}
+    interface used by PyXB: L{getContentHandler}, L{parse}, L{feed}, and
+    L{close}.  The instance also serves as the document locator for the
+    handler.  Errors detected by expat are raised as
+    C{xml.sax.SAXParseException}.
+    """
+
+    # Separator placed by expat between the namespace URI and the local
+    # name of qualified element and attribute names.
+    __NamespaceSeparator = ' '
+
+    def getContentHandler (self):
+        """Return the L{PyXBSAXHandler} that receives events."""
+        return self.__contentHandler
+    __contentHandler = None
+
+    # The underlying pyexpat parser, or None if a new one must be created
+    # before the next document is processed.
+    __parser = None
+
+    # Map from expat names to (namespace URI, local name) tuples.  Documents
+    # use few distinct names, so caching avoids a split per event.
+    __nameMap = None
+
+    def __init__ (self, content_handler):
+        self.__contentHandler = content_handler
+        self.__nameMap = {}
+
+    def __createParser (self):
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=self.__NamespaceSeparator)
+        parser.buffer_text = True
+        handler = self.__contentHandler
+
+        # The callbacks are closures over local variables, since attribute
+        # lookups on self would otherwise dominate the per-event cost.
+        name_map = self.__nameMap
+        separator = self.__NamespaceSeparator
+        def name_tuple (name):
+            rv = name_map.get(name)
+            if rv is None:
+                parts = name.split(separator, 1)
+                if 1 == len(parts):
+                    rv = (None, name)
+                else:
+                    rv = tuple(parts)
+                name_map[name] = rv
+            return rv
+        attributes_constructor = xml.sax.xmlreader.AttributesNSImpl
+        start_element_ns = handler.startElementNS
+        end_element_ns = handler.endElementNS
+        def start_element (name, attrs):
+            if attrs:
+                attrs = dict([ (name_tuple(_k), _v) for (_k, _v) in six.iteritems(attrs) ])
+            start_element_ns(name_tuple(name), None, attributes_constructor(attrs, {}))
+        def end_element (name):
+            end_element_ns(name_tuple(name), None)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = handler.characters
+        parser.StartNamespaceDeclHandler = handler.startPrefixMapping
+        parser.ProcessingInstructionHandler = handler.processingInstruction
+        self.__parser = parser
+        handler.setDocumentLocator(self)
+        handler.startDocument()
+        return parser
+
+    def __invoke (self, method, *args):
+        try:
+            return method(*args)
+        except xml.parsers.expat.ExpatError as e:
+            raise xml.sax.SAXParseException(xml.parsers.expat.ErrorString(e.code), e, self)
+
+    def getLineNumber (self):
+        if self.__parser is None:
+            return 1
+        return self.__parser.CurrentLineNumber
+
+    def getColumnNumber (self):
+        if self.__parser is None:
+            return 0
+        return self.__parser.CurrentColumnNumber
+
+    def getPublicId (self):
+        return None
+
+    def getSystemId (self):
+        return None
+
+    def feed (self, data):
+        """Process another chunk of the document.
+
+        @param data: A chunk of the document as bytes."""
+        parser = self.__parser
+        if parser is None:
+            parser = self.__createParser()
+        self.__invoke(parser.Parse, data, False)
+
+    def close (self):
+        """Complete processing of a document provided through L{feed}."""
+        parser = self.__parser
+        if parser is None:
+            parser = self.__createParser()
+        try:
+            self.__invoke(parser.Parse, six.binary_type(), True)
+        finally:
+            self.__parser = None
+
+    def parse (self, source):
+        """Process a complete document.
+
+        @param source: The document, as a file-like object with a C{read}
+        method, or as bytes."""
+        parser = self.__createParser()
+        try:
+            if isinstance(source, six.binary_type):
+                self.__invoke(parser.Parse, source, True)
+            else:
+                self.__invoke(parser.ParseFile, source)
+        finally:
+            self.__parser = None
+
+def make_expat_parser (**kw):
+    """Create an L{ExpatParser} that delivers events to a L{PyXBSAXHandler}.
+
+    This is used in place of L{make_parser} when the XML style is
+    L{pyxb.XMLStyle_expat}.
+
+    @keyword content_handler: The content handler instance for the parser to
+    use.  If not provided, an instance of C{content_handler_constructor} is
+    created from the remaining keywords and used.
+
+    @keyword content_handler_constructor: A callable which produces an
+    appropriate instance of (a subclass of) L{PyXBSAXHandler}.  The default
+    is L{PyXBSAXHandler}.
+    """
+    content_handler_constructor = kw.pop('content_handler_constructor', PyXBSAXHandler)
+    content_handler = kw.pop('content_handler', None)
+    if content_handler is None:
+        content_handler = content_handler_constructor(**kw)
+    return ExpatParser(content_handler)
+
+class PushParser (object):
+    """Build a binding instance from a document delivered in chunks.
+
+    This supports documents received incrementally, e.g. from a socket,
+    without first accumulating the complete document::
+
+      parser = pyxb.binding.saxer.PushParser(fallback_namespace=ns)
+      for chunk in chunks:
+          parser.feed(chunk)
+      instance = parser.close()
+
+    The underlying parser is L{ExpatParser} if the XML style is
+    L{pyxb.XMLStyle_expat}, and the C{xml.sax} parser from L{make_parser}
+    otherwise.  After L{close} the instance may be used for another
+    document.
+
+    Generated binding modules provide C{CreatePushParser}, which creates an
+    instance that uses the module namespace as the fallback namespace.
+    """
+
+    def contentHandler (self):
+        """The L{PyXBSAXHandler} that builds the bindings."""
+        return self.__contentHandler
+    __contentHandler = None
+
+    def __init__ (self, **kw):
+        """Create a push parser.
+
+        All keywords are passed to L{make_expat_parser} or L{make_parser}.
+
+        @keyword fallback_namespace: As with L{make_parser}.
+        @keyword location_base: As with L{make_parser}.
+        """
+        if pyxb.XMLStyle_expat == pyxb._XMLStyle:
+            self.__parser = make_expat_parser(**kw)
+        else:
+            self.__parser = make_parser(**kw)
+        self.__contentHandler = self.__parser.getContentHandler()
+        # The xml.sax incremental interface only provides a locator to the
+        # handler from parse(); the expat-based reader is its own locator.
+        if isinstance(self.__parser, xml.sax.xmlreader.Locator):
+            self.__contentHandler.setDocumentLocator(self.__parser)
+
+    def feed (self, data):
+        """Process the next chunk of the document.
+
+        @param data: The chunk, as bytes, or as text in the
+        L{pyxb._InputEncoding} encoding.
+        """
+        if isinstance(data, six.text_type):
+            data = data.encode(pyxb._InputEncoding)
+        self.__parser.feed(data)
+
+    def close (self):
+        """Complete processing of the document.
+
+        @return: The binding instance for the document element.
+        """
+        self.__parser.close()
+        return self.__contentHandler.rootObject()
+
+    DefaultReadSize = 65536
+    """The number of bytes read from a stream for each L{feed} by
+    L{parseStream} and L{parseFile} when no read size is provided."""
+
+    def parseStream (self, stream, read_size=None):
+        """Process a complete document read from a file-like object.
+
+        The document is provided to the parser in chunks, so it is never
+        held in memory as a whole.
+
+        @param stream: An object with a C{read} method that returns bytes
+        or text.
+        @keyword read_size: The number of bytes to request from each
+        C{read}.  Defaults to L{DefaultReadSize}.
+        @return: The binding instance for the document element.
+        """
+        if read_size is None:
+            read_size = self.DefaultReadSize
+        while True:
+            data = stream.read(read_size)
+            if not data:
+                break
+            self.feed(data)
+        return self.close()
+
+    def parseFile (self, path, read_size=None, use_mmap=True):
+        """Process a complete document stored in a file.
+
+        @param path: The path to the file.
+        @keyword read_size: As with L{parseStream}.
+        @keyword use_mmap: If C{True} (default), the file is memory-mapped
+        and chunks are taken from the mapping rather than read into
+        intermediate buffers.  Files that cannot be mapped are read as with
+        L{parseStream}.
+        @return: The binding instance for the document element.
+        """
+        if read_size is None:
+            read_size = self.DefaultReadSize
+        with open(path, 'rb') as stream:
+            view = None
+            if use_mmap:
+                try:
+                    view = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, EnvironmentError):
+                    # Empty files and non-regular files cannot be mapped
+                    pass
+            if view is None:
+                return self.parseStream(stream, read_size)
+            try:
+                for offset in six.moves.xrange(0, len(view), read_size):
+                    self.feed(view[offset:offset+read_size])
+            finally:
+                view.close()
+        return self.close()
+
+# The binding module used by parse_many in the current process
+_ParseManyModule = None
+
+def _ParseManyInitialize (module_name):
+    global _ParseManyModule
+    import importlib
+    _ParseManyModule = importlib.import_module(module_name)
+
+def _ParseManyDocument (job):
+    """Convert one document for L{parse_many}.
+
+    The binding is pickled here rather than by the pool, so a binding that
+    cannot be transferred is reported for its own document rather than
+    aborting the batch.
+
+    @return: C{(True, pickled_binding)} or C{(False, pickled_error)}
+    """
+    (index, document) = job
+    try:
+        return (True, pickle.dumps(_ParseManyModule.CreateFromDocument(document), pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        try:
+            description = six.text_type(e)
+        except Exception:
+            description = repr(e)
+        description = six.u('%s: %s') % (type(e).__name__, description)
+        try:
+            return (False, pickle.dumps(pyxb.DocumentParseError(index, description, e), pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return (False, pickle.dumps(pyxb.DocumentParseError(index, description), pickle.HIGHEST_PROTOCOL))
+
+def parse_many (module, documents, workers=None, chunksize=1, raise_errors=False):
+    """Convert many independent documents to bindings using a pool of
+    worker processes.
+
+    Each worker imports the binding module once when it starts, then
+    converts documents with the module's C{CreateFromDocument}.  The
+    bindings are pickled and returned to the calling process.
+
+    @param module: The generated binding module, or its name.  The module
+    must be importable by name in the worker processes.
+    @param documents: An iterable of XML documents, as bytes or text.
+    @keyword workers: The number of worker processes.  Defaults to the
+    number of CPUs.  If zero, the documents are converted in the calling
+    process, which is useful for debugging.
+    @keyword chunksize: The number of documents sent to a worker at a time.
+    @keyword raise_errors: If C{True}, the L{pyxb.DocumentParseError} for
+    the first document that could not be converted is raised.  By default
+    it is returned in place of the binding for that document.
+    @return: A list with the binding instance for each document, in the
+    order the documents were provided.
+    """
+    if not isinstance(module, six.string_types):
+        module = module.__name__
+    jobs = enumerate(documents)
+    if 0 == workers:
+        _ParseManyInitialize(module)
+        results = [ _ParseManyDocument(_j) for _j in jobs ]
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers, _ParseManyInitialize, (module,))
+        try:
+            results = pool.map(_ParseManyDocument, list(jobs), chunksize)
+        finally:
+            pool.close()
+            pool.join()
+    rv = []
+    for (ok, data) in results:
+        value = pickle.loads(data)
+        if raise_errors and not ok:
+            raise value
+        rv.append(value)
+    return rv
+
+def iterparse (source, targets, chunk_size=65536, **kw):
+    """Generate binding instances for selected elements of a document as
+    each element is completed.
+
+    This supports documents that comprise a root element with a very large
+    number of repeated children.  Each child that matches one of C{targets}
+    is yielded as soon as its end tag has been processed, and is then
+    detached from its parent, so memory use does not grow with the size of
+    the document.  The content model of the parent is still updated as each
+    child is completed, so the structure of the surrounding document
+    continues to be validated.
+
+    Example::
+
+      for item in pyxb.binding.saxer.iterparse(open('feed.xml', 'rb'), [ 'feed/item' ]):
+          process(item)
+
+    @note: The parent of a streamed element will not validate as a whole,
+    since the streamed content is no longer present.  If the content model of
+    the parent is nondeterministic when a streamed element is completed, that
+    element is yielded but remains attached to the parent.
+
+    @param source: The document, as a file-like object with a C{read}
+    method, or as text or bytes.
+    @param targets: The elements to be yielded; see
+    L{PyXBSAXHandler.setStreamTargets}.
+    @keyword chunk_size: The number of bytes to read from C{source} before
+    yielding completed elements.
+    @keyword fallback_namespace: As with L{make_parser}.
+    @keyword location_base: As with L{make_parser}.
+    @return: A generator of binding instances
+    """
+    kw['stream_targets'] = targets
+    saxer = PushParser(**kw)
+    handler = saxer.contentHandler()
+    if isinstance(source, six.text_type):
+        source = source.encode(pyxb._InputEncoding)
+    if isinstance(source, six.binary_type):
+        source = io.BytesIO(source)
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        saxer.feed(data)
+        for binding_object in handler.takeStreamedObjects():
+            yield binding_object
+    saxer.close()
+    for binding_object in handler.takeStreamedObjects():
+        yield binding_object
+
 ## Local Variables:
 ## fill-column:78
 ## End:
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+# Copyright 2009-2013, Peter A. Bigot
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain a
+# copy of the License at:
+#
+#            http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""This module extracts the coordinates of GML geometries from a document
+into contiguous arrays.
+
+Converting a GML document to bindings creates an object for every
+coordinate of every geometry, which is the dominant cost when only the
+geometry is of interest.  The extractor here works directly from the expat
+parser events: text is collected only within C{posList}, C{pos},
+C{lowerCorner}, C{upperCorner}, and C{coordinates} elements, and is
+converted in bulk into a single C{array.array} of doubles.  No bindings are
+created, so the extractor does not require the GML bindings to have been
+generated.
+
+Coordinates are grouped into I{parts} and I{geometries}:
+
+ - Each C{posList} and C{coordinates} element is one part.  Consecutive
+   C{pos} (or C{lowerCorner}/C{upperCorner}) elements with the same parent
+   form one part, so the positions of a C{LineString} written as C{pos}
+   elements are contiguous.
+
+ - A geometry is the outermost element named in L{GeometryNames} that
+   contains a part, so the polygons of a C{MultiSurface} belong to one
+   geometry.  A part that is not within such an element is a geometry by
+   itself.
+
+The dimension of each part is taken from the C{srsDimension} attribute of
+the coordinate element or its nearest ancestor that has one.  Without
+that, the dimension of a C{pos} is its number of values, the dimension of
+C{coordinates} is the number of values in each tuple, and the dimension of
+a C{posList} is derived from its C{count} attribute or is two.
+
+Example::
+
+  coords = pyxb.bundles.opengis.geometry.ExtractCoordinates(open('data.gml', 'rb'))
+  for gi in xrange(len(coords)):
+      for (dimension, values) in coords.geometryParts(gi):
+          process(dimension, values)
+
+The arrays support the buffer protocol, so a library such as NumPy can use
+them without copying, e.g. C{numpy.frombuffer(coords.values())}.
+"""
+
+import array
+import xml.parsers.expat
+import pyxb
+import pyxb.namespace
+from pyxb.utils import six
+
+GML_3_1 = 'http://www.opengis.net/gml'
+"""The namespace URI of GML versions 2 through 3.1."""
+
+GML_3_2 = 'http://www.opengis.net/gml/3.2'
+"""The namespace URI of GML version 3.2."""
+
+GeometryNames = frozenset([ 'Point', 'LineString', 'LinearRing', 'Ring',
+                            'Polygon', 'Curve', 'OrientableCurve',
+                            'CompositeCurve', 'Surface', 'OrientableSurface',
+                            'CompositeSurface', 'PolyhedralSurface',
+                            'TriangulatedSurface', 'Tin', 'Solid',
+                            'CompositeSolid', 'MultiPoint', 'MultiCurve',
+                            'MultiLineString', 'MultiSurface',
+                            'MultiPolygon', 'MultiSolid', 'MultiGeometry',
+                            'GeometricComplex', 'Envelope', 'Box' ])
+"""The local names of the GML elements that delimit geometries."""
+
+# The kinds of element from which coordinates are extracted.
+_PosList = 1
+_Pos = 2
+_Coordinates = 3
+
+_CoordinateElements = { 'posList': _PosList,
+                        'pos': _Pos,
+                        'lowerCorner': _Pos,
+                        'upperCorner': _Pos,
+                        'coordinates': _Coordinates }
+
+class Coordinates (object):
+    """The coordinates extracted from a document.
+
+    The values of all parts are held in a single array; L{partOffsets} and
+    L{geometryOffsets} index into it in the manner of a compressed sparse
+    row structure."""
+
+    def values (self):
+        """The coordinate values of all parts, as an C{array.array} of
+        doubles."""
+        return self.__values
+    __values = None
+
+    def partOffsets (self):
+        """The index in L{values} of the first value of each part, followed
+        by the length of L{values}."""
+        return self.__partOffsets
+    __partOffsets = None
+
+    def partDimensions (self):
+        """The number of values in each position of each part."""
+        return self.__partDimensions
+    __partDimensions = None
+
+    def geometryOffsets (self):
+        """The index in L{partOffsets} of the first part of each geometry,
+        followed by the number of parts."""
+        return self.__geometryOffsets
+    __geometryOffsets = None
+
+    def geometryNames (self):
+        """The L{pyxb.namespace.ExpandedName} of the element for each
+        geometry."""
+        return self.__geometryNames
+    __geometryNames = None
+
+    def geometryIds (self):
+        """The value of the C{gml:id} attribute of the element for each
+        geometry, or C{None} if it has none."""
+        return self.__geometryIds
+    __geometryIds = None
+
+    def __init__ (self):
+        self.__values = array.array('d')
+        self.__partOffsets = array.array('l', [ 0 ])
+        self.__partDimensions = array.array('l')
+        self.__geometryOffsets = array.array('l', [ 0 ])
+        self.__geometryNames = []
+        self.__geometryIds = []
+
+    def __len__ (self):
+        return len(self.__geometryNames)
+
+    def geometryParts (self, index):
+        """Return the parts of the geometry at the given index.
+
+        @return: A list of C{(dimension, values)} pairs, where C{values} is
+        an C{array.array} of doubles."""
+        offsets = self.__partOffsets
+        rv = []
+        for pi in six.moves.xrange(self.__geometryOffsets[index], self.__geometryOffsets[index+1]):
+            rv.append((self.__partDimensions[pi], self.__values[offsets[pi]:offsets[pi+1]]))
+        return rv
+
+class CoordinateExtractor (object):
+    """Extract the coordinates of GML geometries from a document provided
+    incrementally through L{feed} and L{close}.
+
+    See L{ExtractCoordinates} for the common case of a complete document."""
+
+    # Separator placed by expat between the namespace URI and the local
+    # name of qualified element and attribute names.
+    __NamespaceSeparator = ' '
+
+    __parser = None
+    __coordinates = None
+
+    def __init__ (self, namespaces=(GML_3_1, GML_3_2), geometry_names=GeometryNames):
+        """Create an extractor.
+
+        @keyword namespaces: The namespace URIs of the GML versions to be
+        recognized.
+        @keyword geometry_names: The local names of the elements that delimit
+        geometries.
+        """
+        self.__coordinates = Coordinates()
+        self.__parser = self.__createParser(namespaces, geometry_names)
+
+    def __createParser (self, namespaces, geometry_names):
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=self.__NamespaceSeparator)
+        parser.buffer_text = True
+        separator = self.__NamespaceSeparator
+        coordinate_elements = {}
+        geometry_elements = {}
+        id_attributes = []
+        for ns in namespaces:
+            for (ln, kind) in six.iteritems(_CoordinateElements):
+                coordinate_elements[ns + separator + ln] = kind
+            for ln in geometry_names:
+                geometry_elements[ns + separator + ln] = (ns, ln)
+            id_attributes.append(ns + separator + 'id')
+
+        coordinates = self.__coordinates
+        values = coordinates.values()
+        part_offsets = coordinates.partOffsets()
+        part_dimensions = coordinates.partDimensions()
+        geometry_offsets = coordinates.geometryOffsets()
+        names = coordinates.geometryNames()
+        ids = coordinates.geometryIds()
+
+        # The callbacks are closures over local variables, since attribute
+        # lookups on self would otherwise dominate the per-event cost.  The
+        # state that changes is held in this dictionary:
+        #  - depth: the number of open elements
+        #  - geometry: the depth of the open geometry element, or None
+        #  - pending: the name and id of the open geometry element, until
+        #    its first part is seen
+        #  - element: the kind and attributes of the open coordinate element
+        #  - last_pos: the serial number of the parent of the pos element
+        #    that ended the last part, or None
+        # serials and dimensions hold the serial number and inherited
+        # srsDimension of each open element.
+        state = { 'depth': 0, 'geometry': None, 'pending': None, 'element': None, 'last_pos': None, 'serial': 0 }
+        serials = [ None ]
+        dimensions = [ None ]
+        text = []
+
+        def error (message):
+            raise pyxb.BadDocumentError('%s at line %d column %d' % (message, parser.CurrentLineNumber, parser.CurrentColumnNumber))
+
+        def start_geometry (name, gml_id):
+            names.append(pyxb.namespace.ExpandedName(*name))
+            ids.append(gml_id)
+            geometry_offsets.append(geometry_offsets[-1])
+
+        def start_element (name, attrs):
+            state['depth'] += 1
+            state['serial'] += 1
+            serials.append(state['serial'])
+            dimension = attrs.get('srsDimension') if attrs else None
+            if dimension is None:
+                dimension = dimensions[-1]
+            dimensions.append(dimension)
+            kind = coordinate_elements.get(name)
+            if kind is not None:
+                del text[:]
+                state['element'] = (name, kind, attrs)
+                parser.CharacterDataHandler = text.append
+            elif (state['geometry'] is None) and (name in geometry_elements):
+                state['geometry'] = state['depth']
+                gml_id = None
+                for attr in id_attributes:
+                    gml_id = attrs.get(attr, gml_id)
+                state['pending'] = (geometry_elements[name], gml_id)
+
+        def end_element (name):
+            element = state['element']
+            if element is not None:
+                parser.CharacterDataHandler = None
+                state['element'] = None
+                add_part(element, serials[-2])
+            if state['geometry'] == state['depth']:
+                state['geometry'] = None
+                state['pending'] = None
+                state['last_pos'] = None
+            state['depth'] -= 1
+            serials.pop()
+            dimensions.pop()
+
+        def add_part (element, parent_serial):
+            (name, kind, attrs) = element
+            dimension = dimensions[-1]
+            if dimension is not None:
+                try:
+                    dimension = int(dimension)
+                except ValueError:
+                    error('Invalid srsDimension %s' % (dimension,))
+                if 0 >= dimension:
+                    error('Invalid srsDimension %s' % (dimension,))
+            try:
+                if _Coordinates == kind:
+                    (part, tuple_dimension) = _ConvertCoordinates(''.join(text), attrs)
+                    if dimension is None:
+                        dimension = tuple_dimension
+                else:
+                    part = array.array('d', [ float(_v) for _v in ''.join(text).split() ])
+            except ValueError:
+                error('Invalid coordinate in %s' % (name.split(separator)[-1],))
+            if 0 == len(part):
+                return
+            if dimension is None:
+                if _PosList == kind:
+                    dimension = 2
+                    count = attrs.get('count')
+                    if count is not None:
+                        try:
+                            count = int(count)
+                        except ValueError:
+                            error('Invalid count %s' % (count,))
+                        if 0 < count:
+                            dimension = len(part) // count
+                else:
+                    dimension = len(part)
+            if (0 == dimension) or (0 != (len(part) % dimension)):
+                error('%d values in %s do not form positions of dimension %d' % (len(part), name.split(separator)[-1], dimension))
+            pending = state['pending']
+            merge = (pending is None) and (_Pos == kind) and (state['last_pos'] == parent_serial) and (part_dimensions[-1] == dimension)
+            if pending is not None:
+                start_geometry(*pending)
+                state['pending'] = None
+            elif (state['geometry'] is None) and not merge:
+                start_geometry(name.split(separator, 1), None)
+            values.extend(part)
+            if merge:
+                part_offsets[-1] = len(values)
+            else:
+                part_offsets.append(len(values))
+                part_dimensions.append(dimension)
+                geometry_offsets[-1] += 1
+            state['last_pos'] = parent_serial if _Pos == kind else None
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        return parser
+
+    def feed (self, data):
+        """Process another chunk of the document.
+
+        @param data: A chunk of the document as bytes."""
+        self.__invoke(data, False)
+
+    def close (self):
+        """Complete processing of the document.
+
+        @return: The L{Coordinates} extracted from the document."""
+        self.__invoke(six.binary_type(), True)
+        return self.__coordinates
+
+    def __invoke (self, data, is_final):
+        parser = self.__parser
+        try:
+            parser.Parse(data, is_final)
+        except xml.parsers.expat.ExpatError as e:
+            raise pyxb.BadDocumentError('%s at line %d column %d' % (xml.parsers.expat.ErrorString(e.code), e.lineno, e.offset))
+
+def _ConvertCoordinates (text, attrs):
+    """Convert the content of a GML C{coordinates} element.
+
+    @param text: The element content.
+    @param attrs: The attributes of the element.  The C{decimal}, C{cs}, and
+    C{ts} attributes select the decimal point and the separators between
+    coordinates and between tuples.
+    @return: A pair comprising an C{array.array} of the values, and the
+    number of values in each tuple.
+    @raise ValueError: the text is not a valid set of tuples
+    """
+    decimal = attrs.get('decimal', '.')
+    cs = attrs.get('cs', ',')
+    ts = attrs.get('ts', ' ')
+    if ts.isspace():
+        tuples = text.split()
+    else:
+        tuples = text.strip().split(ts)
+    rv = array.array('d')
+    dimension = None
+    for t in tuples:
+        t = t.strip()
+        if not t:
+            continue
+        tv = t.split(cs)
+        if dimension is None:
+            dimension = len(tv)
+        elif len(tv) != dimension:
+            raise ValueError(t)
+        if '.' != decimal:
+            tv = [ _v.replace(decimal, '.') for _v in tv ]
+        rv.extend([ float(_v) for _v in tv ])
+    return (rv, dimension)
+
+def ExtractCoordinates (source, chunk_size=65536, **kw):
+    """Extract the coordinates of the GML geometries in a document.
+
+    @param source: The document, as a file-like object with a C{read}
+    method, or as text or bytes.
+    @keyword chunk_size: The number of bytes to read from C{source} at a
+    time.
+    @keyword namespaces: As with L{CoordinateExtractor}.
+    @keyword geometry_names: As with L{CoordinateExtractor}.
+    @return: An instance of L{Coordinates}
+    @raise pyxb.BadDocumentError: the document is not well-formed, or a
+    coordinate element has invalid content
+    """
+    extractor = CoordinateExtractor(**kw)
+    if isinstance(source, six.text_type):
+        source = source.encode(pyxb._InputEncoding)
+    if isinstance(source, six.binary_type):
+        extractor.feed(source)
+    else:
+        while True:
+            data = source.read(chunk_size)
+            if not data:
+                break
+            extractor.feed(data)
+    return extractor.close()
@@ -1 +1,51 @@
 from pyxb.bundles.wssplat.raw.ds import *
+
+import hashlib
+import pyxb
+import pyxb.utils.domutils
+
+# Map from the URIs of DigestMethod algorithms to the names used by hashlib.
+DigestAlgorithms = {
+    'http://www.w3.org/2000/09/xmldsig#sha1' : 'sha1',
+    'http://www.w3.org/2001/04/xmldsig-more#sha224' : 'sha224',
+    'http://www.w3.org/2001/04/xmlenc#sha256' : 'sha256',
+    'http://www.w3.org/2001/04/xmldsig-more#sha384' : 'sha384',
+    'http://www.w3.org/2001/04/xmlenc#sha512' : 'sha512',
+}
+
+def ExclusiveC14NDigest (instance, algorithm='http://www.w3.org/2001/04/xmlenc#sha256', inclusive_prefixes=None, with_comments=False, bds=None, element_name=None):
+    """Compute the digest of the Exclusive XML Canonicalization of a binding
+    instance.
+
+    The canonical form is generated directly from the binding instance and
+    passed to the hash as it is produced; neither a DOM tree nor the
+    serialized document is created.  The result is suitable as the value of
+    a C{DigestValue} element.
+
+    @param instance: The binding instance for the apex element of the
+    referenced content, e.g. a SOAP body or a C{SignedInfo} element.
+
+    @keyword algorithm: The URI of the digest algorithm, as used in
+    C{DigestMethod}; see L{DigestAlgorithms}.
+
+    @keyword inclusive_prefixes: The C{PrefixList} of an
+    C{InclusiveNamespaces} transform parameter, as a string or a list.
+
+    @keyword with_comments: C{True} for the C{#WithComments} variant of the
+    canonicalization.
+
+    @keyword bds: An optional L{pyxb.utils.domutils.BindingC14NWriter},
+    e.g. with namespace prefixes declared to match the transmitted document.
+    If provided, C{inclusive_prefixes} and C{with_comments} are ignored.
+
+    @keyword element_name: As for L{toxml
+    <pyxb.binding.basis._TypeBinding_mixin.toxml>}.
+
+    @return: The digest, as bytes.
+    """
+    hash_name = DigestAlgorithms.get(algorithm)
+    if hash_name is None:
+        raise pyxb.UsageError('Unsupported digest algorithm %s' % (algorithm,))
+    if bds is None:
+        bds = pyxb.utils.domutils.BindingC14NWriter(inclusive_prefixes=inclusive_prefixes, with_comments=with_comments)
+    return bds.digest(instance, hashlib.new(hash_name), element_name=element_name).digest()
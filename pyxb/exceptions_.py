@@ -136,6 +136,33 @@ class BadDocumentError (PyXBException):
     """Raised when processing document content and an error is encountered."""
     pass
 
+@six.python_2_unicode_compatible
+class DocumentParseError (BadDocumentError):
+    """Records the failure to convert one document in a batch.
+
+    Instances are returned (or raised) by
+    L{pyxb.binding.saxer.parse_many} in place of the binding for a
+    document that could not be converted."""
+
+    index = None
+    """The position of the document in the batch."""
+
+    description = None
+    """Text describing the exception raised while converting the document."""
+
+    cause = None
+    """The exception raised while converting the document, or C{None} if
+    it could not be transferred from the process that did the conversion."""
+
+    def __init__ (self, index, description, cause=None):
+        super(DocumentParseError, self).__init__(index, description, cause)
+        self.index = index
+        self.description = description
+        self.cause = cause
+
+    def __str__ (self):
+        return six.u('Document %d: %s') % (self.index, self.description)
+
 class StructuralBadDocumentError (BadDocumentError):
     """Raised when processing document and the content model is not satisfied."""
     @property
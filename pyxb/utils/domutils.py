@@ -16,6 +16,8 @@
 """Functions that support activities related to the Document Object Model."""
 
 import logging
+import codecs
+import collections
 import xml.dom
 
 import pyxb
@@ -268,13 +270,21 @@ class BindingDOMSupport (object):
         This creates a new root document with no content, resets the
         namespace-prefix map to its as-constructed content, and clears the set
         of referenced namespace prefixes.  The defaultNamespace and
-        requireXSIType are not modified."""
+        requireXSIType are not modified.
+
+        If the namespace declarations have been L{frozen
+        <freezeNamespaces>} the namespace-prefix map is instead retained
+        as it was at the end of the previous document, along with the cached
+        prefixes and QName text."""
         self.__document = self.implementation().createDocument(None, None, None)
+        self.__referencedNamespacePrefixes = set()
+        if self.__frozen:
+            return
         self.__namespaceContext.reset()
         # For historical reasons this is also added automatically, though
         # 'xsi' is not a bound prefix.
         self.__namespaceContext.declareNamespace(pyxb.namespace.XMLSchema_instance, 'xsi')
-        self.__referencedNamespacePrefixes = set()
+        self.__clearCaches()
 
     @classmethod
     def Reset (cls):
@@ -328,6 +338,45 @@ class BindingDOMSupport (object):
     # through L{namespacePrefix()} since the last reset().
     __referencedNamespacePrefixes = None
 
+    # Map from pairs of namespace (or URI) and enable_default_namespace to
+    # pairs of the corresponding namespace and prefix.
+    __prefixCache = None
+
+    # Map from triples of namespace, local name, and enable_default_namespace
+    # to pairs of the namespace prefix and the text of the QName.
+    __qnameCache = None
+
+    # True once the namespace declarations have been frozen.
+    __frozen = False
+
+    def __clearCaches (self):
+        self.__prefixCache = {}
+        self.__qnameCache = {}
+
+    def __checkNotFrozen (self):
+        if self.__frozen:
+            raise pyxb.LogicError('Namespace declarations have been frozen')
+
+    def freezeNamespaces (self):
+        """Mark the namespace declarations of this instance as complete.
+
+        Prefixes for namespaces used in generated documents, and the text of
+        the QNames that use them, are cached as they are computed, making
+        subsequent formatting of element and attribute names a dictionary
+        lookup.  Once frozen, the namespace-prefix map and these caches are
+        retained by L{reset}, so they can be shared across the documents
+        generated using this instance; L{declareNamespace} and
+        L{setDefaultNamespace} are no longer permitted.
+
+        @return: C{self}
+        """
+        self.__frozen = True
+        return self
+
+    def namespacesFrozen (self):
+        """C{True} iff L{freezeNamespaces} has been invoked."""
+        return self.__frozen
+
     def defaultNamespace (self):
         """The default namespace for this instance"""
         return self.__namespaceContext.defaultNamespace()
@@ -337,6 +386,8 @@ class BindingDOMSupport (object):
         return cls.__NamespaceContext.defaultNamespace()
 
     def setDefaultNamespace (self, default_namespace):
+        self.__checkNotFrozen()
+        self.__clearCaches()
         return self.__namespaceContext.setDefaultNamespace(default_namespace)
     @classmethod
     def SetDefaultNamespace (cls, default_namespace):
@@ -344,6 +395,8 @@ class BindingDOMSupport (object):
 
     def declareNamespace (self, namespace, prefix=None):
         """Declare a namespace within this instance only."""
+        self.__checkNotFrozen()
+        self.__clearCaches()
         return self.__namespaceContext.declareNamespace(namespace, prefix)
     @classmethod
     def DeclareNamespace (cls, namespace, prefix=None):
@@ -366,24 +419,50 @@ class BindingDOMSupport (object):
         namespace C{None} is returned to indicate this.  If this keyword is
         C{False} then we need a namespace prefix even if this is the default.
         """
+        key = (namespace, enable_default_namespace)
+        cached = self.__prefixCache.get(key)
+        if cached is None:
+            cached = self.__prefixCache[key] = self.__namespacePrefix(namespace, enable_default_namespace)
+        (namespace, pfx) = cached
+        if pfx is not None:
+            self._referencePrefix(namespace, pfx)
+        return pfx
+
+    def __namespacePrefix (self, namespace, enable_default_namespace):
         if (namespace is None) or namespace.isAbsentNamespace():
-            return None
+            return (namespace, None)
         if isinstance(namespace, six.string_types):
             namespace = pyxb.namespace.NamespaceForURI(namespace, create_if_missing=True)
         if (self.defaultNamespace() == namespace) and enable_default_namespace:
-            return None
+            return (namespace, None)
         pfx = self.__namespaceContext.prefixForNamespace(namespace)
         if pfx is None:
             pfx = self.__namespaceContext.declareNamespace(namespace)
-        self.__referencedNamespacePrefixes.add((namespace, pfx))
-        return pfx
+        return (namespace, pfx)
+
+    def _referencePrefix (self, namespace, prefix):
+        """Record a use of C{prefix} for C{namespace} in the document.
+
+        This is invoked by L{namespacePrefix} and L{qnameAsText} whenever a
+        non-default prefix is used, whether or not it was cached.  Subclasses
+        that need to know where prefixes are used should extend it."""
+        self.__referencedNamespacePrefixes.add((namespace, prefix))
 
     def qnameAsText (self, qname, enable_default_namespace=True):
         assert isinstance(qname, pyxb.namespace.ExpandedName)
-        name = qname.localName()
-        prefix = self.namespacePrefix(qname.namespace(), enable_default_namespace=enable_default_namespace)
+        namespace = qname.namespace()
+        key = (namespace, qname.localName(), enable_default_namespace)
+        cached = self.__qnameCache.get(key)
+        if cached is None:
+            name = qname.localName()
+            prefix = self.namespacePrefix(namespace, enable_default_namespace=enable_default_namespace)
+            if prefix is not None:
+                name = '%s:%s' % (prefix, name)
+            self.__qnameCache[key] = (prefix, name)
+            return name
+        (prefix, name) = cached
         if prefix is not None:
-            name = '%s:%s' % (prefix, name)
+            self._referencePrefix(namespace, prefix)
         return name
 
     def valueAsText (self, value, enable_default_namespace=True):
@@ -397,6 +476,8 @@ class BindingDOMSupport (object):
         if isinstance(value, pyxb.namespace.ExpandedName):
             return self.qnameAsText(value, enable_default_namespace=enable_default_namespace)
         if isinstance(value, STD_list):
+            if value._CompactItems():
+                return value.xsdLiteral()
             return ' '.join([ self.valueAsText(_v, enable_default_namespace=enable_default_namespace) for _v in value ])
         if isinstance(value, simpleTypeDefinition):
             return value.xsdLiteral()
@@ -583,6 +664,666 @@ class BindingDOMSupport (object):
         """Add the text to the parent as a text node."""
         return parent.appendChild(self.document().createTextNode(self.valueAsText(text)))
 
+class _WriterElement (object):
+    """An element that has been started by a L{BindingXMLWriter}.
+
+    This stands in for the C{xml.dom.Element} that L{BindingDOMSupport}
+    would create, and is passed back to the writer as the parent of content
+    and the target of attributes."""
+
+    __slots__ = ( 'name', 'attributes', 'started', 'namespaces' )
+
+    def __init__ (self, namespaces):
+        # The QName of the element
+        self.name = None
+        # Map from attribute QName to attribute text
+        self.attributes = {}
+        # True once the start tag has been written
+        self.started = False
+        # Map from prefix to the namespace declared for it in the scope of
+        # the element.  Shared with the parent until a declaration is added.
+        self.namespaces = namespaces
+
+class _CallbackStream (object):
+    """A stream that passes what is written to it to a callable, such as
+    the C{append} method of a list or the C{update} method of a hash."""
+    def __init__ (self, write):
+        self.write = write
+
+def _EscapeText (text):
+    # Same escapes as xml.dom.minidom uses for text and attribute values
+    if ('&' in text) or ('<' in text) or ('>' in text) or ('"' in text):
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+    return text
+
+class BindingXMLWriter (BindingDOMSupport):
+    """Write the XML for a binding instance to a stream without building a
+    DOM tree.
+
+    This implements the part of the L{BindingDOMSupport} interface used when
+    converting a binding instance to DOM, but writes each element to the
+    output as soon as its attributes are known instead of adding it to a
+    document.  Element order, validation, C{xsi:type} and namespace prefix
+    assignment are the same as for L{toDOM
+    <pyxb.binding.basis._TypeBinding_mixin.toDOM>}; memory use is bounded
+    by the depth of the tree rather than its size.
+
+    Because the document element is written before its content has been
+    examined, namespaces cannot all be declared on it as they are by
+    L{BindingDOMSupport.finalize}.  The document element declares the
+    default namespace and the namespaces of all elements and attributes
+    reachable through the content models of its type.  Any other namespace
+    (e.g. from wildcard content, C{xsi:type} substitution, or a QName
+    value) is declared on the element where it is first needed.
+
+    With a default namespace the output differs from that of
+    L{BindingDOMSupport}, which declares the default namespace only on the
+    document element.  An unqualified element within the scope of a default
+    namespace is written with C{xmlns=""}, and an element in a namespace
+    that is written without a prefix declares that namespace as the
+    default, so that the document means the same when it is read back.
+
+    Use L{write}, or pass C{stream} to L{toxml
+    <pyxb.binding.basis._TypeBinding_mixin.toxml>}.
+    """
+
+    # The output stream and the encoding used for it (None for text)
+    __stream = None
+    __encoding = None
+
+    # Text waiting to be written to the stream, its length, and the length
+    # at which it is written
+    __buffer = None
+    __bufferLength = 0
+    __flushSize = None
+
+    BufferSize = 65536
+    """The number of characters accumulated before they are written to the
+    stream."""
+
+    # The elements that have been created and not yet closed, outermost
+    # first.
+    __openElements = None
+
+    # True once a document element has been created
+    __haveRoot = False
+
+    # The type of the instance being written as the document element
+    __rootType = None
+
+    # Map from the name and type of a document element to its name,
+    # namespace scope and namespace declarations.  These depend only on the
+    # namespace declarations, so they are reused for each document once the
+    # declarations have been frozen.
+    __rootCache = None
+
+    # Map from complex type class to the namespaces reachable through its
+    # content model.
+    __ReachableNamespaces = {}
+
+    @classmethod
+    def __ReachableNamespacesForType (cls, type_class):
+        rv = cls.__ReachableNamespaces.get(type_class)
+        if rv is not None:
+            return rv
+        namespaces = set()
+        seen = set()
+        pending = [ type_class ]
+        while pending:
+            tc = pending.pop()
+            if tc in seen:
+                continue
+            seen.add(tc)
+            for en in six.iterkeys(getattr(tc, '_AttributeMap', {})):
+                namespaces.add(en.namespace())
+            for (en, ed) in six.iteritems(getattr(tc, '_ElementMap', {})):
+                namespaces.add(en.namespace())
+                pending.append(ed.elementBinding().typeDefinition())
+        namespaces.discard(None)
+        rv = sorted([ _ns for _ns in namespaces if not _ns.isAbsentNamespace() ], key=lambda _ns: _ns.uri())
+        cls.__ReachableNamespaces[type_class] = rv
+        return rv
+
+    def reset (self):
+        super(BindingXMLWriter, self).reset()
+        if not self.namespacesFrozen():
+            self.__rootCache = {}
+        self.__buffer = []
+        self.__bufferLength = 0
+        self.__openElements = []
+        self.__haveRoot = False
+        self.__rootType = None
+
+    def __emit (self, text):
+        self.__buffer.append(text)
+        self.__bufferLength += len(text)
+        if self.__bufferLength >= self.__flushSize:
+            self.__flush()
+
+    def __flush (self):
+        if self.__buffer:
+            text = ''.join(self.__buffer)
+            if self.__encoding is not None:
+                text = text.encode(self.__encoding)
+            self.__stream.write(text)
+        self.__buffer = []
+        self.__bufferLength = 0
+
+    def __startTag (self, element):
+        self.__emit(self._startTag(element, False))
+        element.started = True
+
+    def __closeElement (self):
+        element = self.__openElements.pop()
+        if element.started:
+            self.__emit(self._endTag(element))
+        else:
+            element.started = True
+            self.__emit(self._startTag(element, True))
+
+    def _startTag (self, element, empty):
+        """Return the text for the start tag of an element.
+
+        Subclasses may override this and the related methods L{_endTag},
+        L{_textContent}, and L{_comment} to change the form of the output.
+
+        @param element: The element, with its name and attributes (including
+        namespace declarations) in their final form.
+        @param empty: C{True} iff the element has no content, in which case
+        this is the only text generated for the element.
+        """
+        text = [ '<', element.name ]
+        for an in sorted(element.attributes):
+            text.extend([ ' ', an, '="', _EscapeText(element.attributes[an]), '"' ])
+        if empty:
+            text.append('/>')
+        else:
+            text.append('>')
+        return ''.join(text)
+
+    def _endTag (self, element):
+        """Return the text for the end tag of an element that has content."""
+        return '</%s>' % (element.name,)
+
+    def _textContent (self, text):
+        """Return the representation of character content."""
+        return _EscapeText(text)
+
+    def _comment (self, data):
+        """Return the representation of a comment from DOM content."""
+        return '<!--%s-->' % (data,)
+
+    def __enterContent (self, parent):
+        """Close any elements nested within C{parent} and make sure its start
+        tag has been written, in preparation for adding content to it."""
+        if parent is None:
+            if not self.__openElements:
+                raise pyxb.LogicError('No open element to hold content')
+            parent = self.__openElements[0]
+        while self.__openElements and (self.__openElements[-1] is not parent):
+            self.__closeElement()
+        if not self.__openElements:
+            raise pyxb.LogicError('Content added to an element that has been closed')
+        if not parent.started:
+            self.__startTag(parent)
+        return parent
+
+    def __declare (self, namespace, prefix):
+        # Make sure prefix is declared for namespace on the innermost open
+        # element.  A namespace of None with a prefix of None undeclares the
+        # default namespace.
+        element = self.__openElements[-1]
+        if element.namespaces.get(prefix) is namespace:
+            return
+        if element.started:
+            raise pyxb.LogicError('Namespace %s first referenced after start tag of %s was written' % (namespace, element.name))
+        element.namespaces = element.namespaces.copy()
+        element.namespaces[prefix] = namespace
+        if prefix is None:
+            element.attributes['xmlns'] = '' if namespace is None else namespace.uri()
+        else:
+            element.attributes['xmlns:' + prefix] = namespace.uri()
+
+    def _referencePrefix (self, namespace, prefix):
+        super(BindingXMLWriter, self)._referencePrefix(namespace, prefix)
+        if self.__openElements and (prefix != pyxb.namespace.XML.boundPrefix()):
+            self.__declare(namespace, prefix)
+
+    def __pushElement (self, parent):
+        if parent is None and not self.__openElements:
+            if self.__haveRoot:
+                raise pyxb.LogicError('Document already has a document element')
+            self.__haveRoot = True
+            namespaces = {}
+        else:
+            namespaces = self.__enterContent(parent).namespaces
+        element = _WriterElement(namespaces)
+        self.__openElements.append(element)
+        return element
+
+    def createChildElement (self, expanded_name, parent=None):
+        is_root = (parent is None) and not self.__openElements
+        element = self.__pushElement(parent)
+        if isinstance(expanded_name, six.string_types):
+            expanded_name = pyxb.namespace.ExpandedName(None, expanded_name)
+        if not isinstance(expanded_name, pyxb.namespace.ExpandedName):
+            raise pyxb.LogicError('Invalid type %s for expanded name' % (type(expanded_name),))
+        frozen = is_root and self.namespacesFrozen()
+        if frozen:
+            root_key = (expanded_name, self.__rootType)
+            cached = self.__rootCache.get(root_key)
+            if cached is not None:
+                (element.name, element.namespaces, attributes) = cached
+                element.attributes.update(attributes)
+                return element
+        ns = expanded_name.namespace()
+        if (ns is None) or ns.isAbsentNamespace():
+            # An unqualified name must not be in the scope of a default
+            # namespace.
+            self.__declare(None, None)
+            element.name = expanded_name.localName()
+        else:
+            if is_root and (self.defaultNamespace() is not None):
+                self.__declare(self.defaultNamespace(), None)
+            element.name = self.qnameAsText(expanded_name)
+            if ':' not in element.name:
+                self.__declare(ns, None)
+        if is_root:
+            if self.__rootType is not None:
+                for ns in self.__ReachableNamespacesForType(self.__rootType):
+                    self.namespacePrefix(ns)
+            if self.requireXSIType():
+                self.namespacePrefix(pyxb.namespace.XMLSchema_instance)
+            if frozen:
+                self.__rootCache[root_key] = (element.name, element.namespaces, element.attributes.copy())
+        return element
+
+    def addAttribute (self, element, expanded_name, value):
+        if element.started or (element is not self.__openElements[-1]):
+            raise pyxb.LogicError('Attribute %s added after content of %s' % (expanded_name, element.name))
+        name = expanded_name
+        if isinstance(name, pyxb.namespace.ExpandedName):
+            name = self.qnameAsText(expanded_name, enable_default_namespace=False)
+        element.attributes[name] = self.valueAsText(value)
+
+    def addXMLNSDeclaration (self, element, namespace, prefix=None):
+        raise pyxb.UsageError('addXMLNSDeclaration: namespaces are declared automatically by BindingXMLWriter')
+
+    def appendTextChild (self, text, parent):
+        if parent is not None:
+            # Close nested elements before any namespace needed by the text
+            # is declared on the parent.
+            while self.__openElements and (self.__openElements[-1] is not parent):
+                self.__closeElement()
+        text = self.valueAsText(text)
+        self.__enterContent(parent)
+        self.__emit(self._textContent(text))
+
+    def appendChild (self, child, parent):
+        self.__writeNode(child, parent)
+
+    def __writeNode (self, node, parent):
+        if node.ELEMENT_NODE == node.nodeType:
+            element = self.__pushElement(parent)
+            (ns_uri, element.name) = self._makeURINodeNamePair(node)
+            if node.namespaceURI is None:
+                self.__declare(None, None)
+            attrs = node.attributes
+            for ai in xrange(attrs.length):
+                attr = attrs.item(ai)
+                if pyxb.namespace.XMLNamespaces.uri() == attr.namespaceURI:
+                    # Declarations are generated as needed
+                    continue
+                (ns_uri, an) = self._makeURINodeNamePair(attr)
+                element.attributes[an] = attr.value
+            for child in node.childNodes:
+                self.__writeNode(child, element)
+            while self.__openElements[-1] is not element:
+                self.__closeElement()
+            self.__closeElement()
+        elif node.TEXT_NODE == node.nodeType:
+            self.__enterContent(parent)
+            self.__emit(self._textContent(node.data))
+        elif node.COMMENT_NODE == node.nodeType:
+            self.__enterContent(parent)
+            self.__emit(self._comment(node.data))
+        else:
+            raise ValueError('DOM node not supported in writer', node)
+
+    def finalize (self):
+        """Close all open elements and write any remaining output to the
+        stream.
+
+        While L{write} or L{iterwrite} is in progress this does nothing, so
+        that binding instances in wildcard content (which are converted with
+        their own L{toDOM<pyxb.binding.basis._TypeBinding_mixin.toDOM>}) do
+        not terminate the document."""
+        if not self.__writing:
+            self.__finish()
+        return self.document()
+
+    def __finish (self):
+        while self.__openElements:
+            self.__closeElement()
+        self.__flush()
+
+    # True while write or iterwrite is in progress
+    __writing = False
+
+    def __begin (self, stream, encoding, flush_size=None):
+        self.reset()
+        self.__stream = stream
+        self.__encoding = encoding
+        if flush_size is None:
+            flush_size = self.BufferSize
+        self.__flushSize = flush_size
+        self.__writing = True
+
+    def __startDocument (self, root_type, xml_declaration):
+        self.__haveRoot = False
+        self.__rootType = root_type
+        if xml_declaration:
+            if self.__encoding is None:
+                self.__emit('<?xml version="1.0" ?>')
+            else:
+                self.__emit('<?xml version="1.0" encoding="%s"?>' % (self.__encoding,))
+
+    def __end (self):
+        self.__writing = False
+        self.__stream = None
+        self.__buffer = []
+        self.__bufferLength = 0
+
+    def write (self, instance, stream, encoding=None, xml_declaration=True, element_name=None):
+        """Write the XML for the binding instance to the stream.
+
+        @param instance: The binding instance to write.
+        @type instance: L{pyxb.binding.basis._TypeBinding_mixin}
+        @param stream: An object with a C{write} method.
+        @keyword encoding: The encoding for the output.  If C{None}, text is
+        written to C{stream}; otherwise bytes in the given encoding are
+        written.
+        @keyword xml_declaration: If C{True} (default), an XML declaration
+        precedes the document element.
+        @keyword element_name: As with L{toDOM
+        <pyxb.binding.basis._TypeBinding_mixin.toDOM>}.
+        """
+        try:
+            self.__begin(stream, encoding)
+            self.__startDocument(type(instance), xml_declaration)
+            instance.toDOM(self, element_name=element_name)
+            self.__finish()
+        finally:
+            self.__end()
+
+    def iterwrite (self, instance, chunk_size=None, encoding=None, xml_declaration=True, element_name=None):
+        """Generate the XML for the binding instance in chunks.
+
+        The instance is visited only as far as is necessary to produce each
+        chunk.  Changing the instance before the generator is exhausted has
+        undefined results.
+
+        @param instance: The binding instance to write.
+        @keyword chunk_size: The minimum number of characters in each chunk
+        other than the last.  Defaults to L{BufferSize}.
+        @keyword encoding: As with L{write}; if C{None} the chunks are text.
+        @keyword xml_declaration: As with L{write}.
+        @keyword element_name: As with L{write}.
+        """
+        chunks = collections.deque()
+        try:
+            self.__begin(_CallbackStream(chunks.append), encoding, chunk_size)
+            self.__startDocument(type(instance), xml_declaration)
+            for _ in instance._toDOM_iter(self, element_name=element_name):
+                while chunks:
+                    yield chunks.popleft()
+            self.__finish()
+            while chunks:
+                yield chunks.popleft()
+        finally:
+            self.__end()
+
+    def writeMany (self, instances, stream, container, encoding=None, xml_declaration=True, element_name=None):
+        """Write binding instances as the children of a single document
+        element.
+
+        Namespace prefixes are assigned once for the whole document.  The
+        document element declares the namespaces reachable from the type of
+        the first instance, so the instances themselves normally carry no
+        namespace declarations.  The namespace declarations of this writer
+        are L{frozen<freezeNamespaces>}, so subsequent documents use the
+        same prefixes.
+
+        @param instances: An iterable of binding instances.
+        @param stream: As with L{write}.
+        @param container: The name of the document element.
+        @type container: L{pyxb.namespace.ExpandedName} or C{str}
+        @keyword encoding: As with L{write}.
+        @keyword xml_declaration: As with L{write}.
+        @keyword element_name: As with L{write}, applied to each instance.
+        """
+        instances = iter(instances)
+        first = next(instances, None)
+        self.freezeNamespaces()
+        try:
+            self.__begin(stream, encoding)
+            self.__startDocument(None if first is None else type(first), xml_declaration)
+            parent = self.createChildElement(container)
+            if first is not None:
+                first.toDOM(self, parent=parent, element_name=element_name)
+                for instance in instances:
+                    instance.toDOM(self, parent=parent, element_name=element_name)
+            self.__finish()
+        finally:
+            self.__end()
+
+    def documents (self, instances, encoding=None, xml_declaration=True, element_name=None):
+        """Generate a separate document for each binding instance.
+
+        The namespace declarations of this writer are L{frozen
+        <freezeNamespaces>}, so namespace prefixes are assigned once for all
+        the documents, and the name, namespace scope, and namespace
+        declarations of the document element are computed for the first
+        instance of each type and reused for subsequent instances.  The work
+        done for each document is only that required for its content.
+
+        @param instances: An iterable of binding instances.
+        @keyword encoding: As with L{write}.  If C{None} the documents are
+        text, otherwise bytes.
+        @keyword xml_declaration: As with L{write}.
+        @keyword element_name: As with L{write}, applied to each instance.
+        """
+        chunks = []
+        joiner = '' if encoding is None else six.b('')
+        self.freezeNamespaces()
+        try:
+            self.__begin(_CallbackStream(chunks.append), encoding)
+            for instance in instances:
+                self.__startDocument(type(instance), xml_declaration)
+                instance.toDOM(self, element_name=element_name)
+                self.__finish()
+                document = joiner.join(chunks)
+                del chunks[:]
+                yield document
+        finally:
+            self.__end()
+
+def _EscapeC14NText (text):
+    if ('&' in text) or ('<' in text) or ('>' in text) or ('\r' in text):
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('\r', '&#xD;')
+    return text
+
+def _EscapeC14NAttribute (text):
+    if ('&' in text) or ('<' in text) or ('"' in text) or ('\t' in text) or ('\n' in text) or ('\r' in text):
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('\t', '&#x9;').replace('\n', '&#xA;').replace('\r', '&#xD;')
+    return text
+
+class BindingC14NWriter (BindingXMLWriter):
+    """Write the U{Exclusive XML Canonicalization
+    <http://www.w3.org/TR/xml-exc-c14n/>} of a binding instance.
+
+    The output is the canonical form of the document that L{BindingXMLWriter}
+    with the same configuration would produce for the instance (which
+    differs from that of L{BindingDOMSupport} where a default namespace is
+    involved), generated without building a DOM tree or a serialized
+    document.  It is always UTF-8 with no XML declaration.  Namespace
+    declarations appear only on the elements that visibly use them, and
+    attributes are ordered by namespace URI and local name.
+
+    Canonicalization of a subset of a document, such as the content of a
+    C{ds:Reference} or a C{ds:SignedInfo}, is done by writing the binding
+    instance for the apex element.  Because the result depends on the
+    namespace prefixes, prefixes that are significant should be declared
+    with L{declareNamespace<BindingDOMSupport.declareNamespace>} on both this
+    instance and the one used to generate the transmitted document.
+
+    Use L{digest} to feed the canonical form directly into a C{hashlib} hash
+    object.
+    """
+
+    Algorithm = 'http://www.w3.org/2001/10/xml-exc-c14n#'
+    """The URI identifying Exclusive XML Canonicalization without
+    comments."""
+
+    AlgorithmWithComments = 'http://www.w3.org/2001/10/xml-exc-c14n#WithComments'
+    """The URI identifying Exclusive XML Canonicalization with comments."""
+
+    # Prefixes from the InclusiveNamespaces PrefixList, with None for the
+    # default namespace
+    __inclusivePrefixes = frozenset()
+
+    # True iff comments from DOM content are included in the output
+    __withComments = False
+
+    # The namespace bindings rendered in the output by each open element,
+    # outermost first, as maps from prefix (None for the default) to URI.
+    __rendered = None
+
+    def __init__ (self, inclusive_prefixes=None, with_comments=False, **kw):
+        """Create a new instance.
+
+        @keyword inclusive_prefixes: The prefixes from the
+        C{InclusiveNamespaces PrefixList} parameter of the transform.  Use
+        C{'#default'} for the default namespace.  Namespaces with these
+        prefixes are treated as they would be by inclusive canonicalization.
+
+        @keyword with_comments: If C{True}, comments in DOM content held by
+        the instance are retained.
+
+        Other keywords are as for L{BindingDOMSupport}.
+        """
+        super(BindingC14NWriter, self).__init__(**kw)
+        if isinstance(inclusive_prefixes, six.string_types):
+            inclusive_prefixes = inclusive_prefixes.split()
+        self.__inclusivePrefixes = frozenset([ (None if '#default' == _p else _p) for _p in (inclusive_prefixes or ()) ])
+        self.__withComments = with_comments
+
+    def reset (self):
+        super(BindingC14NWriter, self).reset()
+        self.__rendered = [ { None: '' } ]
+
+    def __namespaceURI (self, element, prefix):
+        if pyxb.namespace.XML.boundPrefix() == prefix:
+            return pyxb.namespace.XML.uri()
+        ns = element.namespaces.get(prefix)
+        if ns is None:
+            return ''
+        return ns.uri()
+
+    def _startTag (self, element, empty):
+        utilized = set(self.__inclusivePrefixes.intersection(element.namespaces))
+        if ':' in element.name:
+            utilized.add(element.name.split(':', 1)[0])
+        else:
+            utilized.add(None)
+        attributes = []
+        for (an, av) in six.iteritems(element.attributes):
+            if ('xmlns' == an) or an.startswith('xmlns:'):
+                continue
+            if ':' in an:
+                (prefix, local_name) = an.split(':', 1)
+                utilized.add(prefix)
+                attributes.append(((self.__namespaceURI(element, prefix), local_name), an, av))
+            else:
+                attributes.append((('', an), an, av))
+        utilized.discard(pyxb.namespace.XML.boundPrefix())
+        rendered = self.__rendered[-1]
+        declarations = []
+        for prefix in utilized:
+            uri = self.__namespaceURI(element, prefix)
+            if rendered.get(prefix, '') != uri:
+                declarations.append((prefix, uri))
+        text = [ '<', element.name ]
+        if declarations:
+            rendered = rendered.copy()
+            for (prefix, uri) in sorted(declarations, key=lambda _d: (_d[0] is not None, _d[0])):
+                rendered[prefix] = uri
+                if prefix is None:
+                    text.extend([ ' xmlns="', _EscapeC14NAttribute(uri), '"' ])
+                else:
+                    text.extend([ ' xmlns:', prefix, '="', _EscapeC14NAttribute(uri), '"' ])
+        for (_, an, av) in sorted(attributes, key=lambda _a: _a[0]):
+            text.extend([ ' ', an, '="', _EscapeC14NAttribute(av), '"' ])
+        text.append('>')
+        if empty:
+            text.extend([ '</', element.name, '>' ])
+        else:
+            self.__rendered.append(rendered)
+        return ''.join(text)
+
+    def _endTag (self, element):
+        self.__rendered.pop()
+        return '</%s>' % (element.name,)
+
+    def _textContent (self, text):
+        return _EscapeC14NText(text)
+
+    def _comment (self, data):
+        if self.__withComments:
+            return '<!--%s-->' % (data,)
+        return ''
+
+    def write (self, instance, stream, encoding='utf-8', xml_declaration=False, element_name=None):
+        """Write the canonical form of the binding instance to the stream.
+
+        The canonical form is bytes in UTF-8; C{encoding} is accepted for
+        compatibility with L{BindingXMLWriter.write} but must be C{None} or
+        C{'utf-8'}, and C{xml_declaration} must be C{False}."""
+        super(BindingC14NWriter, self).write(instance, stream, encoding=self.__checkEncoding(encoding, xml_declaration), xml_declaration=False, element_name=element_name)
+
+    def iterwrite (self, instance, chunk_size=None, encoding='utf-8', xml_declaration=False, element_name=None):
+        """Generate the canonical form of the binding instance in chunks.
+
+        Arguments are as for L{BindingXMLWriter.iterwrite}, with the
+        restrictions described in L{write}."""
+        return super(BindingC14NWriter, self).iterwrite(instance, chunk_size=chunk_size, encoding=self.__checkEncoding(encoding, xml_declaration), xml_declaration=False, element_name=element_name)
+
+    def __checkEncoding (self, encoding, xml_declaration):
+        if xml_declaration:
+            raise pyxb.UsageError('Canonical XML has no XML declaration')
+        if (encoding is not None) and ('utf-8' != codecs.lookup(encoding).name):
+            raise pyxb.UsageError('Canonical XML is encoded in UTF-8, not %s' % (encoding,))
+        return 'utf-8'
+
+    def canonicalize (self, instance, element_name=None):
+        """Return the canonical form of the binding instance as bytes."""
+        chunks = []
+        self.write(instance, _CallbackStream(chunks.append), element_name=element_name)
+        return six.b('').join(chunks)
+
+    def digest (self, instance, hash_object, element_name=None):
+        """Add the canonical form of the binding instance to a hash.
+
+        The canonical form is passed to the hash in pieces of about
+        L{BufferSize} characters, and is never held in memory as a whole.
+
+        @param hash_object: An object with an C{update} method, such as the
+        value of C{hashlib.sha256()}.
+        @return: C{hash_object}
+        """
+        self.write(instance, _CallbackStream(hash_object.update), element_name=element_name)
+        return hash_object
+
 ## Local Variables:
 ## fill-column:78
 ## End:
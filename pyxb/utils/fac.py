@@ -59,6 +59,7 @@ retained between matches.
 
 import operator
 import functools
+import collections
 import logging
 from pyxb.utils import six
 from pyxb.utils.six.moves import xrange
@@ -343,6 +344,28 @@ class State (object):
                 seen.add(xit)
                 self.__transitionSet.append(xit)
 
+    __transitionTable = None
+    def __get_transitionTable (self):
+        """A precomputed map from symbol keys to transitions out of this state.
+
+        This is C{None} unless the automaton was compiled (see
+        L{Automaton.isCompiled}).  When present, each key identifies the
+        symbol consumed by exactly one member of L{transitionSet}, so at
+        most one transition is viable for any key.  The counter update
+        instructions of the transition must still be checked."""
+        return self.__transitionTable
+    transitionTable = property(__get_transitionTable)
+
+    def _set_transitionTable (self, transition_table):
+        """Method invoked during automaton construction to record the
+        precomputed transitions out of this state.
+
+        @param transition_table: a map from an application-specific key
+        identifying a consumed symbol to the member of L{transitionSet}
+        that consumes that symbol."""
+        assert self.__subAutomata is None
+        self.__transitionTable = transition_table
+
     def match (self, symbol):
         """Return C{True} iff the symbol matches for this state.
 
@@ -762,6 +785,75 @@ class Transition (object):
             rv.append(str(self.__nextTransition))
         return ''.join(rv)
 
+class TransitionCache (object):
+    """A bounded map from the situation of a configuration to its candidate
+    transitions.
+
+    The situation comprises the configuration state, the values of the
+    automaton counters, and an application-specific key standing for the
+    symbol being consumed.  When the same situation recurs, as it does when
+    a large number of similar documents or repeated elements are processed,
+    the candidate transitions can be reused without being recalculated.
+    When the cache is full the least recently used entry is discarded.
+
+    See L{Automaton.enableTransitionCache}."""
+
+    __maxSize = None
+    def __get_maxSize (self):
+        """The maximum number of situations retained in the cache."""
+        return self.__maxSize
+    maxSize = property(__get_maxSize)
+
+    __hits = None
+    def __get_hits (self):
+        """The number of lookups that found a cached value."""
+        return self.__hits
+    hits = property(__get_hits)
+
+    __misses = None
+    def __get_misses (self):
+        """The number of lookups that did not find a cached value."""
+        return self.__misses
+    misses = property(__get_misses)
+
+    def __init__ (self, max_size):
+        """Create an empty cache.
+
+        @param max_size: The value for L{maxSize}.  Must be positive."""
+        if not (0 < max_size):
+            raise ValueError(max_size)
+        self.__maxSize = max_size
+        self.clear()
+
+    def clear (self):
+        """Discard all cached values and reset the statistics."""
+        self.__entries = collections.OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__ (self):
+        return len(self.__entries)
+
+    def lookup (self, key):
+        """Return the value cached for C{key}, or C{None} if there is none."""
+        value = self.__entries.pop(key, None)
+        if value is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__entries[key] = value
+        return value
+
+    def store (self, key, value):
+        """Cache C{value} for C{key}, discarding the least recently used
+        entry if the cache is full."""
+        if len(self.__entries) >= self.__maxSize:
+            self.__entries.popitem(last=False)
+        self.__entries[key] = value
+
+    def __str__ (self):
+        return 'TC{%u/%u, %u hits, %u misses}' % (len(self.__entries), self.__maxSize, self.__hits, self.__misses)
+
 class Configuration_ABC (object):
     """Base class for something that represents an L{Automaton} in
     execution.
@@ -949,6 +1041,28 @@ class Configuration (Configuration_ABC):
     def satisfies (self, transition):
         return UpdateInstruction.Satisfies(self.__counterValues, transition.updateInstructions)
 
+    def tableTransition (self, key):
+        """Return the viable transition that consumes the symbol identified
+        by C{key}, using the precomputed tables of a compiled automaton.
+
+        This is equivalent to, but much cheaper than, invoking
+        L{candidateTransitions} with a symbol that only the states associated
+        with C{key} will match.
+
+        @param key: A key of the sort used in L{State.transitionTable}.
+
+        @return: A L{Transition}, or C{None} if no transition on C{key} is
+        permitted from the current configuration."""
+        assert self.__automaton.isCompiled
+        if self.__state is None:
+            table = self.__automaton.initialTransitionTable
+        else:
+            table = self.__state.transitionTable
+        transition = table.get(key)
+        if (transition is None) or not UpdateInstruction.Satisfies(self.__counterValues, transition.updateInstructions):
+            return None
+        return transition
+
     def reset (self):
         fac = self.__automaton
         self.__state = None
@@ -956,7 +1070,7 @@ class Configuration (Configuration_ABC):
         self.__subConfiguration = None
         self.__subAutomata = None
 
-    def candidateTransitions (self, symbol=None):
+    def candidateTransitions (self, symbol=None, symbol_key=None):
         """Return list of viable transitions on C{symbol}
 
         The transitions that are structurally permitted from this
@@ -970,6 +1084,14 @@ class Configuration (Configuration_ABC):
         of transitions should ignore the symbol; candidates are still
         filtered based on the counter state of the configuration.
 
+        @keyword symbol_key: An optional hashable value that determines
+        which states will L{match<State.match>} C{symbol}: any two symbols
+        with the same key must be matched by exactly the same states.  If
+        provided, and the automaton has a L{transition
+        cache<Automaton.enableTransitionCache>}, the result is cached for
+        reuse.  Configurations that are executing within or have entered
+        sub-automata are not cached.
+
         @return: A list of L{Transition} instances permitted from the
         current configuration.  If C{symbol} is not C{None},
         transitions that would not accept the symbol are excluded.
@@ -977,6 +1099,18 @@ class Configuration (Configuration_ABC):
         update is also excluded.  Non-deterministic automata may
         result in a lits with multiple members. """
 
+        fac = self.__automaton
+        cache = fac.transitionCache
+        if (cache is not None) and (symbol_key is not None) and (self.__superConfiguration is None) and (self.__subConfiguration is None) and not self.__subAutomata:
+            key = (self.__state, fac._counterSignature(self.__counterValues), symbol_key)
+            transitions = cache.lookup(key)
+            if transitions is None:
+                transitions = self.__candidateTransitions(symbol)
+                cache.store(key, transitions)
+            return transitions[:]
+        return self.__candidateTransitions(symbol)
+
+    def __candidateTransitions (self, symbol):
         fac = self.__automaton
         transitions = []
         if symbol is None:
@@ -1226,6 +1360,7 @@ class Automaton (object):
         for st in self.__states:
             st._set_automaton(self)
         self.__counterConditions = frozenset(counter_conditions)
+        self.__counterOrder = tuple(self.__counterConditions)
         self.__nullable = nullable
         self.__containingState = containing_state
         xit = []
@@ -1240,6 +1375,86 @@ class Automaton (object):
         self.__initialTransitions = xit
         self.__finalStates = frozenset(fnl)
 
+    __initialTransitionTable = None
+    def __get_initialTransitionTable (self):
+        """A precomputed map from symbol keys to L{initialTransitions}.
+
+        This is C{None} unless the automaton is compiled.  See
+        L{State.transitionTable}."""
+        return self.__initialTransitionTable
+    initialTransitionTable = property(__get_initialTransitionTable)
+
+    def __get_isCompiled (self):
+        """C{True} iff transition tables have been provided for this
+        automaton.
+
+        A compiled automaton is deterministic in the sense that, for any
+        configuration, at most one transition consumes a symbol identified
+        by a given key.  It does not have sub-automata, and every state has
+        a L{State.transitionTable}, so L{Configuration.tableTransition} may
+        be used in place of L{Configuration.candidateTransitions}.  Only the
+        tool generating the automaton can identify the keys, so compilation
+        must be requested through L{_set_initialTransitionTable}."""
+        return self.__initialTransitionTable is not None
+    isCompiled = property(__get_isCompiled)
+
+    def _set_initialTransitionTable (self, initial_table):
+        """Method invoked during automaton construction to record the
+        precomputed transitions into the automaton.
+
+        The transition tables for each state must already have been set
+        with L{State._set_transitionTable}.
+
+        @param initial_table: a map from an application-specific key
+        identifying a consumed symbol to the initial L{State} which
+        consumes that symbol."""
+        assert self.__containingState is None
+        table = {}
+        for (key, st) in six.iteritems(initial_table):
+            assert st.isInitial and (st.subAutomata is None)
+            assert st.transitionTable is not None
+            (table[key],) = st.automatonEntryTransitions
+        self.__initialTransitionTable = table
+        return self
+
+    __transitionCache = None
+    def __get_transitionCache (self):
+        """The L{TransitionCache} used by configurations of this automaton.
+
+        This is C{None} unless L{enableTransitionCache} has been invoked."""
+        return self.__transitionCache
+    transitionCache = property(__get_transitionCache)
+
+    DefaultTransitionCacheSize = 1024
+    """The default number of situations retained by a transition cache."""
+
+    def enableTransitionCache (self, max_size=None):
+        """Cache the candidate transitions computed by configurations of this
+        automaton.
+
+        Caching is opt-in: it benefits automata that are executed many
+        times, but costs memory and the calculation of a cache key on each
+        step.  The effectiveness of the cache can be determined from its
+        L{hits<TransitionCache.hits>} and L{misses<TransitionCache.misses>}.
+
+        @keyword max_size: The maximum number of entries in the cache.
+        Defaults to L{DefaultTransitionCacheSize}.
+
+        @return: The L{TransitionCache} instance.  If the cache was already
+        enabled it is cleared and resized."""
+        if max_size is None:
+            max_size = self.DefaultTransitionCacheSize
+        self.__transitionCache = TransitionCache(max_size)
+        return self.__transitionCache
+
+    def disableTransitionCache (self):
+        """Discard any transition cache for this automaton."""
+        self.__transitionCache = None
+
+    def _counterSignature (self, counter_values):
+        """Return a hashable representation of the counter values."""
+        return tuple([ counter_values[_cc] for _cc in self.__counterOrder ])
+
     def newConfiguration (self):
         """Return a new L{Configuration} instance for this automaton."""
         return Configuration(self)
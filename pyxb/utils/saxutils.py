@@ -208,9 +208,29 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
     __locationTemplate = None
 
     def location (self):
-        """Return the current location within the SAX-processed document."""
+        """Return the current location within the SAX-processed document.
+
+        @return: An instance of L{pyxb.utils.utility.Location}, or C{None} if
+        the handler does not L{track locations<tracksLocations>}."""
+        if not self.__trackLocations:
+            return None
+        return self.__locationTemplate.newLocation(self.__locator)
+
+    def currentLocation (self):
+        """Return the current location within the SAX-processed document
+        whether or not the handler L{tracks locations<tracksLocations>}.
+
+        This is used to describe the position of an error."""
         return self.__locationTemplate.newLocation(self.__locator)
 
+    # If False, location() returns None, so no location objects are
+    # allocated for element states, text, or binding instances.
+    def tracksLocations (self):
+        """C{True} iff a location is recorded for each element, text item,
+        and binding instance."""
+        return self.__trackLocations
+    __trackLocations = True
+
     # The callable that creates an instance of (a subclass of)
     # L{SAXElementState} as required to hold element-specific information as
     # parsing proceeds.
@@ -309,12 +329,18 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
         @keyword location_base: An object to be recorded as the base of all
         L{pyxb.utils.utility.Location} instances associated with events and
         objects handled by the parser.
+
+        @keyword track_locations: If C{False}, locations are not recorded
+        for elements, text, or binding instances, which saves an allocation
+        per event.  Errors detected while parsing are still given the
+        location at which they were detected.  The default is C{True}.
         """
         self.__includingContext = kw.pop('including_context', None)
         self.__fallbackNamespace = kw.pop('fallback_namespace', None)
         self.__elementStateConstructor = kw.pop('element_state_constructor', SAXElementState)
         self.__targetNamespace = kw.pop('target_namespace', None)
         self.__locationTemplate = pyxb.utils.utility.Location(kw.pop('location_base', None))
+        self.__trackLocations = kw.pop('track_locations', True)
 
     def setDocumentLocator (self, locator):
         """Save the locator object."""
@@ -1019,6 +1019,32 @@ class UTCOffsetTimeZone (datetime.tzinfo):
         else:
             self.__tzName = '+%02d:%02d' % divmod(self.__utcOffset_min, 60)
 
+    # Shared instances, keyed by offset in minutes and by the specification
+    # used to request them.
+    __SharedByOffset = { }
+    __SharedBySpec = { }
+
+    @classmethod
+    def Shared (cls, spec=None):
+        """Return the shared instance with the offset from UTC given by
+        C{spec}.
+
+        Instances are immutable, so values with the same offset can use the
+        same one.  This avoids parsing the specification and creating a new
+        instance for each of many values, e.g. when converting the
+        timestamps in a document.  There is one shared instance for each
+        offset, however it is specified.
+
+        @param spec: As for the constructor.
+        @raise ValueError: as for the constructor.
+        """
+        rv = cls.__SharedBySpec.get(spec)
+        if rv is None:
+            tz = cls(spec)
+            rv = cls.__SharedByOffset.setdefault(tz.__utcOffset_min, tz)
+            cls.__SharedBySpec[spec] = rv
+        return rv
+
     def utcoffset (self, dt):
         """Returns the constant offset for this zone."""
         return self.__utcOffset_td
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Compare the time to convert date and time lexical values using the
+# specialized parsers and the general regular expression.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import sys
+import time
+import pyxb.binding.datatypes as xsd
+from pyxb.utils.six.moves import xrange
+
+num_values = 100000
+if 1 < len(sys.argv):
+    num_values = int(sys.argv[1])
+
+samples = {
+    xsd.dateTime: [ '2014-03-%02dT%02d:%02d:%02d%s' % (1 + _i % 28, _i % 24, _i % 60, (7 * _i) % 60, ('', 'Z', '.125Z', '+05:30')[_i % 4]) for _i in xrange(num_values) ],
+    xsd.date: [ '2014-%02d-%02d%s' % (1 + _i % 12, 1 + _i % 28, ('', 'Z')[_i % 2]) for _i in xrange(num_values) ],
+    xsd.time: [ '%02d:%02d:%02d%s' % (_i % 24, _i % 60, (7 * _i) % 60, ('', '.5', 'Z', '-08:00')[_i % 4]) for _i in xrange(num_values) ],
+}
+
+def timeParse (cls, values):
+    parse = cls._LexicalToKeywords
+    t0 = time.time()
+    for v in values:
+        parse(v)
+    t1 = time.time()
+    for v in values:
+        cls(v)
+    t2 = time.time()
+    return (t1 - t0, t2 - t1)
+
+def general (cls, text):
+    return None
+
+print('%d values of each type' % (num_values,))
+print('%-10s %12s %12s %12s %12s' % ('type', 'regex parse', 'fast parse', 'regex ctor', 'fast ctor'))
+for cls in (xsd.dateTime, xsd.date, xsd.time):
+    values = samples[cls]
+    fast = timeParse(cls, values)
+    cls._FastLexicalToKeywords = classmethod(general)
+    try:
+        regex = timeParse(cls, values)
+    finally:
+        del cls._FastLexicalToKeywords
+    print('%-10s %11.3fs %11.3fs %11.3fs %11.3fs' % (cls.__name__, regex[0], fast[0], regex[1], fast[1]))
@@ -70,6 +70,37 @@ class Test_dateTime (unittest.TestCase):
         dt = xsd.dateTime(2000, 3, 4, 23, tzinfo=UTCOffsetTimeZone(180))
         self.assertEqual('2000-03-04T20:00:00Z', dt.xsdLiteral())
 
+    def testFastParse (self):
+        # The specialized parser produces what the regular expression does
+        def keywords (text):
+            kw = xsd.dateTime._LexicalToKeywords(text)
+            if 'tzinfo' in kw:
+                kw['tzinfo'] = kw['tzinfo'].utcoffset(None)
+            return kw
+        for text in ('2002-10-27T12:14:32', '2002-10-27T12:14:32.1234', '2002-10-27T12:14:32.1234567', '2002-10-27T12:14:32Z', '2002-10-27T12:14:32.5-05:30'):
+            fast = keywords(text)
+            xsd.dateTime._FastLexicalToKeywords = classmethod(lambda _c, _t: None)
+            try:
+                self.assertEqual(keywords(text), fast)
+            finally:
+                del xsd.dateTime._FastLexicalToKeywords
+        self.assertEqual(123457, xsd.dateTime('2002-10-27T12:14:32.1234567').microsecond)
+        self.assertEqual(-24, xsd.dateTime._LexicalToKeywords('-0024-01-01T00:00:00')['year'])
+        self.assertEqual(12002, xsd.dateTime._LexicalToKeywords('12002-01-01T00:00:00')['year'])
+        for text in ('2002-10-27T12:14:32.', '2002-10-27T12:14:32.1234+05', '2002-1a-27T12:14:32', '2002-10-27T12:14:32+05-00'):
+            self.assertRaises(pyxb.SimpleTypeValueError, xsd.dateTime, text)
+
+    def testSharedTimeZone (self):
+        self.assertTrue(xsd.dateTime('2002-10-27T12:14:32Z').tzinfo is xsd.dateTime('2003-01-02T00:00:00+05:00').tzinfo)
+        pyxb.PreserveInputTimeZone(True)
+        try:
+            a = xsd.dateTime('2002-10-27T12:14:32+05:00')
+            b = xsd.dateTime('2003-01-02T00:00:00.5+05:00')
+        finally:
+            pyxb.PreserveInputTimeZone(False)
+        self.assertEqual('+05:00', a.tzinfo.tzname(a))
+        self.assertTrue(a.tzinfo is b.tzinfo)
+
     # Manual test to see whether LocalTime works; run this on a
     # machine that uses DST.
     def XtestBogus (self):
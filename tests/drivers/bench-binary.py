@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Compare the size of a document and the time to produce and consume it as
+# XML text, compressed XML text, and the binary representation.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import gzip
+import io
+import sys
+import time
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.binary
+from pyxb.utils.six.moves import xrange
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="log">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="entry" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="when" type="xs:dateTime"/>
+              <xs:element name="source" type="xs:string"/>
+              <xs:element name="reading" type="xs:double"/>
+              <xs:element name="count" type="xs:int"/>
+              <xs:element name="ok" type="xs:boolean"/>
+            </xs:sequence>
+            <xs:attribute name="seq" type="xs:long"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_entries = 10000
+if 1 < len(sys.argv):
+    num_entries = int(sys.argv[1])
+xmld = ''.join([ '<log>' ]
+               + [ '<entry seq="%d"><when>2014-03-%02dT%02d:%02d:%02dZ</when><source>sensor-%d</source><reading>%d.125</reading><count>%d</count><ok>%s</ok></entry>' % (_i, 1 + _i % 28, _i % 24, _i % 60, _i % 60, _i % 16, _i, _i % 1000, ('true', 'false')[_i % 2]) for _i in xrange(num_entries) ]
+               + [ '</log>' ]).encode('utf-8')
+instance = CreateFromDocument(xmld)
+
+def gzipped (data):
+    stream = io.BytesIO()
+    with gzip.GzipFile(fileobj=stream, mode='wb') as gz:
+        gz.write(data)
+    return stream.getvalue()
+
+def gunzipped (data):
+    with gzip.GzipFile(fileobj=io.BytesIO(data), mode='rb') as gz:
+        return gz.read()
+
+def best (fn):
+    dt = None
+    for _ in xrange(3):
+        t0 = time.time()
+        rv = fn()
+        t1 = time.time() - t0
+        if (dt is None) or (t1 < dt):
+            dt = t1
+    return (dt, rv)
+
+xml = instance.toxml('utf-8')
+data = pyxb.binding.binary.encode(instance)
+assert pyxb.binding.binary.decode(data, default_namespace=Namespace).toxml('utf-8') == xml
+
+print('%d entries' % (num_entries,))
+print('%-12s %10s %10s %10s' % ('format', 'bytes', 'write s', 'read s'))
+for (label, write, read) in (('xml', lambda: instance.toxml('utf-8'), lambda: CreateFromDocument(xml)),
+                             ('xml+gzip', lambda: gzipped(instance.toxml('utf-8')), lambda: CreateFromDocument(gunzipped(xml_gz))),
+                             ('binary', lambda: pyxb.binding.binary.encode(instance), lambda: pyxb.binding.binary.decode(data, default_namespace=Namespace)),
+                             ('binary+gzip', lambda: gzipped(pyxb.binding.binary.encode(instance)), lambda: pyxb.binding.binary.decode(gunzipped(data_gz), default_namespace=Namespace))):
+    (write_s, output) = best(write)
+    if 'xml+gzip' == label:
+        xml_gz = output
+    elif 'binary+gzip' == label:
+        data_gz = output
+    (read_s, _) = best(read)
+    print('%-12s %10d %10.3f %10.3f' % (label, len(output), write_s, read_s))
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Compare the time to convert a long coordinate list to and from text, and
+# the memory it occupies, with items held as bindings and as plain numbers.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import gc
+import sys
+import time
+import pyxb.binding.generate
+from pyxb.utils.six.moves import xrange
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="doubleList">
+    <xs:list itemType="xs:double"/>
+  </xs:simpleType>
+  <xs:element name="posList" type="doubleList"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_values = 200000
+if 1 < len(sys.argv):
+    num_values = int(sys.argv[1])
+
+xmlt = '<posList>%s</posList>' % (' '.join([ '%.6f' % (_i * 0.125 - 1000.0,) for _i in xrange(num_values) ]),)
+
+def itemSize (value):
+    size = sys.getsizeof(value)
+    for v in value:
+        size += sys.getsizeof(v)
+        d = getattr(v, '__dict__', None)
+        if d is not None:
+            size += sys.getsizeof(d)
+    return size
+
+def measure ():
+    gc.collect()
+    t0 = time.time()
+    instance = CreateFromDocument(xmlt)
+    t1 = time.time()
+    text = instance.toxml('utf-8')
+    t2 = time.time()
+    return (t1 - t0, t2 - t1, itemSize(instance))
+
+print('%d values' % (num_values,))
+print('%-10s %10s %10s %12s' % ('items', 'parse', 'toxml', 'bytes'))
+for compact in (False, True):
+    doubleList._SetCompactItems(compact)
+    (parse, toxml, size) = measure()
+    print('%-10s %9.3fs %9.3fs %12d' % (compact and 'compact' or 'bindings', parse, toxml, size))
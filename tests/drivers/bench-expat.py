@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Compare the cost of converting documents to bindings through xml.sax with
+# the cost of driving the same handler directly from pyexpat.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import io
+import sys
+import time
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.saxutils
+from pyxb.utils.six.moves import xrange
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="catalog">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="name" type="xs:string"/>
+              <xs:element name="price" type="xs:decimal"/>
+            </xs:sequence>
+            <xs:attribute name="id" type="xs:int"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_items = 10000
+if 1 < len(sys.argv):
+    num_items = int(sys.argv[1])
+xmld = ''.join([ '<catalog>' ]
+               + [ '<item id="%d"><name>n%d</name><price>%d.25</price></item>' % (_i, _i, _i) for _i in xrange(num_items) ]
+               + [ '</catalog>' ]).encode('utf-8')
+num_elements = 1 + 3 * num_items
+
+def timeParse (label, fn, reps=3):
+    dt = None
+    for _ in xrange(reps):
+        t0 = time.time()
+        fn()
+        t1 = time.time() - t0
+        if (dt is None) or (t1 < dt):
+            dt = t1
+    print('%-24s %8.3f s %8.2f us/element' % (label, dt, 1e6 * dt / num_elements))
+    return dt
+
+print('%d elements, %d bytes' % (num_elements, len(xmld)))
+
+def noopSAX ():
+    saxer = pyxb.utils.saxutils.make_parser(content_handler=pyxb.utils.saxutils._NoopSAXHandler())
+    saxer.parse(io.BytesIO(xmld))
+def noopExpat ():
+    pyxb.binding.saxer.ExpatParser(pyxb.utils.saxutils._NoopSAXHandler()).parse(xmld)
+sax_dt = timeParse('dispatch (xml.sax)', noopSAX)
+expat_dt = timeParse('dispatch (expat)', noopExpat)
+print('dispatch overhead removed: %.2f us/element' % (1e6 * (sax_dt - expat_dt) / num_elements,))
+
+bindings = {}
+def bindStyle (style):
+    pyxb._SetXMLStyle(style)
+    try:
+        bindings[style] = CreateFromDocument(xmld)
+    finally:
+        pyxb._SetXMLStyle()
+sax_dt = timeParse('bindings (saxer)', lambda: bindStyle(pyxb.XMLStyle_saxer))
+expat_dt = timeParse('bindings (expat)', lambda: bindStyle(pyxb.XMLStyle_expat))
+print('binding overhead removed: %.2f us/element' % (1e6 * (sax_dt - expat_dt) / num_elements,))
+assert bindings[pyxb.XMLStyle_saxer].toxml('utf-8') == bindings[pyxb.XMLStyle_expat].toxml('utf-8')
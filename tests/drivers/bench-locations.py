@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Compare time and memory for converting a large document with and without
+# per-event location tracking.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import gc
+import sys
+import time
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+from pyxb.utils.six.moves import xrange
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="catalog">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="name" type="xs:string"/>
+              <xs:element name="price" type="xs:decimal"/>
+            </xs:sequence>
+            <xs:attribute name="id" type="xs:int"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_items = 10000
+if 1 < len(sys.argv):
+    num_items = int(sys.argv[1])
+xmld = ''.join([ '<catalog>\n' ]
+               + [ '<item id="%d"><name>n%d</name><price>%d.25</price></item>\n' % (_i, _i, _i) for _i in xrange(num_items) ]
+               + [ '</catalog>' ]).encode('utf-8')
+
+def parse (track_locations):
+    parser = pyxb.binding.saxer.PushParser(fallback_namespace=Namespace.fallbackNamespace(), track_locations=track_locations)
+    parser.feed(xmld)
+    return parser.close()
+
+print('%d items, %d bytes' % (num_items, len(xmld)))
+for track_locations in (True, False):
+    dt = None
+    for _ in xrange(3):
+        t0 = time.time()
+        parse(track_locations)
+        t1 = time.time() - t0
+        if (dt is None) or (t1 < dt):
+            dt = t1
+    memory = 'n/a'
+    if tracemalloc is not None:
+        gc.collect()
+        tracemalloc.start()
+        instance = parse(track_locations)
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = '%.1f MB retained, %.1f MB peak' % (current / 1e6, peak / 1e6)
+        del instance
+    print('track_locations=%-5s %8.3f s  %s' % (track_locations, dt, memory))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Compare time and memory for serializing a large document through a DOM
+# tree and through the streaming writer.
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import gc
+import io
+import sys
+import time
+import pyxb
+import pyxb.binding.generate
+import pyxb.utils.domutils
+from pyxb.utils.six.moves import xrange
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="catalog">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="name" type="xs:string"/>
+              <xs:element name="price" type="xs:decimal"/>
+            </xs:sequence>
+            <xs:attribute name="id" type="xs:int"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_items = 10000
+if 1 < len(sys.argv):
+    num_items = int(sys.argv[1])
+xmld = ''.join([ '<catalog>' ]
+               + [ '<item id="%d"><name>n%d</name><price>%d.25</price></item>' % (_i, _i, _i) for _i in xrange(num_items) ]
+               + [ '</catalog>' ]).encode('utf-8')
+instance = CreateFromDocument(xmld)
+
+def viaDOM ():
+    stream = io.BytesIO()
+    stream.write(instance.toxml('utf-8'))
+    return stream
+
+def viaWriter ():
+    stream = io.BytesIO()
+    instance.toxml('utf-8', stream=stream)
+    return stream
+
+print('%d items, %d bytes' % (num_items, len(xmld)))
+assert viaDOM().getvalue() == viaWriter().getvalue()
+for (label, fn) in (('dom', viaDOM), ('writer', viaWriter)):
+    dt = None
+    for _ in xrange(3):
+        t0 = time.time()
+        fn()
+        t1 = time.time() - t0
+        if (dt is None) or (t1 < dt):
+            dt = t1
+    memory = 'n/a'
+    if tracemalloc is not None:
+        gc.collect()
+        tracemalloc.start()
+        stream = fn()
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = '%.1f MB peak' % (peak / 1e6,)
+        del stream
+    print('%-6s %8.3f s  %s' % (label, dt, memory))
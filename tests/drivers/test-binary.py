@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.binary
+import pyxb.utils.domutils
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:binary" targetNamespace="urn:binary" elementFormDefault="qualified">
+  <xs:simpleType name="tList">
+    <xs:list itemType="xs:int"/>
+  </xs:simpleType>
+  <xs:simpleType name="tUnion">
+    <xs:union memberTypes="xs:int xs:boolean"/>
+  </xs:simpleType>
+  <xs:simpleType name="tColor">
+    <xs:restriction base="xs:string">
+      <xs:enumeration value="red"/>
+      <xs:enumeration value="green"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tDerived">
+    <xs:complexContent>
+      <xs:extension base="tns:tBase">
+        <xs:sequence>
+          <xs:element name="extra" type="xs:int"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:complexType name="tMeasure">
+    <xs:simpleContent>
+      <xs:extension base="xs:double">
+        <xs:attribute name="unit" type="xs:string"/>
+      </xs:extension>
+    </xs:simpleContent>
+  </xs:complexType>
+  <xs:complexType name="tPara" mixed="true">
+    <xs:sequence>
+      <xs:element name="em" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="head" type="xs:string"/>
+  <xs:element name="member" type="xs:string" substitutionGroup="tns:head"/>
+  <xs:element name="note" type="xs:string"/>
+  <xs:element name="record">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="count" type="xs:long"/>
+        <xs:element name="delta" type="xs:int" minOccurs="0"/>
+        <xs:element name="ratio" type="xs:double" minOccurs="0"/>
+        <xs:element name="flag" type="xs:boolean" minOccurs="0"/>
+        <xs:element name="when" type="xs:dateTime" minOccurs="0" maxOccurs="unbounded"/>
+        <xs:element name="day" type="xs:date" minOccurs="0"/>
+        <xs:element name="amount" type="xs:decimal" minOccurs="0"/>
+        <xs:element name="text" type="xs:string" minOccurs="0"/>
+        <xs:element name="blob" type="xs:base64Binary" minOccurs="0"/>
+        <xs:element name="ints" type="tns:tList" minOccurs="0"/>
+        <xs:element name="either" type="tns:tUnion" minOccurs="0"/>
+        <xs:element name="color" type="tns:tColor" minOccurs="0"/>
+        <xs:element name="ref" type="xs:QName" minOccurs="0"/>
+        <xs:element name="missing" type="xs:int" nillable="true" minOccurs="0"/>
+        <xs:element name="base" type="tns:tBase" minOccurs="0" maxOccurs="unbounded"/>
+        <xs:element name="measure" type="tns:tMeasure" minOccurs="0"/>
+        <xs:element name="para" type="tns:tPara" minOccurs="0"/>
+        <xs:element ref="tns:head" minOccurs="0"/>
+        <xs:element name="extension">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:any processContents="lax" minOccurs="0" maxOccurs="unbounded"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:int" use="required"/>
+      <xs:attribute name="label" type="xs:string"/>
+      <xs:anyAttribute namespace="##other" processContents="lax"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestBinary (unittest.TestCase):
+    xmlt = '''<record xmlns="urn:binary" xmlns:o="urn:other" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" id="7" label="l&amp;l" o:extra="x">
+<count>-1234567890123</count><delta>-5</delta><ratio>0.1</ratio><flag>true</flag>
+<when>2014-03-07T12:34:56.5Z</when><when>1999-12-31T23:59:59</when>
+<day>2014-03-07</day><amount>-12.340</amount><text>café &lt;b&gt;</text><blob>AAEC/w==</blob>
+<ints>1 -2 3</ints><either>true</either><color>green</color><ref>o:name</ref><missing xsi:nil="true"/>
+<base><name>one</name></base><base xsi:type="tDerived"><name>two</name><extra>2</extra></base>
+<measure unit="m">1.5</measure><para>Text <em>with</em> markup</para><member>substitute</member>
+<extension><note>known</note><o:unknown a="1">other <o:x/></o:unknown></extension>
+</record>'''
+
+    def setUp (self):
+        # Suppress the warning about a DOM node in the wildcard content
+        self.__basisLog = logging.getLogger('pyxb.binding.basis')
+        self.__basisLevel = self.__basisLog.level
+        self.__basisLog.setLevel(logging.ERROR)
+
+    def tearDown (self):
+        self.__basisLog.setLevel(self.__basisLevel)
+
+    def assertRoundTrip (self, instance):
+        data = pyxb.binding.binary.encode(instance)
+        self.assertTrue(isinstance(data, bytes))
+        decoded = pyxb.binding.binary.decode(data)
+        self.assertEqual(type(instance), type(decoded))
+        self.assertEqual(instance.toxml('utf-8'), decoded.toxml('utf-8'))
+        return (data, decoded)
+
+    def testDocument (self):
+        instance = CreateFromDocument(self.xmlt)
+        (data, decoded) = self.assertRoundTrip(instance)
+        self.assertEqual(-1234567890123, decoded.count)
+        self.assertEqual(0.1, decoded.ratio)
+        self.assertTrue(decoded.flag)
+        self.assertEqual(instance.when[0], decoded.when[0])
+        self.assertEqual(None, decoded.when[1].tzinfo)
+        self.assertEqual('café <b>', decoded.text)
+        self.assertEqual(b'\x00\x01\x02\xff', decoded.blob)
+        self.assertEqual([1, -2, 3], list(decoded.ints))
+        self.assertEqual(pyxb.namespace.ExpandedName('urn:other', 'name'), decoded.ref)
+        self.assertTrue(decoded.missing._isNil())
+        self.assertEqual(tDerived, type(decoded.base[1]))
+        self.assertEqual('m', decoded.measure.unit)
+        self.assertEqual(member, decoded.head._element())
+        self.assertEqual(2, len(decoded.extension.wildcardElements()))
+        self.assertEqual('x', decoded.wildcardAttributeMap()[pyxb.namespace.ExpandedName('urn:other', 'extra')])
+        self.assertTrue(len(data) < len(self.xmlt.encode('utf-8')))
+
+    def testMinimal (self):
+        instance = record(count=0, id=1, extension=pyxb.BIND())
+        self.assertRoundTrip(instance)
+        self.assertEqual(None, pyxb.binding.binary.decode(pyxb.binding.binary.encode(instance)).label)
+
+    def testSimpleElement (self):
+        self.assertRoundTrip(note('text'))
+        self.assertRoundTrip(member('text'))
+
+    def testUnbound (self):
+        instance = tBase(name='n')
+        self.assertRaises(pyxb.UnboundElementError, pyxb.binding.binary.encode, instance)
+        data = pyxb.binding.binary.encode(instance, element_name=Namespace.createExpandedName('unknown'))
+        self.assertRaises(BadDocumentError, pyxb.binding.binary.decode, data)
+
+    def testBadData (self):
+        data = pyxb.binding.binary.encode(CreateFromDocument(self.xmlt))
+        self.assertRaises(BadDocumentError, pyxb.binding.binary.decode, b'<record/>')
+        self.assertRaises(BadDocumentError, pyxb.binding.binary.decode, data[:-3])
+        self.assertRaises(BadDocumentError, pyxb.binding.binary.decode, data + b'\x00')
+
+    def testValidation (self):
+        # The decoded content is checked against the content model
+        data = pyxb.binding.binary.encode(CreateFromDocument(self.xmlt))
+        self.assertEqual(1, data.count(b'green'))
+        self.assertRaises(pyxb.ValidationError, pyxb.binding.binary.decode, data.replace(b'green', b'black'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import hashlib
+import xml.dom.minidom
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:c14n" targetNamespace="urn:c14n" elementFormDefault="qualified">
+  <xs:import namespace="http://www.w3.org/XML/1998/namespace"/>
+  <xs:complexType name="tPart">
+    <xs:simpleContent>
+      <xs:extension base="xs:string">
+        <xs:attribute name="z" type="xs:string"/>
+        <xs:attribute name="a" type="xs:string"/>
+        <xs:attribute ref="xml:lang"/>
+      </xs:extension>
+    </xs:simpleContent>
+  </xs:complexType>
+  <xs:element name="doc">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="part" type="tns:tPart" maxOccurs="unbounded"/>
+        <xs:element name="ref" type="xs:QName" minOccurs="0"/>
+        <xs:element name="empty" minOccurs="0">
+          <xs:complexType/>
+        </xs:element>
+        <xs:any namespace="##other" processContents="lax" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:ID"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestC14N (unittest.TestCase):
+    xmlt = '<doc xmlns="urn:c14n" xmlns:o="urn:other" id="d1"><part z="1" a="2&quot;&#x9;" xml:lang="en">a &amp; b &gt; c&#xD;é</part><ref>o:thing</ref><empty/><o:w o:b="x" c="y"><o:v/></o:w></doc>'
+
+    def setUp (self):
+        # Suppress the warning about the wildcard element
+        self.__logLevel = logging.getLogger('pyxb.binding.basis').level
+        logging.getLogger('pyxb.binding.basis').setLevel(logging.ERROR)
+
+    def tearDown (self):
+        logging.getLogger('pyxb.binding.basis').setLevel(self.__logLevel)
+
+    def testCanonical (self):
+        instance = CreateFromDocument(self.xmlt)
+        # Namespaces are declared where visibly used, attributes are sorted
+        # by namespace URI, empty elements have end tags, and characters are
+        # escaped per C14N.  The prefix in the QName value is not visibly
+        # used.
+        xmlt = '<ns1:doc xmlns:ns1="urn:c14n" id="d1"><ns1:part a="2&quot;&#x9;" z="1" xml:lang="en">a &amp; b &gt; c&#xD;é</ns1:part><ns1:ref>ns2:thing</ns1:ref><ns1:empty></ns1:empty><ns2:w xmlns:ns2="urn:other" c="y" ns2:b="x"><ns2:v></ns2:v></ns2:w></ns1:doc>'
+        writer = pyxb.utils.domutils.BindingC14NWriter()
+        self.assertEqual(xmlt.encode('utf-8'), writer.canonicalize(instance))
+        # Writer is reusable
+        self.assertEqual(xmlt.encode('utf-8'), writer.canonicalize(instance))
+
+    def testDefaultNamespace (self):
+        instance = CreateFromDocument(self.xmlt)
+        writer = pyxb.utils.domutils.BindingC14NWriter(default_namespace=Namespace)
+        xmlt = '<doc xmlns="urn:c14n" id="d1"><part a="2&quot;&#x9;" z="1" xml:lang="en">a &amp; b &gt; c&#xD;é</part><ref>ns1:thing</ref><empty></empty><ns1:w xmlns:ns1="urn:other" c="y" ns1:b="x"><ns1:v></ns1:v></ns1:w></doc>'
+        self.assertEqual(xmlt.encode('utf-8'), writer.canonicalize(instance))
+        # Unqualified content undeclares the default namespace
+        instance = CreateFromDocument('<doc xmlns="urn:c14n"><part>x</part></doc>')
+        instance.append(pyxb.utils.domutils.StringToDOM('<o:w xmlns:o="urn:other"><v a="1"/></o:w>').documentElement)
+        xmlt = '<doc xmlns="urn:c14n"><part>x</part><ns1:w xmlns:ns1="urn:other"><v xmlns="" a="1"></v></ns1:w></doc>'
+        self.assertEqual(xmlt.encode('utf-8'), writer.canonicalize(instance))
+
+    def testInclusivePrefixes (self):
+        instance = CreateFromDocument(self.xmlt)
+        writer = pyxb.utils.domutils.BindingC14NWriter(inclusive_prefixes='ns2')
+        xmld = writer.canonicalize(instance)
+        self.assertTrue(b'<ns1:ref xmlns:ns2="urn:other">ns2:thing</ns1:ref>' in xmld)
+
+    def testComments (self):
+        instance = CreateFromDocument('<doc xmlns="urn:c14n"><part>x</part></doc>')
+        instance.append(xml.dom.minidom.parseString('<o:w xmlns:o="urn:other"><!--note--></o:w>').documentElement)
+        writer = pyxb.utils.domutils.BindingC14NWriter()
+        self.assertTrue(writer.canonicalize(instance).endswith(b'<o:w xmlns:o="urn:other"></o:w></ns1:doc>'))
+        writer = pyxb.utils.domutils.BindingC14NWriter(with_comments=True)
+        self.assertTrue(writer.canonicalize(instance).endswith(b'<o:w xmlns:o="urn:other"><!--note--></o:w></ns1:doc>'))
+
+    def testDigest (self):
+        instance = CreateFromDocument(self.xmlt)
+        for i in range(500):
+            instance.part.append(tPart('part %d' % (i,), a=str(i)))
+        writer = pyxb.utils.domutils.BindingC14NWriter()
+        writer.BufferSize = 512
+        chunks = []
+        class Hash (object):
+            def update (self, data):
+                chunks.append(data)
+        writer.digest(instance, Hash())
+        self.assertTrue(10 < len(chunks))
+        xmld = writer.canonicalize(instance)
+        self.assertEqual(xmld, b''.join(chunks))
+        self.assertEqual(hashlib.sha256(xmld).digest(), writer.digest(instance, hashlib.sha256()).digest())
+        self.assertEqual(xmld, b''.join(instance.toxml_iter(bds=writer, root_only=True)))
+
+    def testErrors (self):
+        instance = CreateFromDocument(self.xmlt)
+        writer = pyxb.utils.domutils.BindingC14NWriter()
+        self.assertRaises(pyxb.UsageError, instance.toxml_iter, bds=writer)
+        self.assertRaises(pyxb.UsageError, writer.iterwrite, instance, encoding='utf-16')
+
+if __name__ == '__main__':
+    unittest.main()
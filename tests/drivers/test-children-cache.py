@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+from pyxb.utils.six.moves import cPickle as pickle
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="doc">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:string" maxOccurs="unbounded"/>
+        <xs:choice minOccurs="0">
+          <xs:element name="b" type="xs:string"/>
+          <xs:element name="c" type="xs:string"/>
+        </xs:choice>
+        <xs:any processContents="lax" minOccurs="0" maxOccurs="unbounded" namespace="##other"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="para">
+    <xs:complexType mixed="true">
+      <xs:sequence>
+        <xs:element name="em" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestChildrenCache (unittest.TestCase):
+    def setUp (self):
+        self.__sequencedChildren = pyxb.binding.content.AutomatonConfiguration.sequencedChildren
+        self.replays = []
+        def sequenced_children (cfg):
+            self.replays.append(cfg)
+            return self.__sequencedChildren(cfg)
+        pyxb.binding.content.AutomatonConfiguration.sequencedChildren = sequenced_children
+        # Suppress the warning about the wildcard element
+        self.__logLevel = logging.getLogger('pyxb.binding.basis').level
+        logging.getLogger('pyxb.binding.basis').setLevel(logging.ERROR)
+
+    def tearDown (self):
+        pyxb.binding.content.AutomatonConfiguration.sequencedChildren = self.__sequencedChildren
+        logging.getLogger('pyxb.binding.basis').setLevel(self.__logLevel)
+
+    def testCached (self):
+        instance = CreateFromDocument('<doc><a>1</a><a>2</a><b>b</b></doc>')
+        xmld = instance.toxml('utf-8', root_only=True)
+        self.assertEqual(b'<doc><a>1</a><a>2</a><b>b</b></doc>', xmld)
+        self.assertEqual(1, len(self.replays))
+        self.assertEqual(xmld, instance.toxml('utf-8', root_only=True))
+        instance.validateBinding()
+        self.assertEqual(1, len(self.replays))
+
+    def testInvalidation (self):
+        instance = CreateFromDocument('<doc><a>1</a><b>b</b></doc>')
+        instance.toxml('utf-8')
+        self.assertEqual(1, len(self.replays))
+        # Plural list mutation
+        instance.a.append('2')
+        self.assertEqual(b'<doc><a>1</a><a>2</a><b>b</b></doc>', instance.toxml('utf-8', root_only=True))
+        self.assertEqual(2, len(self.replays))
+        instance.a[0] = '0'
+        self.assertEqual(b'<doc><a>0</a><a>2</a><b>b</b></doc>', instance.toxml('utf-8', root_only=True))
+        del instance.a[1]
+        self.assertEqual(b'<doc><a>0</a><b>b</b></doc>', instance.toxml('utf-8', root_only=True))
+        self.assertEqual(4, len(self.replays))
+        # Property setters
+        instance.b = None
+        instance.c = 'c'
+        self.assertEqual(b'<doc><a>0</a><c>c</c></doc>', instance.toxml('utf-8', root_only=True))
+        instance.a = [ 'x', 'y' ]
+        self.assertEqual(b'<doc><a>x</a><a>y</a><c>c</c></doc>', instance.toxml('utf-8', root_only=True))
+        self.assertEqual(6, len(self.replays))
+        # append and reset
+        instance.append(pyxb.utils.domutils.StringToDOM('<w xmlns="urn:other"/>').documentElement)
+        self.assertTrue(instance.toxml('utf-8', root_only=True).endswith(b'<ns1:w/></doc>'))
+        instance.wildcardElements().pop()
+        self.assertEqual(b'<doc><a>x</a><a>y</a><c>c</c></doc>', instance.toxml('utf-8', root_only=True))
+        self.assertEqual(8, len(self.replays))
+        instance.reset()
+        self.assertRaises(IncompleteElementContentError, instance.toxml)
+        # Changing the validation configuration
+        instance = CreateFromDocument('<doc><a>1</a></doc>')
+        instance.toxml()
+        vc = pyxb.GlobalValidationConfig.copy()
+        instance._setValidationConfig(vc)
+        instance.toxml()
+        instance.toxml()
+        self.assertEqual(11, len(self.replays))
+
+    def testMixed (self):
+        # Mixed content uses the ordered content, which the caller may
+        # change, so is not cached.
+        instance = CreateFromDocument('<para>one <em>two</em> three</para>')
+        xmld = instance.toxml('utf-8', root_only=True)
+        self.assertEqual(xmld, instance.toxml('utf-8', root_only=True))
+        self.assertEqual(2, len(self.replays))
+        instance.orderedContent().reverse()
+        self.assertEqual(b'<para> three<em>two</em>one </para>', instance.toxml('utf-8', root_only=True))
+
+    def testPickle (self):
+        instance = CreateFromDocument('<doc><a>1</a><a>2</a><b>b</b></doc>')
+        xmld = instance.toxml('utf-8')
+        copy = pickle.loads(pickle.dumps(instance))
+        self.assertEqual(xmld, copy.toxml('utf-8'))
+        copy.a.append('3')
+        self.assertEqual(b'<doc><a>1</a><a>2</a><a>3</a><b>b</b></doc>', copy.toxml('utf-8', root_only=True))
+
+if __name__ == '__main__':
+    unittest.main()
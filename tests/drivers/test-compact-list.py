@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.datatypes as xsd
+import decimal
+
+xsdt='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:compact" xmlns="urn:compact">
+  <xs:simpleType name="doubleList">
+    <xs:list itemType="xs:double"/>
+  </xs:simpleType>
+  <xs:simpleType name="intList">
+    <xs:list itemType="xs:int"/>
+  </xs:simpleType>
+  <xs:simpleType name="tPercent">
+    <xs:restriction base="xs:decimal">
+      <xs:minInclusive value="0"/>
+      <xs:maxExclusive value="100"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="percentList">
+    <xs:list itemType="tPercent"/>
+  </xs:simpleType>
+  <xs:simpleType name="tUnit">
+    <xs:restriction base="xs:double">
+      <xs:minInclusive value="0"/>
+      <xs:maxInclusive value="1"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="unitList">
+    <xs:list itemType="tUnit"/>
+  </xs:simpleType>
+  <xs:simpleType name="tSmallOdd">
+    <xs:restriction base="xs:integer">
+      <xs:enumeration value="1"/>
+      <xs:enumeration value="3"/>
+      <xs:enumeration value="5"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="oddList">
+    <xs:list itemType="tSmallOdd"/>
+  </xs:simpleType>
+  <xs:simpleType name="flagList">
+    <xs:list itemType="xs:boolean"/>
+  </xs:simpleType>
+  <xs:simpleType name="wordList">
+    <xs:list itemType="xs:string"/>
+  </xs:simpleType>
+  <xs:element name="posList">
+    <xs:complexType>
+      <xs:simpleContent>
+        <xs:extension base="doubleList">
+          <xs:attribute name="srsDimension" type="xs:positiveInteger"/>
+        </xs:extension>
+      </xs:simpleContent>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="counts" type="intList"/>
+  <xs:element name="percents" type="percentList"/>
+  <xs:element name="units" type="unitList"/>
+  <xs:element name="odds" type="oddList"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsdt)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+for _lt in (doubleList, intList, percentList, unitList, oddList):
+    _lt._SetCompactItems()
+
+class TestCompactList (unittest.TestCase):
+    def testParse (self):
+        instance = CreateFromDocument('<posList xmlns="urn:compact" srsDimension="2">1 2.5 -3E2 INF</posList>')
+        value = instance.value()
+        self.assertTrue(isinstance(value, doubleList))
+        self.assertEqual([ 1.0, 2.5, -300.0, float('inf') ], value)
+        self.assertEqual([ float ] * 4, [ type(_v) for _v in value ])
+        self.assertEqual('1.0 2.5 -300.0 INF', value.xsdLiteral())
+        xmlt = instance.toxml('utf-8', root_only=True)
+        self.assertEqual(value, CreateFromDocument(xmlt).value())
+
+    def testIntegers (self):
+        instance = CreateFromDocument('<counts xmlns="urn:compact">1 -2 2147483647</counts>')
+        self.assertEqual([ 1, -2, 2147483647 ], instance)
+        self.assertFalse(any(isinstance(_v, pyxb.binding.basis.simpleTypeDefinition) for _v in instance))
+        self.assertRaises(SimpleListValueError, CreateFromDocument, '<counts xmlns="urn:compact">1 2147483648</counts>')
+        self.assertRaises(SimpleListValueError, CreateFromDocument, '<counts xmlns="urn:compact">1 1.5</counts>')
+        self.assertEqual([ 4, 5 ], intList([ xsd.int(4), 5 ]))
+
+    def testRange (self):
+        instance = percents('0 12.5 99.99')
+        self.assertEqual([ decimal.Decimal('0'), decimal.Decimal('12.5'), decimal.Decimal('99.99') ], instance)
+        self.assertEqual('0.0 12.5 99.99', instance.xsdLiteral())
+        with self.assertRaises(SimpleListValueError) as cm:
+            percents('3 100 5')
+        self.assertEqual(decimal.Decimal(100), cm.exception.value)
+        self.assertRaises(SimpleListValueError, percents, '3 -1 5')
+        self.assertRaises(SimpleListValueError, percents, '3 NaN')
+        self.assertRaises(SimpleListValueError, units, '0.5 NaN 0.25')
+        self.assertRaises(SimpleListValueError, units, 'NaN 0.5')
+        self.assertEqual([ ], units(''))
+
+    def testOtherFacets (self):
+        self.assertEqual([ 1, 5, 3 ], odds('1 5 3'))
+        self.assertRaises(SimpleListValueError, odds, '1 2 3')
+
+    def testMutation (self):
+        instance = units('0.5')
+        instance.append('0.25')
+        instance.extend([ 1, '0' ])
+        instance[0] = xsd.double(0.75)
+        self.assertEqual([ 0.75, 0.25, 1.0, 0.0 ], instance)
+        self.assertEqual([ float ] * 4, [ type(_v) for _v in instance ])
+        self.assertRaises(SimpleListValueError, instance.append, '2')
+        self.assertRaises(SimpleListValueError, instance.extend, [ '0.5', 'x' ])
+        self.assertTrue(0.25 in instance)
+        self.assertEqual(1, instance.index('0.25'))
+
+    def testValidate (self):
+        instance = CreateFromDocument('<units xmlns="urn:compact">0 1</units>')
+        self.assertTrue(instance.validateBinding())
+        list.append(instance, 2.0)
+        self.assertRaises(SimpleListValueError, instance.validateBinding)
+
+    def testSelection (self):
+        self.assertTrue(doubleList._CompactItems())
+        self.assertRaises(pyxb.UsageError, flagList._SetCompactItems)
+        self.assertRaises(pyxb.UsageError, wordList._SetCompactItems)
+        self.assertFalse(flagList._CompactItems())
+        self.assertTrue(intList is intList._SetCompactItems(False))
+        try:
+            instance = intList('1 2')
+            self.assertEqual([ xsd.int ] * 2, [ type(_v) for _v in instance ])
+        finally:
+            intList._SetCompactItems()
+        self.assertEqual([ int ] * 2, [ type(_v) for _v in intList('1 2') ])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="seq">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:string"/>
+        <xs:element name="b" type="xs:string" minOccurs="0" maxOccurs="2"/>
+        <xs:choice>
+          <xs:element name="c" type="xs:string"/>
+          <xs:element name="d" type="xs:string"/>
+        </xs:choice>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="nondet">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:string" minOccurs="0"/>
+        <xs:element name="a" type="xs:string"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="all">
+    <xs:complexType>
+      <xs:all>
+        <xs:element name="a" type="xs:string"/>
+        <xs:element name="b" type="xs:string"/>
+      </xs:all>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="wild">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:string"/>
+        <xs:any processContents="lax" minOccurs="0"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestCompiledAutomaton (unittest.TestCase):
+    def testCompilation (self):
+        self.assertTrue(seq.typeDefinition()._Automaton.isCompiled)
+        self.assertFalse(nondet.typeDefinition()._Automaton.isCompiled)
+        self.assertFalse(all.typeDefinition()._Automaton.isCompiled)
+        self.assertFalse(wild.typeDefinition()._Automaton.isCompiled)
+
+    def testSequence (self):
+        instance = CreateFromDocument('<seq><a>a</a><b>b1</b><b>b2</b><d>d</d></seq>')
+        self.assertEqual('a', instance.a)
+        self.assertEqual(['b1', 'b2'], list(instance.b))
+        self.assertEqual('d', instance.d)
+        instance = CreateFromDocument('<seq><a>a</a><c>c</c></seq>')
+        self.assertEqual('c', instance.c)
+        self.assertEqual(0, len(instance.b))
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<seq><a>a</a><b>b1</b><b>b2</b><b>b3</b><c>c</c></seq>')
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<seq><a>a</a><c>c</c><d>d</d></seq>')
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<seq><b>b</b><c>c</c></seq>')
+        self.assertRaises(IncompleteElementContentError, CreateFromDocument, '<seq><a>a</a><b>b</b></seq>')
+
+    def testFallback (self):
+        instance = CreateFromDocument('<nondet><a>a</a></nondet>')
+        self.assertEqual(['a'], list(instance.a))
+        instance = CreateFromDocument('<all><b>b</b><a>a</a></all>')
+        self.assertEqual('a', instance.a)
+        self.assertEqual('b', instance.b)
+        instance = CreateFromDocument('<wild><a>a</a><x/></wild>')
+        self.assertEqual(1, len(instance.wildcardElements()))
+
+    def testBinding (self):
+        # Content without an element declaration uses the general engine
+        instance = seq('a')
+        instance.b.append('b')
+        instance.c = 'c'
+        self.assertEqual('a', instance.a)
+        xmlt = '<seq><a>a</a><b>b</b><c>c</c></seq>'
+        self.assertEqual(instance.toxml('utf-8', root_only=True), xmlt.encode('utf-8'))
+
+    def testTransitionCache (self):
+        automaton = wild.typeDefinition()._Automaton
+        cache = automaton.enableTransitionCache(8)
+        try:
+            for _ in range(4):
+                instance = CreateFromDocument('<wild><a>a</a><x/></wild>')
+                self.assertEqual('a', instance.a)
+            # The wildcard content is a DOM node and is not cached
+            self.assertEqual(3, cache.hits)
+            self.assertEqual(1, cache.misses)
+            # The second a is accepted by the wildcard
+            instance = CreateFromDocument('<wild><a>a</a><a>b</a></wild>')
+            self.assertEqual(1, len(instance.wildcardElements()))
+            self.assertEqual(4, cache.hits)
+            self.assertEqual(2, cache.misses)
+        finally:
+            automaton.disableTransitionCache()
+
+    def testNoClone (self):
+        import pyxb.utils.fac
+        clones = []
+        def clone (cfg, clone_map=None):
+            clones.append(cfg)
+            return original(cfg, clone_map)
+        original = pyxb.utils.fac.Configuration.clone
+        pyxb.utils.fac.Configuration.clone = clone
+        try:
+            # Deterministic steps in the general engine do not clone
+            instance = CreateFromDocument('<wild><a>a</a><x/></wild>')
+            self.assertEqual(0, len(clones))
+            instance = CreateFromDocument('<all><b>b</b><a>a</a></all>')
+            self.assertEqual(0, len(clones))
+            # Non-deterministic ones do
+            instance = CreateFromDocument('<nondet><a>a</a><a>a</a></nondet>')
+            self.assertEqual(['a', 'a'], list(instance.a))
+            self.assertNotEqual(0, len(clones))
+        finally:
+            pyxb.utils.fac.Configuration.clone = original
+
+if __name__ == '__main__':
+    unittest.main()
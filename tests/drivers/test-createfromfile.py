@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import io
+import os
+import tempfile
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="entries">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="entry" type="xs:int" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestCreateFromFile (unittest.TestCase):
+    count = 500
+    xmld = ('<entries>\n' + ''.join([ '<entry>%d</entry>\n' % (_i,) for _i in range(count) ]) + '</entries>').encode('utf-8')
+
+    def setUp (self):
+        (fd, self.path) = tempfile.mkstemp(suffix='.xml')
+        os.write(fd, self.xmld)
+        os.close(fd)
+
+    def tearDown (self):
+        os.unlink(self.path)
+        pyxb._SetXMLStyle()
+
+    def checkInstance (self, instance, location_base):
+        self.assertEqual(list(range(self.count)), list(instance.entry))
+        self.assertEqual(location_base, instance._location().locationBase)
+
+    def testStream (self):
+        for style in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+            pyxb._SetXMLStyle(style)
+            instance = CreateFromStream(io.BytesIO(self.xmld), location_base='stream', read_size=100)
+            self.checkInstance(instance, 'stream')
+        instance = CreateFromStream(io.StringIO(self.xmld.decode('utf-8')))
+        self.assertEqual(self.count, len(instance.entry))
+
+    def testFile (self):
+        for style in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+            pyxb._SetXMLStyle(style)
+            for use_mmap in (True, False):
+                instance = CreateFromFile(self.path, read_size=1000, use_mmap=use_mmap)
+                self.checkInstance(instance, self.path)
+        instance = CreateFromFile(self.path, location_base='other')
+        self.checkInstance(instance, 'other')
+
+    def testDOM (self):
+        pyxb._SetXMLStyle(pyxb.XMLStyle_saxdom)
+        self.assertEqual(self.count, len(CreateFromFile(self.path).entry))
+
+    def testEmpty (self):
+        with open(self.path, 'wb') as f:
+            pass
+        self.assertRaises(Exception, CreateFromFile, self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.utils.domutils
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tSmall">
+    <xs:restriction base="xs:int">
+      <xs:maxInclusive value="10"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:element name="point">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="label" type="xs:string" minOccurs="0"/>
+      </xs:sequence>
+      <xs:attribute name="x" type="xs:double"/>
+      <xs:attribute name="small" type="tSmall"/>
+      <xs:attribute name="kind" type="xs:QName"/>
+      <xs:attribute name="name" type="xs:string" use="required"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestDeferAttributes (unittest.TestCase):
+    def setUp (self):
+        self.__typeDefinition = point.typeDefinition()
+        validation_config = self.__typeDefinition._GetValidationConfig().copy()
+        validation_config._setDeferAttributeConversion(True)
+        self.__typeDefinition._SetValidationConfig(validation_config)
+
+    def tearDown (self):
+        self.__typeDefinition._SetValidationConfig(pyxb.GlobalValidationConfig)
+
+    def testDeferred (self):
+        instance = CreateFromDocument('<point xmlns:u="urn:u" name="p" x="1.5" small="3" kind="u:k"/>')
+        self.assertEqual(1.5, instance.x)
+        self.assertTrue(isinstance(instance.x, pyxb.binding.datatypes.double))
+        self.assertEqual(3, instance.small)
+        self.assertTrue(isinstance(instance.small, tSmall))
+        self.assertEqual(pyxb.namespace.ExpandedName('urn:u', 'k'), instance.kind)
+        self.assertEqual('p', instance.name)
+        self.assertTrue(instance.validateBinding())
+
+    def testInvalid (self):
+        instance = CreateFromDocument('<point name="p" x="nan" small="30"/>')
+        self.assertRaises(SimpleFacetValueError, getattr, instance, 'small')
+        self.assertRaises(SimpleFacetValueError, instance.validateBinding)
+        instance = CreateFromDocument('<point name="p" small="abc"/>')
+        self.assertRaises(SimpleTypeValueError, instance.validateBinding)
+        self.assertRaises(MissingAttributeError, CreateFromDocument, '<point/>')
+
+    def testGenerate (self):
+        xmlt = '<point name="p" x="2.5"><label>l</label></point>'
+        instance = CreateFromDocument(xmlt)
+        self.assertEqual(instance.toxml('utf-8', root_only=True), xmlt.encode('utf-8'))
+
+    def testDisabled (self):
+        self.__typeDefinition._SetValidationConfig(pyxb.GlobalValidationConfig)
+        self.assertRaises(SimpleFacetValueError, CreateFromDocument, '<point name="p" small="30"/>')
+        self.assertFalse(pyxb.GlobalValidationConfig.deferAttributeConversion)
+        self.assertRaises(TypeError, pyxb.GlobalValidationConfig.copy()._setDeferAttributeConversion, 1)
+
+if __name__ == '__main__':
+    unittest.main()
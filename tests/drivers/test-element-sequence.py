@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import io
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="note" type="xs:string"/>
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:int" minOccurs="0" maxOccurs="2"/>
+      <xs:element ref="note" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+  </xs:complexType>
+  <xs:complexType name="tExt">
+    <xs:complexContent>
+      <xs:extension base="tBase">
+        <xs:sequence>
+          <xs:element name="c" type="xs:string"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:complexType name="tChoice">
+    <xs:choice>
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:string"/>
+    </xs:choice>
+  </xs:complexType>
+  <xs:complexType name="tRepeat">
+    <xs:sequence maxOccurs="unbounded">
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tWild">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string"/>
+      <xs:any processContents="lax" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="base" type="tBase"/>
+  <xs:element name="ext" type="tExt"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestElementSequence (unittest.TestCase):
+    def setUp (self):
+        self.__validatedChildren = pyxb.binding.basis.complexTypeDefinition._validatedChildren
+        self.replays = []
+        def validated_children (instance):
+            self.replays.append(instance)
+            return self.__validatedChildren(instance)
+        pyxb.binding.basis.complexTypeDefinition._validatedChildren = validated_children
+
+    def tearDown (self):
+        pyxb.binding.basis.complexTypeDefinition._validatedChildren = self.__validatedChildren
+
+    def testGenerated (self):
+        self.assertEqual([ ('a', 1, 1), ('b', 0, 2), ('note', 0, 1) ], [ (_ed.name().localName(), _mn, _mx) for (_ed, _mn, _mx) in tBase._ElementSequence ])
+        self.assertEqual([ 'a', 'b', 'note', 'c' ], [ _ed.name().localName() for (_ed, _, _) in tExt._ElementSequence ])
+        self.assertTrue(tChoice._ElementSequence is None)
+        self.assertTrue(tRepeat._ElementSequence is None)
+        self.assertTrue(tWild._ElementSequence is None)
+
+    def testSequence (self):
+        xmlt = '<ext id="3"><a>a</a><b>1</b><b>2</b><note>n</note><c>c</c></ext>'
+        instance = CreateFromDocument(xmlt)
+        self.assertEqual(instance.toxml('utf-8', root_only=True), xmlt.encode('utf-8'))
+        self.assertEqual([], self.replays)
+        instance = base('a')
+        self.assertEqual(instance.toxml('utf-8', root_only=True), b'<base><a>a</a></base>')
+        self.assertEqual([], self.replays)
+
+    def testFallback (self):
+        instance = base()
+        self.assertRaises(IncompleteElementContentError, instance.toxml)
+        self.assertEqual(1, len(self.replays))
+        instance = base(a='a', b=[1, 2, 3])
+        self.assertRaises(UnprocessedElementContentError, instance.toxml)
+        instance = tRepeat()
+        instance.a.extend(['a1', 'a2'])
+        instance.b.extend(['b1', 'b2'])
+        self.assertEqual(instance.toxml('utf-8', element_name='r', root_only=True), b'<r><a>a1</a><b>b1</b><a>a2</a><b>b2</b></r>')
+
+    def testContentInfluences (self):
+        instance = CreateFromDocument('<base><a>a</a><b>1</b></base>')
+        vc = pyxb.GlobalValidationConfig.copy()
+        vc._setContentInfluencesGeneration(vc.ALWAYS)
+        instance._setValidationConfig(vc)
+        self.assertEqual(instance.toxml('utf-8', root_only=True), b'<base><a>a</a><b>1</b></base>')
+        self.assertEqual(1, len(self.replays))
+
+    def testWriter (self):
+        instance = CreateFromDocument('<ext><a>a</a><c>c</c></ext>')
+        stream = io.BytesIO()
+        instance.toxml('utf-8', stream=stream)
+        self.assertEqual(instance.toxml('utf-8'), stream.getvalue())
+        self.assertEqual([], self.replays)
+
+if __name__ == '__main__':
+    unittest.main()
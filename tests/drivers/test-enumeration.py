@@ -113,6 +113,24 @@ class TestEnumerations (unittest.TestCase):
         self.assertEqual([1,1,2,3], eVarious((1,1,2,3)))
         self.assertRaises(pyxb.SimpleTypeValueError, eVarious, (1,1,2,3,5,8))
 
+    def testFacetLookup (self):
+        facet = tInteger._CF_enumeration
+        self.assertTrue(facet.validateConstraint(tInteger(3, _validate_constraints=False)))
+        self.assertFalse(facet.validateConstraint(tInteger(4, _validate_constraints=False)))
+        # Values of other types are compared by value
+        self.assertTrue(facet.validateConstraint(3))
+        self.assertTrue(facet.validateConstraint(3.0))
+        self.assertFalse(facet.validateConstraint(4))
+        self.assertTrue(tListInt._CF_enumeration.validateConstraint([1, 1, 2, 3]))
+        self.assertFalse(tListInt._CF_enumeration.validateConstraint([1, 2, 3]))
+        # Elements added after validation are recognized
+        facet = pyxb.binding.facets.CF_enumeration(value_datatype=xs.string)
+        facet.addEnumeration(unicode_value='a', tag='a')
+        self.assertFalse(facet.validateConstraint(xs.string('b')))
+        facet.addEnumeration(unicode_value='b', tag='b')
+        self.assertTrue(facet.validateConstraint(xs.string('b')))
+        self.assertTrue(facet.validateConstraint('a'))
+
 
 if __name__ == '__main__':
     unittest.main()
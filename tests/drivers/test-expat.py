@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import xml.sax
+import io
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="title" type="xs:string"/>
+      <xs:any processContents="lax" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+    <xs:anyAttribute processContents="lax"/>
+  </xs:complexType>
+  <xs:element name="feed">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" type="tItem" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestExpat (unittest.TestCase):
+    def setUp (self):
+        pyxb._SetXMLStyle(pyxb.XMLStyle_expat)
+
+    def tearDown (self):
+        pyxb._SetXMLStyle()
+
+    xmlt = '''<feed xmlns:o="urn:other">
+<item id="1" o:extra="x"><title>B &amp; W</title></item>
+<item id="2"><title>t2</title><o:note>n</o:note></item>
+</feed>'''
+
+    def testParse (self):
+        instance = CreateFromDocument(self.xmlt)
+        self.assertEqual(2, len(instance.item))
+        self.assertEqual(1, instance.item[0].id)
+        self.assertEqual('B & W', instance.item[0].title)
+        self.assertEqual(1, len(instance.item[0].wildcardAttributeMap()))
+        self.assertEqual(1, len(instance.item[1].wildcardElements()))
+        expat_xml = instance.toxml('utf-8')
+        pyxb._SetXMLStyle(pyxb.XMLStyle_saxer)
+        self.assertEqual(CreateFromDocument(self.xmlt).toxml('utf-8'), expat_xml)
+
+    def testLocation (self):
+        instance = CreateFromDocument(self.xmlt, location_base='feed.xml')
+        loc = instance.item[1]._location()
+        self.assertEqual('feed.xml', loc.locationBase)
+        self.assertEqual(3, loc.lineNumber)
+        self.assertEqual(0, loc.columnNumber)
+
+    def testIncremental (self):
+        saxer = pyxb.binding.saxer.make_expat_parser(fallback_namespace=Namespace.fallbackNamespace())
+        handler = saxer.getContentHandler()
+        xmld = self.xmlt.encode('utf-8')
+        for i in range(0, len(xmld), 7):
+            saxer.feed(xmld[i:i+7])
+        saxer.close()
+        self.assertEqual(2, len(handler.rootObject().item))
+        saxer.parse(io.BytesIO(b'<feed><item><title>t</title></item></feed>'))
+        self.assertEqual(1, len(handler.rootObject().item))
+
+    def testMalformed (self):
+        self.assertRaises(xml.sax.SAXParseException, CreateFromDocument, '<feed><item></feed>')
+
+    def testValidation (self):
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<feed><title>t</title></feed>')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.bundles.opengis.geometry as geometry
+import io
+
+import unittest
+
+xmlt = '''<app:features xmlns:app="urn:app" xmlns:gml="http://www.opengis.net/gml/3.2">
+  <app:feature>
+    <gml:Point gml:id="p1" srsDimension="3"><gml:pos>1 2 3</gml:pos></gml:Point>
+  </app:feature>
+  <app:feature>
+    <gml:LineString><gml:pos>0 0</gml:pos><gml:pos>1 1</gml:pos><gml:pos>2 0</gml:pos></gml:LineString>
+  </app:feature>
+  <app:feature>
+    <gml:MultiSurface gml:id="ms1">
+      <gml:surfaceMember><gml:Polygon>
+        <gml:exterior><gml:LinearRing><gml:posList>0 0 4 0 4 4 0 0</gml:posList></gml:LinearRing></gml:exterior>
+        <gml:interior><gml:LinearRing><gml:posList srsDimension="3">1 1 0 2 1 0 1 1 0</gml:posList></gml:LinearRing></gml:interior>
+      </gml:Polygon></gml:surfaceMember>
+      <gml:surfaceMember><gml:Polygon>
+        <gml:exterior><gml:LinearRing><gml:posList count="4">5 5 6 5 6 6 5 5</gml:posList></gml:LinearRing></gml:exterior>
+      </gml:Polygon></gml:surfaceMember>
+    </gml:MultiSurface>
+  </app:feature>
+  <app:location><gml:posList>7 8</gml:posList></app:location>
+  <app:feature>
+    <gml:Envelope><gml:lowerCorner>0 0</gml:lowerCorner><gml:upperCorner>9 9</gml:upperCorner></gml:Envelope>
+  </app:feature>
+</app:features>'''
+
+class TestGMLGeometry (unittest.TestCase):
+    def testExtract (self):
+        coords = geometry.ExtractCoordinates(xmlt)
+        self.assertEqual(5, len(coords))
+        self.assertEqual([ 0, 1, 2, 5, 6, 7 ], list(coords.geometryOffsets()))
+        self.assertEqual([ 3, 2, 2, 3, 2, 2, 2 ], list(coords.partDimensions()))
+        self.assertEqual([ 0, 3, 9, 17, 26, 34, 36, 40 ], list(coords.partOffsets()))
+        self.assertEqual(40, len(coords.values()))
+        self.assertEqual([ 'Point', 'LineString', 'MultiSurface', 'posList', 'Envelope' ], [ _n.localName() for _n in coords.geometryNames() ])
+        self.assertEqual(geometry.GML_3_2, coords.geometryNames()[0].namespaceURI())
+        self.assertEqual([ 'p1', None, 'ms1', None, None ], coords.geometryIds())
+
+    def testGeometryParts (self):
+        coords = geometry.ExtractCoordinates(xmlt)
+        self.assertEqual([ (3, [ 1.0, 2.0, 3.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(0) ])
+        self.assertEqual([ (2, [ 0.0, 0.0, 1.0, 1.0, 2.0, 0.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(1) ])
+        parts = coords.geometryParts(2)
+        self.assertEqual([ 2, 3, 2 ], [ _d for (_d, _v) in parts ])
+        self.assertEqual([ 5.0, 5.0, 6.0, 5.0, 6.0, 6.0, 5.0, 5.0 ], list(parts[2][1]))
+        self.assertEqual([ (2, [ 0.0, 0.0, 9.0, 9.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(4) ])
+
+    def testCoordinates (self):
+        text = '''<gml:LineString xmlns:gml="http://www.opengis.net/gml">
+<gml:coordinates>1.5,2 3,4.25</gml:coordinates>
+</gml:LineString>'''
+        coords = geometry.ExtractCoordinates(text)
+        self.assertEqual([ (2, [ 1.5, 2.0, 3.0, 4.25 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(0) ])
+        text = '<gml:coordinates xmlns:gml="http://www.opengis.net/gml" decimal="," cs=";" ts="|">1,5;2;0|3;4,25;1</gml:coordinates>'
+        coords = geometry.ExtractCoordinates(text)
+        self.assertEqual([ (3, [ 1.5, 2.0, 0.0, 3.0, 4.25, 1.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(0) ])
+        text = '<gml:coordinates xmlns:gml="http://www.opengis.net/gml">1,2 3,4,5</gml:coordinates>'
+        self.assertRaises(pyxb.BadDocumentError, geometry.ExtractCoordinates, text)
+
+    def testIncremental (self):
+        whole = geometry.ExtractCoordinates(xmlt)
+        chunked = geometry.ExtractCoordinates(io.BytesIO(xmlt.encode('utf-8')), chunk_size=7)
+        self.assertEqual(whole.values(), chunked.values())
+        self.assertEqual(whole.partOffsets(), chunked.partOffsets())
+        self.assertEqual(whole.geometryOffsets(), chunked.geometryOffsets())
+        extractor = geometry.CoordinateExtractor()
+        for i in range(0, len(xmlt), 100):
+            extractor.feed(xmlt[i:i+100].encode('utf-8'))
+        self.assertEqual(whole.values(), extractor.close().values())
+
+    def testStandalonePos (self):
+        text = '<f xmlns:gml="http://www.opengis.net/gml/3.2"><gml:pos>1 2</gml:pos><gml:pos>3 4</gml:pos></f>'
+        coords = geometry.ExtractCoordinates(text)
+        self.assertEqual(1, len(coords))
+        self.assertEqual([ 0, 1 ], list(coords.geometryOffsets()))
+        self.assertEqual([ (2, [ 1.0, 2.0, 3.0, 4.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(0) ])
+        text = '<f xmlns:gml="http://www.opengis.net/gml/3.2"><gml:pos>1 2</gml:pos><gml:pos>3 4 5</gml:pos></f>'
+        coords = geometry.ExtractCoordinates(text)
+        self.assertEqual(2, len(coords))
+        self.assertEqual([ 0, 1, 2 ], list(coords.geometryOffsets()))
+        self.assertEqual([ (3, [ 3.0, 4.0, 5.0 ]) ], [ (_d, list(_v)) for (_d, _v) in coords.geometryParts(1) ])
+
+    def testLargeDimension (self):
+        text = '<gml:posList xmlns:gml="http://www.opengis.net/gml/3.2" srsDimension="300">%s</gml:posList>' % (' '.join([ '1' ] * 300),)
+        coords = geometry.ExtractCoordinates(text)
+        self.assertEqual([ 300 ], list(coords.partDimensions()))
+        self.assertEqual(300, len(coords.values()))
+        text = '<gml:posList xmlns:gml="http://www.opengis.net/gml/3.2" count="1">%s</gml:posList>' % (' '.join([ '1' ] * 256),)
+        self.assertEqual([ 256 ], list(geometry.ExtractCoordinates(text).partDimensions()))
+
+    def testNamespaces (self):
+        text = '<g:posList xmlns:g="http://www.opengis.net/gml">1 2</g:posList>'
+        self.assertEqual(1, len(geometry.ExtractCoordinates(text)))
+        self.assertEqual(0, len(geometry.ExtractCoordinates(text, namespaces=[ geometry.GML_3_2 ])))
+
+    def testErrors (self):
+        ns = 'xmlns:gml="http://www.opengis.net/gml/3.2"'
+        self.assertRaises(pyxb.BadDocumentError, geometry.ExtractCoordinates, '<gml:posList %s>1 x</gml:posList>' % (ns,))
+        self.assertRaises(pyxb.BadDocumentError, geometry.ExtractCoordinates, '<gml:posList %s>1 2 3</gml:posList>' % (ns,))
+        self.assertRaises(pyxb.BadDocumentError, geometry.ExtractCoordinates, '<gml:posList %s srsDimension="0">1 2</gml:posList>' % (ns,))
+        self.assertRaises(pyxb.BadDocumentError, geometry.ExtractCoordinates, '<gml:Point %s><gml:pos>1 2</gml:Point>' % (ns,))
+
+if __name__ == '__main__':
+    unittest.main()
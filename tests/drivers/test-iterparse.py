@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import io
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="title" type="xs:string"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+  </xs:complexType>
+  <xs:element name="feed">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="header" type="xs:string"/>
+        <xs:element name="item" type="tItem" maxOccurs="unbounded"/>
+        <xs:element name="trailer" type="xs:string"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="entry" type="tItem"/>
+  <xs:element name="entries">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element ref="entry" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestIterParse (unittest.TestCase):
+    def makeFeed (self, count, trailer=True):
+        xmlt = [ '<feed><header>h</header>' ]
+        xmlt.extend([ '<item id="%d"><title>t%d</title></item>' % (_i, _i) for _i in range(count) ])
+        if trailer:
+            xmlt.append('<trailer>t</trailer>')
+        xmlt.append('</feed>')
+        return ''.join(xmlt).encode('utf-8')
+
+    def testPath (self):
+        xmld = self.makeFeed(20)
+        items = list(pyxb.binding.saxer.iterparse(io.BytesIO(xmld), [ 'feed/item' ], chunk_size=32, fallback_namespace=Namespace.fallbackNamespace()))
+        self.assertEqual(20, len(items))
+        for (i, item) in enumerate(items):
+            self.assertTrue(isinstance(item, tItem))
+            self.assertEqual(i, item.id)
+            self.assertEqual('t%d' % (i,), item.title)
+
+    def testDetach (self):
+        xmld = self.makeFeed(5)
+        saxer = pyxb.binding.saxer.make_parser(stream_targets=[ '/feed/item' ], fallback_namespace=Namespace.fallbackNamespace())
+        handler = saxer.getContentHandler()
+        saxer.parse(io.BytesIO(xmld))
+        items = handler.takeStreamedObjects()
+        self.assertEqual(5, len(items))
+        self.assertEqual([], handler.takeStreamedObjects())
+        instance = handler.rootObject()
+        self.assertEqual('h', instance.header)
+        self.assertEqual('t', instance.trailer)
+        self.assertEqual(0, len(instance.item))
+        self.assertEqual(2, len(instance.orderedContent()))
+
+    def testContentModel (self):
+        # Streamed items still advance the parent automaton: a missing
+        # trailer is diagnosed.
+        xmld = self.makeFeed(3, trailer=False)
+        self.assertRaises(pyxb.IncompleteElementContentError, list, pyxb.binding.saxer.iterparse(xmld, [ 'feed/item' ], fallback_namespace=Namespace.fallbackNamespace()))
+        # And an item after the trailer is rejected.
+        xmld = b'<feed><header>h</header><item><title>a</title></item><trailer>t</trailer><item><title>b</title></item></feed>'
+        self.assertRaises(pyxb.UnrecognizedContentError, list, pyxb.binding.saxer.iterparse(xmld, [ 'feed/item' ], fallback_namespace=Namespace.fallbackNamespace()))
+
+    def testElementBinding (self):
+        xmlt = '<entries><entry id="1"><title>a</title></entry><entry id="2"><title>b</title></entry></entries>'
+        entries = list(pyxb.binding.saxer.iterparse(xmlt, [ entry ], fallback_namespace=Namespace.fallbackNamespace()))
+        self.assertEqual([1, 2], [ _e.id for _e in entries ])
+        self.assertEqual(['a', 'b'], [ _e.title for _e in entries ])
+
+    def testNoMatch (self):
+        xmld = self.makeFeed(2)
+        self.assertEqual([], list(pyxb.binding.saxer.iterparse(xmld, [ 'item', '{urn:other}feed/item' ], fallback_namespace=Namespace.fallbackNamespace())))
+        self.assertRaises(pyxb.UsageError, next, pyxb.binding.saxer.iterparse(xmld, [ 3 ]))
+
+    def testRoot (self):
+        xmld = self.makeFeed(2)
+        rv = list(pyxb.binding.saxer.iterparse(xmld, [ 'feed' ], fallback_namespace=Namespace.fallbackNamespace()))
+        self.assertEqual(1, len(rv))
+        self.assertEqual(2, len(rv[0].item))
+
+if __name__ == '__main__':
+    unittest.main()
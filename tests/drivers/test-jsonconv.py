@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.jsonconv
+import pyxb.utils.domutils
+from pyxb.utils import six
+import decimal
+import json
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:json" xmlns="urn:json" elementFormDefault="qualified">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="sku" type="xs:string"/>
+      <xs:element name="qty" type="xs:int"/>
+      <xs:element name="price" type="xs:decimal" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:simpleType name="tFlags">
+    <xs:list itemType="xs:boolean"/>
+  </xs:simpleType>
+  <xs:element name="order">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="id" type="xs:int"/>
+        <xs:element name="item" type="tItem" maxOccurs="unbounded"/>
+        <xs:element name="note" type="xs:string" minOccurs="0" nillable="true"/>
+        <xs:element name="ratio" type="xs:double" minOccurs="0"/>
+        <xs:any namespace="##other" processContents="lax" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="placed" type="xs:date"/>
+      <xs:attribute name="flags" type="tFlags"/>
+      <xs:anyAttribute namespace="##other" processContents="lax"/>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="para">
+    <xs:complexType mixed="true">
+      <xs:sequence>
+        <xs:element name="em" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="amount">
+    <xs:complexType>
+      <xs:simpleContent>
+        <xs:extension base="xs:decimal">
+          <xs:attribute name="currency" type="xs:string"/>
+        </xs:extension>
+      </xs:simpleContent>
+    </xs:complexType>
+  </xs:element>
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tDerived">
+    <xs:complexContent>
+      <xs:extension base="tBase">
+        <xs:sequence>
+          <xs:element name="b" type="xs:string" maxOccurs="unbounded"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:element name="base" type="tBase"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestJSONConv (unittest.TestCase):
+    def setUp (self):
+        # Hide the warning about wildcard content left as DOM nodes
+        self.__basis_log = logging.getLogger('pyxb.binding.basis')
+        self.__basis_loglevel = self.__basis_log.level
+        self.__basis_log.setLevel(logging.ERROR)
+
+    def tearDown (self):
+        self.__basis_log.level = self.__basis_loglevel
+
+    def checkJSON (self, instance, expected, **kw):
+        text = pyxb.binding.jsonconv.dumps(instance, **kw)
+        self.assertEqual(expected, json.loads(text, parse_float=decimal.Decimal))
+        self.assertEqual(pyxb.binding.jsonconv.todict(instance, **kw), json.loads(text, parse_float=decimal.Decimal))
+        return text
+
+    def testElements (self):
+        xmlt = '<order xmlns="urn:json" placed="2013-02-03" flags="true false"><id>4</id><item><sku>A</sku><qty>2</qty><price>1.50</price></item><item><sku>B</sku><qty>1</qty></item><ratio>0.25</ratio></order>'
+        instance = CreateFromDocument(xmlt)
+        expected = { '@placed': '2013-02-03',
+                     '@flags': [ True, False ],
+                     'id': 4,
+                     'item': [ { 'sku': 'A', 'qty': 2, 'price': decimal.Decimal('1.5') },
+                               { 'sku': 'B', 'qty': 1 } ],
+                     'ratio': 0.25 }
+        self.assertEqual(expected, pyxb.binding.jsonconv.todict(instance))
+        text = self.checkJSON(instance, expected)
+        # Attributes by name, then elements in document order
+        self.assertTrue(text.startswith('{"@flags":[true,false],"@placed":"2013-02-03","id":4,"item":[{'))
+
+    def testPlural (self):
+        instance = CreateFromDocument('<order xmlns="urn:json"><id>1</id><item><sku>A</sku><qty>1</qty></item></order>')
+        self.assertEqual([ { 'sku': 'A', 'qty': 1 } ], pyxb.binding.jsonconv.todict(instance)['item'])
+
+    def testNil (self):
+        instance = CreateFromDocument('<order xmlns="urn:json" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><id>1</id><item><sku>A</sku><qty>1</qty></item><note xsi:nil="true"/></order>')
+        self.assertTrue(pyxb.binding.jsonconv.todict(instance)['note'] is None)
+        self.assertTrue(',"note":null}' in pyxb.binding.jsonconv.dumps(instance))
+
+    def testMixed (self):
+        instance = CreateFromDocument('<para xmlns="urn:json">one <em>two</em> three</para>')
+        expected = { '#content': [ 'one ', { 'em': 'two' }, ' three' ] }
+        self.checkJSON(instance, expected)
+
+    def testSimpleContent (self):
+        instance = CreateFromDocument('<amount xmlns="urn:json" currency="EUR">12.5</amount>')
+        self.checkJSON(instance, { '@currency': 'EUR', '#text': decimal.Decimal('12.5') })
+        self.assertEqual('{"@currency":"EUR","#text":12.5}', pyxb.binding.jsonconv.dumps(instance))
+
+    def testWildcard (self):
+        xmlt = '<order xmlns="urn:json" xmlns:o="urn:other" o:source="web"><id>1</id><item><sku>A</sku><qty>1</qty></item><o:extra o:k="v">text<o:part>1</o:part><o:part>2</o:part></o:extra></order>'
+        instance = CreateFromDocument(xmlt)
+        expected = { '@{urn:other}source': 'web',
+                     'id': 1,
+                     'item': [ { 'sku': 'A', 'qty': 1 } ],
+                     '#any': [ { '{urn:other}extra': { '@{urn:other}k': 'v',
+                                                       '#text': 'text',
+                                                       '{urn:other}part': [ { '#text': '1' }, { '#text': '2' } ] } } ] }
+        self.checkJSON(instance, expected)
+
+    def testDerivedType (self):
+        instance = CreateFromDocument('<base xmlns="urn:json" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:type="tDerived"><a>a</a><b>b1</b></base>')
+        self.checkJSON(instance, { '@xsi:type': '{urn:json}tDerived', 'a': 'a', 'b': [ 'b1' ] })
+
+    def testRoot (self):
+        instance = CreateFromDocument('<amount xmlns="urn:json">3</amount>')
+        self.checkJSON(instance, { 'amount': { '#text': decimal.Decimal(3) } }, with_root=True)
+        self.assertEqual({ 'total': { '#text': decimal.Decimal(3) } }, pyxb.binding.jsonconv.todict(instance, with_root=True, element_name='total'))
+        self.assertRaises(pyxb.UnboundElementError, pyxb.binding.jsonconv.todict, tItem('A', 1), with_root=True)
+
+    def testEscaping (self):
+        instance = CreateFromDocument('<order xmlns="urn:json"><id>1</id><item><sku>"é\\</sku><qty>1</qty></item></order>')
+        text = pyxb.binding.jsonconv.dumps(instance)
+        self.assertTrue('"sku":"\\"\\u00e9\\\\"' in text)
+        self.assertEqual('"é\\', json.loads(text)['item'][0]['sku'])
+
+    def testDump (self):
+        instance = CreateFromDocument('<order xmlns="urn:json"><id>1</id>' + 100 * '<item><sku>A</sku><qty>1</qty></item>' + '</order>')
+        stream = six.StringIO()
+        pyxb.binding.jsonconv.dump(instance, stream, buffer_size=64)
+        self.assertEqual(pyxb.binding.jsonconv.dumps(instance), stream.getvalue())
+        self.assertEqual(100, len(json.loads(stream.getvalue())['item']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import importlib
+import os.path
+import shutil
+import sys
+import tempfile
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="urn:trac:parsemany" xmlns="urn:trac:parsemany"
+           elementFormDefault="qualified">
+  <xs:element name="message">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="sent" type="xs:dateTime"/>
+        <xs:element name="body" type="xs:string"/>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:int" use="required"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+# The workers import the bindings by name, so they must be in a real module.
+module_dir = tempfile.mkdtemp()
+with open(os.path.join(module_dir, 'parsemany_bindings.py'), 'w') as f:
+    f.write(pyxb.binding.generate.GeneratePython(schema_text=xsd))
+sys.path.insert(0, module_dir)
+bindings = importlib.import_module('parsemany_bindings')
+
+import unittest
+
+class TestParseMany (unittest.TestCase):
+    @classmethod
+    def tearDownClass (cls):
+        sys.path.remove(module_dir)
+        shutil.rmtree(module_dir)
+
+    def makeDocument (self, i):
+        return '<message xmlns="urn:trac:parsemany" id="%d"><sent>2020-01-02T03:04:%02dZ</sent><body>b%d</body></message>' % (i, i % 60, i)
+
+    def checkResults (self, results, count, bad=()):
+        self.assertEqual(count, len(results))
+        for (i, rv) in enumerate(results):
+            if i in bad:
+                self.assertTrue(isinstance(rv, pyxb.DocumentParseError))
+                self.assertEqual(i, rv.index)
+                continue
+            self.assertTrue(isinstance(rv, bindings.message.typeDefinition()))
+            self.assertEqual(i, rv.id)
+            self.assertEqual('b%d' % (i,), rv.body)
+            self.assertEqual(i % 60, rv.sent.second)
+            self.assertTrue(isinstance(rv.sent, pyxb.binding.datatypes.dateTime))
+
+    def testInProcess (self):
+        documents = [ self.makeDocument(_i) for _i in range(10) ]
+        self.checkResults(pyxb.binding.saxer.parse_many(bindings, documents, workers=0), 10)
+
+    def testPool (self):
+        documents = [ self.makeDocument(_i) for _i in range(50) ]
+        documents[7] = documents[7].replace('<body>', '<text>').replace('</body>', '</text>')
+        documents[31] = documents[31][:40]
+        documents[32] = documents[32].encode('utf-8')
+        results = pyxb.binding.saxer.parse_many('parsemany_bindings', documents, workers=2, chunksize=4)
+        self.checkResults(results, 50, (7, 31))
+        self.assertTrue(isinstance(results[7].cause, pyxb.UnrecognizedContentError) or (results[7].cause is None))
+        self.assertTrue(results[7].description.startswith('UnrecognizedContentError'))
+
+    def testRaise (self):
+        documents = [ self.makeDocument(0), '<message/>', '<other/>' ]
+        with self.assertRaises(pyxb.DocumentParseError) as cm:
+            pyxb.binding.saxer.parse_many(bindings, documents, workers=1, raise_errors=True)
+        self.assertEqual(1, cm.exception.index)
+
+if __name__ == '__main__':
+    unittest.main()
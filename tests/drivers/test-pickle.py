@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+from pyxb.utils.six.moves import cPickle as pickle
+import copy
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:pickle" xmlns="urn:pickle" elementFormDefault="qualified">
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="key" type="xs:int"/>
+      <xs:element name="text" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+      <xs:element name="when" type="xs:dateTime" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="kind" type="xs:string"/>
+    <xs:attribute name="codes" type="tCodes"/>
+  </xs:complexType>
+  <xs:simpleType name="tCodes">
+    <xs:list itemType="xs:int"/>
+  </xs:simpleType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tRecord" maxOccurs="unbounded"/>
+        <xs:element name="last" type="tRecord" minOccurs="0" nillable="true"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="para">
+    <xs:complexType mixed="true">
+      <xs:sequence>
+        <xs:element name="em" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="wild">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:string"/>
+        <xs:any namespace="##other" processContents="lax" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:anyAttribute namespace="##other" processContents="lax"/>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="triple">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="a" type="xs:int"/>
+        <xs:element name="b" type="xs:int"/>
+        <xs:element name="c" type="xs:int" minOccurs="0"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="measure">
+    <xs:complexType>
+      <xs:simpleContent>
+        <xs:extension base="xs:decimal">
+          <xs:attribute name="unit" type="xs:string"/>
+        </xs:extension>
+      </xs:simpleContent>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestPickle (unittest.TestCase):
+    def setUp (self):
+        # Hide the warning about wildcard content left as DOM nodes
+        self.__basis_log = logging.getLogger('pyxb.binding.basis')
+        self.__basis_loglevel = self.__basis_log.level
+        self.__basis_log.setLevel(logging.ERROR)
+
+    def tearDown (self):
+        self.__basis_log.level = self.__basis_loglevel
+
+    def roundTrip (self, instance):
+        rv = None
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            rv = pickle.loads(pickle.dumps(instance, protocol))
+            self.assertEqual(type(instance), type(rv))
+            self.assertEqual(instance.toxml('utf-8'), rv.toxml('utf-8'))
+        return rv
+
+    def testElements (self):
+        xmlt = '<records xmlns="urn:pickle"><record kind="k" codes="1 2"><key>1</key><text>a</text><text>b</text><when>2010-01-02T03:04:05Z</when></record><record><key>2</key></record></records>'
+        instance = CreateFromDocument(xmlt)
+        restored = self.roundTrip(instance)
+        self.assertEqual(2, len(restored.record))
+        record = restored.record[0]
+        self.assertEqual(1, record.key)
+        self.assertEqual(['a', 'b'], list(record.text))
+        self.assertEqual(instance.record[0].when, record.when)
+        self.assertEqual('k', record.kind)
+        self.assertEqual([1, 2], list(record.codes))
+        self.assertEqual(records, restored._element())
+        self.assertEqual(records.typeDefinition()._ElementMap[record._element().name()].elementBinding(), record._element())
+        self.assertEqual(record.text[1]._element(), restored.record[0].text[0]._element())
+        self.assertTrue(restored.validateBinding())
+
+    def testContentIdentity (self):
+        instance = CreateFromDocument('<records xmlns="urn:pickle"><record><key>1</key><text>a</text></record></records>')
+        restored = self.roundTrip(instance)
+        record = restored.record[0]
+        content = record.orderedContent()
+        self.assertEqual(2, len(content))
+        self.assertTrue(content[0].value is record.key)
+        self.assertTrue(content[1].value is record.text[0])
+        self.assertTrue(restored.orderedContent()[0].value is record)
+
+    def testTransientState (self):
+        instance = CreateFromDocument('<records xmlns="urn:pickle"><record kind="k"><key>1</key><text>a</text></record></records>')
+        self.assertTrue(instance.record[0].key._location() is not None)
+        serialized = pickle.dumps(instance, 2)
+        for name in (b'NamespaceContext', b'Location', b'AutomatonConfiguration', b'validatedChildrenCache'):
+            self.assertEqual(-1, serialized.find(name))
+        restored = pickle.loads(serialized)
+        self.assertTrue(restored._location() is None)
+        self.assertTrue(restored.record[0].key._location() is None)
+
+    def testModify (self):
+        instance = CreateFromDocument('<records xmlns="urn:pickle"><record><key>1</key><text>a</text></record></records>')
+        restored = self.roundTrip(instance)
+        restored.record[0].text.append('b')
+        restored.record.append(tRecord(key=2))
+        self.assertEqual(b'<ns1:records xmlns:ns1="urn:pickle"><ns1:record><ns1:key>1</ns1:key><ns1:text>a</ns1:text><ns1:text>b</ns1:text></ns1:record><ns1:record><ns1:key>2</ns1:key></ns1:record></ns1:records>', restored.toxml('utf-8', root_only=True))
+        self.assertEqual(1, len(instance.record[0].text))
+
+    def testAppendAfterUnpickle (self):
+        # The content model state is rebuilt, so appended content follows
+        # the restored content.
+        instance = CreateFromDocument('<triple xmlns="urn:pickle"><a>1</a><b>2</b></triple>')
+        restored = self.roundTrip(instance)
+        restored.append(3)
+        self.assertEqual(b'<ns1:triple xmlns:ns1="urn:pickle"><ns1:a>1</ns1:a><ns1:b>2</ns1:b><ns1:c>3</ns1:c></ns1:triple>', restored.toxml('utf-8', root_only=True))
+        self.assertRaises(MixedContentError, restored.append, 4)
+        restored = self.roundTrip(CreateFromDocument('<para xmlns="urn:pickle">one <em>two</em></para>'))
+        restored.append('four')
+        self.assertEqual(['two', 'four'], list(restored.em))
+
+    def testNil (self):
+        instance = CreateFromDocument('<records xmlns="urn:pickle" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><record><key>1</key></record><last xsi:nil="true"/></records>')
+        restored = self.roundTrip(instance)
+        self.assertTrue(restored.last._isNil())
+        self.assertFalse(restored.record[0]._isNil())
+
+    def testMixed (self):
+        instance = CreateFromDocument('<para xmlns="urn:pickle">one <em>two</em> three</para>')
+        restored = self.roundTrip(instance)
+        self.assertEqual(['two'], list(restored.em))
+        self.assertEqual('one  three', ''.join(pyxb.binding.basis.NonElementContent.ContentIterator(restored.orderedContent())))
+
+    def testWildcard (self):
+        xmlt = '<wild xmlns="urn:pickle" xmlns:o="urn:other" o:flag="on"><a>a</a><o:extra o:n="1">x<o:inner/></o:extra></wild>'
+        instance = CreateFromDocument(xmlt)
+        self.assertEqual(1, len(instance.wildcardElements()))
+        restored = self.roundTrip(instance)
+        self.assertEqual(instance.wildcardAttributeMap(), restored.wildcardAttributeMap())
+        wce = restored.wildcardElements()
+        self.assertEqual(1, len(wce))
+        self.assertEqual('urn:other', wce[0].namespaceURI)
+        self.assertEqual('extra', wce[0].localName)
+        self.assertTrue(restored.orderedContent()[1].value is wce[0])
+
+    def testSimpleContent (self):
+        instance = CreateFromDocument('<measure xmlns="urn:pickle" unit="m">1.5</measure>')
+        restored = self.roundTrip(instance)
+        self.assertEqual(instance.value(), restored.value())
+        self.assertEqual('m', restored.unit)
+
+    def testCopy (self):
+        instance = CreateFromDocument('<records xmlns="urn:pickle"><record><key>1</key><text>a</text></record></records>')
+        shallow = copy.copy(instance)
+        self.assertTrue(shallow.record is instance.record)
+        self.assertTrue(shallow._location() is instance._location())
+        deep = copy.deepcopy(instance)
+        self.assertFalse(deep.record is instance.record)
+        self.assertEqual(instance.toxml('utf-8'), deep.toxml('utf-8'))
+        deep.record[0].text.append('b')
+        self.assertEqual(1, len(instance.record[0].text))
+        self.assertEqual(2, len(deep.record[0].text))
+
+if __name__ == '__main__':
+    unittest.main()
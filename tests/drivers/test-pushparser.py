@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import xml.sax
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="message">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="part" type="xs:string" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:int"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestPushParser (unittest.TestCase):
+    xmlt = '<message id="3">' + ''.join([ '<part>pé%d</part>' % (_i,) for _i in range(10) ]) + '</message>'
+
+    def tearDown (self):
+        pyxb._SetXMLStyle()
+
+    def feedAll (self, parser, xmld, chunk_size):
+        for i in range(0, len(xmld), chunk_size):
+            parser.feed(xmld[i:i+chunk_size])
+        return parser.close()
+
+    def checkInstance (self, instance):
+        self.assertTrue(isinstance(instance, message.typeDefinition()))
+        self.assertEqual(3, instance.id)
+        self.assertEqual([ 'pé%d' % (_i,) for _i in range(10) ], list(instance.part))
+
+    def testChunks (self):
+        xmld = self.xmlt.encode('utf-8')
+        for style in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+            pyxb._SetXMLStyle(style)
+            for chunk_size in (1, 5, len(xmld)):
+                self.checkInstance(self.feedAll(CreatePushParser(), xmld, chunk_size))
+
+    def testText (self):
+        parser = CreatePushParser()
+        self.checkInstance(self.feedAll(parser, self.xmlt, 7))
+
+    def testReuse (self):
+        parser = CreatePushParser()
+        self.checkInstance(self.feedAll(parser, self.xmlt.encode('utf-8'), 16))
+        instance = self.feedAll(parser, b'<message><part>x</part></message>', 4)
+        self.assertEqual(['x'], list(instance.part))
+
+    def testSaxer (self):
+        parser = pyxb.binding.saxer.PushParser(fallback_namespace=Namespace.fallbackNamespace(), location_base='msg')
+        instance = self.feedAll(parser, self.xmlt.encode('utf-8'), 9)
+        self.checkInstance(instance)
+        self.assertEqual('msg', instance.part[0]._location().locationBase)
+        parser = pyxb.binding.saxer.PushParser(fallback_namespace=Namespace.fallbackNamespace())
+        instance = self.feedAll(parser, b'<message>\n<part>a</part>\n\n<part>b</part>\n</message>', 5)
+        self.assertEqual([ 1, 2, 4 ], [ _v._location().lineNumber for _v in [ instance ] + list(instance.part) ])
+
+    def testErrors (self):
+        parser = CreatePushParser()
+        parser.feed(b'<message><part>x</part>')
+        self.assertRaises(xml.sax.SAXParseException, parser.close)
+        # Content errors are detected as the chunk is processed
+        parser = CreatePushParser()
+        self.assertRaises(IncompleteElementContentError, parser.feed, b'<message></message>')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import io
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="part" type="tItem" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+  </xs:complexType>
+  <xs:element name="catalog">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" type="tItem" maxOccurs="unbounded"/>
+        <xs:element name="extra" minOccurs="0">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:any processContents="lax"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="note" type="xs:string" nillable="true"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestToXMLIter (unittest.TestCase):
+    def makeCatalog (self, count):
+        instance = catalog()
+        for i in range(count):
+            item = tItem('item %d' % (i,), id=i)
+            item.part.append(tItem('part %d' % (i,)))
+            instance.item.append(item)
+        return instance
+
+    def testChunks (self):
+        instance = self.makeCatalog(200)
+        xmld = instance.toxml('utf-8')
+        chunks = list(instance.toxml_iter(chunk_size=256))
+        self.assertTrue(10 < len(chunks))
+        for chunk in chunks[:-1]:
+            self.assertTrue(isinstance(chunk, bytes))
+            self.assertTrue(256 <= len(chunk))
+        self.assertEqual(xmld, b''.join(chunks))
+        chunks = list(instance.toxml_iter(encoding=None, root_only=True))
+        self.assertEqual(1, len(chunks))
+        self.assertEqual(instance.toDOM().documentElement.toxml(), chunks[0])
+
+    def testLazy (self):
+        instance = self.makeCatalog(200)
+        chunks = instance.toxml_iter(chunk_size=256)
+        first = next(chunks)
+        self.assertTrue(first.startswith(b'<?xml version="1.0" encoding="utf-8"?><catalog><item id="0">'))
+        # Content later in the document has not yet been visited
+        instance.item[-1].name = 'last'
+        xmld = first + b''.join(chunks)
+        self.assertTrue(xmld.endswith(b'<item id="199"><name>last</name><part><name>part 199</name></part></item></catalog>'))
+
+    def testWildcard (self):
+        instance = self.makeCatalog(2)
+        instance.extra = pyxb.BIND(note('text'))
+        xmld = b''.join(instance.toxml_iter(chunk_size=16))
+        self.assertEqual(instance.toxml('utf-8'), xmld)
+        self.assertTrue(xmld.endswith(b'</item><extra><note>text</note></extra></catalog>'))
+        stream = io.BytesIO()
+        instance.toxml('utf-8', stream=stream)
+        self.assertEqual(xmld, stream.getvalue())
+
+    def testSimple (self):
+        instance = note('text')
+        self.assertEqual(instance.toxml('utf-8'), b''.join(instance.toxml_iter()))
+        instance = note(_nil=True)
+        self.assertEqual(instance.toxml('utf-8'), b''.join(instance.toxml_iter()))
+
+    def testErrors (self):
+        instance = self.makeCatalog(100)
+        instance.item[50].name = None
+        chunks = instance.toxml_iter(chunk_size=64)
+        self.assertTrue(next(chunks).startswith(b'<?xml'))
+        self.assertRaises(pyxb.ValidationError, list, chunks)
+        self.assertRaises(pyxb.UsageError, instance.toxml_iter, bds=pyxb.utils.domutils.BindingDOMSupport())
+
+if __name__ == '__main__':
+    unittest.main()
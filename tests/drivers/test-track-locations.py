@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="doc">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="count" type="xs:int" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:int"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestTrackLocations (unittest.TestCase):
+    def parse (self, xmlt, **kw):
+        parser = pyxb.binding.saxer.PushParser(fallback_namespace=Namespace.fallbackNamespace(), location_base='doc.xml', **kw)
+        parser.feed(xmlt.encode('utf-8'))
+        return parser.close()
+
+    def testDefault (self):
+        instance = self.parse('<doc>\n<count>1</count>\n</doc>')
+        self.assertEqual(1, instance._location().lineNumber)
+        self.assertEqual('doc.xml', instance._location().locationBase)
+
+    def testDisabled (self):
+        for style in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat):
+            pyxb._SetXMLStyle(style)
+            try:
+                parser = pyxb.binding.saxer.PushParser(fallback_namespace=Namespace.fallbackNamespace(), track_locations=False)
+                self.assertFalse(parser.contentHandler().tracksLocations())
+                parser.feed(b'<doc id="2">\n<count>1</count>\n<count>2</count>\n</doc>')
+                instance = parser.close()
+            finally:
+                pyxb._SetXMLStyle()
+            self.assertEqual(2, instance.id)
+            self.assertEqual([1, 2], list(instance.count))
+            self.assertTrue(instance._location() is None)
+            for ec in instance.orderedContent():
+                self.assertTrue(ec.value._location() is None)
+
+    def testErrorLocation (self):
+        # Errors still identify where they were detected
+        with self.assertRaises(IncompleteElementContentError) as cm:
+            self.parse('<doc>\n<count>1</count>\n<doc/>\n</doc>', track_locations=False)
+        self.assertEqual(3, cm.exception.location.lineNumber)
+        self.assertEqual('doc.xml', cm.exception.location.locationBase)
+        with self.assertRaises(SimpleTypeValueError) as cm:
+            self.parse('<doc>\n\n<count>x</count>\n</doc>', track_locations=False)
+        self.assertEqual(3, cm.exception.location.lineNumber)
+        with self.assertRaises(IncompleteElementContentError) as cm:
+            self.parse('<doc>\n</doc>', track_locations=False)
+        self.assertEqual(2, cm.exception.location.lineNumber)
+
+if __name__ == '__main__':
+    unittest.main()
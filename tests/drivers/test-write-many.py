@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import io
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:batch" targetNamespace="urn:batch" elementFormDefault="qualified">
+  <xs:element name="record">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="key" type="xs:int"/>
+        <xs:element name="text" type="xs:string" minOccurs="0"/>
+      </xs:sequence>
+      <xs:attribute name="kind" type="xs:string"/>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="note" type="xs:string"/>
+</xs:schema>'''
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestWriteMany (unittest.TestCase):
+    def setUp (self):
+        self.records = [ record(key=1, text='one'), record(key=2, kind='k'), note('n'), record(key=3, text='three') ]
+
+    def testDocuments (self):
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        documents = list(bds.documents(self.records))
+        self.assertEqual(len(self.records), len(documents))
+        for (instance, document) in zip(self.records, documents):
+            self.assertEqual(instance.toxml(), document)
+        self.assertEqual('<?xml version="1.0" ?><ns1:record kind="k" xmlns:ns1="urn:batch"><ns1:key>2</ns1:key></ns1:record>', documents[1])
+
+    def testDocumentsEncoded (self):
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        documents = list(bds.documents(self.records, encoding='utf-8', xml_declaration=False))
+        for (instance, document) in zip(self.records, documents):
+            self.assertEqual(instance.toxml('utf-8', root_only=True), document)
+            self.assertEqual(document, CreateFromDocument(document).toxml('utf-8', root_only=True))
+
+    def testDocumentsPrefixes (self):
+        # Prefixes assigned for one document are retained for the rest
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        for document in bds.documents(self.records, xml_declaration=False):
+            self.assertEqual(1, document.count('xmlns'))
+            self.assertTrue('xmlns:ns1="urn:batch"' in document)
+        self.assertEqual('<ns1:record xmlns:ns1="urn:batch"><ns1:key>3</ns1:key><ns1:text>three</ns1:text></ns1:record>', document)
+        self.assertTrue(bds.namespacesFrozen())
+        self.assertRaises(pyxb.LogicError, bds.declareNamespace, Namespace, 'b')
+
+    def testFrozenWrite (self):
+        # A frozen writer reuses its prefixes and document elements in write
+        bds = pyxb.utils.domutils.BindingXMLWriter().freezeNamespaces()
+        for instance in self.records + self.records:
+            stream = io.StringIO()
+            bds.write(instance, stream)
+            self.assertEqual(instance.toxml(), stream.getvalue())
+
+    def testWriteMany (self):
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        stream = io.StringIO()
+        bds.writeMany(self.records, stream, Namespace.createExpandedName('batch'), xml_declaration=False)
+        xmlt = stream.getvalue()
+        self.assertEqual(1, xmlt.count('xmlns'))
+        dom = pyxb.utils.domutils.StringToDOM(xmlt)
+        children = [ _n for _n in dom.documentElement.childNodes if _n.nodeType == _n.ELEMENT_NODE ]
+        self.assertEqual(len(self.records), len(children))
+        for (instance, node) in zip(self.records, children):
+            self.assertEqual(instance.toxml('utf-8', root_only=True), CreateFromDOM(node).toxml('utf-8', root_only=True))
+
+    def testWriteManyEmpty (self):
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        stream = io.BytesIO()
+        bds.writeMany([], stream, 'empty', encoding='utf-8')
+        self.assertEqual(b'<?xml version="1.0" encoding="utf-8"?><empty/>', stream.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import io
+import xml.dom.minidom
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:writer" targetNamespace="urn:writer" elementFormDefault="qualified">
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tDerived">
+    <xs:complexContent>
+      <xs:extension base="tns:tBase">
+        <xs:sequence>
+          <xs:element name="extra" type="xs:string"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:complexType name="tMixed" mixed="true">
+    <xs:sequence>
+      <xs:element name="em" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="doc">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="title" type="xs:string"/>
+        <xs:element name="ref" type="xs:QName" minOccurs="0"/>
+        <xs:element name="base" type="tns:tBase" minOccurs="0" maxOccurs="unbounded"/>
+        <xs:element name="opt" type="xs:int" nillable="true" minOccurs="0"/>
+        <xs:element name="para" type="tns:tMixed" minOccurs="0"/>
+        <xs:any namespace="##other" processContents="lax" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="code" type="xs:string"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class _Chunks (object):
+    def __init__ (self):
+        self.chunks = []
+    def write (self, data):
+        self.chunks.append(data)
+
+class TestXMLWriter (unittest.TestCase):
+    xmlt = '<ns1:doc xmlns:ns1="urn:writer" xmlns:o="urn:other" code="a&amp;b&quot;c"><ns1:title>x &lt; y &amp; z</ns1:title><ns1:ref>o:thing</ns1:ref><ns1:base><ns1:name>n</ns1:name></ns1:base><ns1:base xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:type="ns1:tDerived"><ns1:name>n2</ns1:name><ns1:extra>e</ns1:extra></ns1:base><ns1:opt xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:nil="true"/><ns1:para>one <ns1:em>two</ns1:em> three</ns1:para><o:w a="1"><o:v>t</o:v></o:w></ns1:doc>'
+
+    def setUp (self):
+        self.__logLevel = logging.getLogger('pyxb.binding.basis').level
+        # Suppress the warning about the wildcard element
+        logging.getLogger('pyxb.binding.basis').setLevel(logging.ERROR)
+
+    def tearDown (self):
+        logging.getLogger('pyxb.binding.basis').setLevel(self.__logLevel)
+
+    def testRoundTrip (self):
+        instance = CreateFromDocument(self.xmlt)
+        stream = io.BytesIO()
+        self.assertEqual(None, instance.toxml('utf-8', stream=stream))
+        xmld = stream.getvalue()
+        self.assertTrue(xmld.startswith(b'<?xml version="1.0" encoding="utf-8"?><ns1:doc'))
+        # Namespaces not reachable through the content model are declared
+        # where they are used.
+        self.assertTrue(b'<ns1:ref xmlns:ns2="urn:other">ns2:thing</ns1:ref>' in xmld)
+        self.assertTrue(b'<ns1:opt xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:nil="true"></ns1:opt>' in xmld)
+        self.assertTrue(b'<ns1:para>one <ns1:em>two</ns1:em> three</ns1:para>' in xmld)
+        self.assertTrue(b'<ns2:w a="1" xmlns:ns2="urn:other"><ns2:v>t</ns2:v></ns2:w>' in xmld)
+        copy = CreateFromDocument(xmld)
+        self.assertTrue(isinstance(copy.base[1], tDerived))
+        self.assertTrue(copy.opt._isNil())
+        self.assertEqual(instance.toxml('utf-8'), copy.toxml('utf-8'))
+
+    def testSameAsDOM (self):
+        instance = doc('t', code='<&>')
+        instance.base.append(tBase('a'))
+        instance.base.append(tBase('b'))
+        bds = pyxb.utils.domutils.BindingDOMSupport()
+        xmld = instance.toxml('utf-8', bds=bds)
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        stream = io.BytesIO()
+        instance.toxml('utf-8', bds=bds, stream=stream)
+        self.assertEqual(xmld, stream.getvalue())
+        bds = pyxb.utils.domutils.BindingDOMSupport(default_namespace=Namespace)
+        xmld = instance.toxml('utf-8', bds=bds, root_only=True)
+        bds = pyxb.utils.domutils.BindingXMLWriter(default_namespace=Namespace)
+        stream = io.BytesIO()
+        instance.toxml('utf-8', bds=bds, stream=stream, root_only=True)
+        self.assertEqual(xmld, stream.getvalue())
+
+    def testUnqualified (self):
+        instance = doc('t')
+        instance.append(pyxb.utils.domutils.StringToDOM('<o:w xmlns:o="urn:other"><v/></o:w>').documentElement)
+        bds = pyxb.utils.domutils.BindingXMLWriter(default_namespace=Namespace)
+        stream = io.BytesIO()
+        instance.toxml('utf-8', bds=bds, stream=stream, root_only=True)
+        xmld = stream.getvalue()
+        # The unqualified element is not placed in the default namespace
+        self.assertTrue(b'<v xmlns=""/>' in xmld)
+        v = xml.dom.minidom.parseString(xmld).getElementsByTagName('v')[0]
+        self.assertTrue(v.namespaceURI is None)
+
+    def testText (self):
+        instance = doc('caf\u00e9')
+        stream = io.StringIO()
+        instance.toxml(stream=stream, root_only=True)
+        self.assertEqual(instance.toDOM().documentElement.toxml(), stream.getvalue())
+        stream = io.BytesIO()
+        instance.toxml('utf-8', stream=stream, root_only=True)
+        self.assertEqual(instance.toDOM().documentElement.toxml('utf-8'), stream.getvalue())
+
+    def testBuffering (self):
+        instance = doc('t')
+        for i in range(1000):
+            instance.base.append(tBase('name %d' % (i,)))
+        bds = pyxb.utils.domutils.BindingXMLWriter()
+        bds.BufferSize = 1024
+        sink = _Chunks()
+        instance.toxml('utf-8', bds=bds, stream=sink)
+        self.assertTrue(10 < len(sink.chunks))
+        self.assertEqual(instance.toxml('utf-8'), b''.join(sink.chunks))
+        # The writer can be reused
+        sink = _Chunks()
+        bds.write(instance, sink, 'utf-8')
+        self.assertEqual(instance.toxml('utf-8'), b''.join(sink.chunks))
+
+    def testErrors (self):
+        instance = doc('t')
+        self.assertRaises(pyxb.UsageError, instance.toxml, bds=pyxb.utils.domutils.BindingDOMSupport(), stream=io.StringIO())
+        # Validation failures are diagnosed as they would be for DOM output
+        instance = doc()
+        self.assertRaises(pyxb.IncompleteElementContentError, instance.toxml, stream=io.StringIO())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -120,5 +120,38 @@ class TestNamespaceURIs (unittest.TestCase):
         self.assertEqual(xml.dom.XMLNS_NAMESPACE, pyxb.namespace.XMLNamespaces.uri())
         self.assertEqual(xml.dom.XHTML_NAMESPACE, pyxb.namespace.XHTML.uri())
 
+class TestBindingDOMSupport (unittest.TestCase):
+    def testQNameCache (self):
+        ns = pyxb.namespace.NamespaceForURI('urn:test:domutils', create_if_missing=True)
+        qname = ns.createExpandedName('elt')
+        bds = BindingDOMSupport()
+        self.assertEqual('ns1:elt', bds.qnameAsText(qname))
+        self.assertEqual('ns1', bds.namespacePrefix(ns))
+        bds.reset()
+        # Cached names still record the prefix as referenced
+        self.assertEqual('ns1:elt', bds.qnameAsText(qname))
+        bds.createChildElement(qname)
+        self.assertEqual('urn:test:domutils', bds.finalize().documentElement.getAttribute('xmlns:ns1'))
+        # Declarations invalidate the cache
+        bds.setDefaultNamespace(ns)
+        self.assertEqual('elt', bds.qnameAsText(qname))
+        self.assertEqual('ns1:elt', bds.qnameAsText(qname, enable_default_namespace=False))
+
+    def testFreeze (self):
+        ns = pyxb.namespace.NamespaceForURI('urn:test:domutils', create_if_missing=True)
+        qname = ns.createExpandedName('elt')
+        bds = BindingDOMSupport()
+        bds.declareNamespace(ns, 'tst')
+        self.assertFalse(bds.namespacesFrozen())
+        self.assertTrue(bds is bds.freezeNamespaces())
+        self.assertTrue(bds.namespacesFrozen())
+        self.assertRaises(pyxb.LogicError, bds.declareNamespace, ns, 'other')
+        self.assertRaises(pyxb.LogicError, bds.setDefaultNamespace, ns)
+        # Frozen declarations survive reset
+        bds.reset()
+        self.assertEqual('tst:elt', bds.qnameAsText(qname))
+        bds.createChildElement(qname)
+        self.assertEqual('urn:test:domutils', bds.finalize().documentElement.getAttribute('xmlns:tst'))
+
 if '__main__' == __name__:
     unittest.main()
@@ -427,5 +427,63 @@ class TestFAC (unittest.TestCase):
         cfg = cfg.step('s')
         self.assertEqual(1, len(cfg.candidateTransitions('s')))
 
+    def testTransitionTable (self):
+        # a{1,2} b, compiled using the symbol as the key
+        tt = Sequence(NumericalConstraint(Symbol('a'), 1, 2), Symbol('b'))
+        au = tt.buildAutomaton()
+        self.assertFalse(au.isCompiled)
+        for st in au.states:
+            st._set_transitionTable(dict([ (_xit.destination.symbol, _xit) for _xit in st.transitionSet ]))
+        au._set_initialTransitionTable(dict([ (_st.symbol, _st) for _st in au.states if _st.isInitial ]))
+        self.assertTrue(au.isCompiled)
+        cfg = Configuration(au)
+        self.assertTrue(cfg.tableTransition('b') is None)
+        for sym in 'aab':
+            xit = cfg.tableTransition(sym)
+            self.assertEqual([xit], cfg.candidateTransitions(sym))
+            cfg = xit.apply(cfg)
+        self.assertTrue(cfg.isAccepting())
+        cfg = Configuration(au)
+        for sym in 'aa':
+            cfg = cfg.tableTransition(sym).apply(cfg)
+        # Counter limit reached
+        self.assertTrue(cfg.tableTransition('a') is None)
+        self.assertEqual([], cfg.candidateTransitions('a'))
+
+    def testTransitionCache (self):
+        au = self.ex.buildAutomaton()
+        self.assertTrue(au.transitionCache is None)
+        cache = au.enableTransitionCache(8)
+        self.assertTrue(au.transitionCache is cache)
+        for _ in xrange(3):
+            cfg = Configuration(au)
+            for c in 'aabcaa':
+                uncached = cfg.candidateTransitions(c)
+                cached = cfg.candidateTransitions(c, c)
+                self.assertEqual(uncached, cached)
+                cfg = cached[0].apply(cfg)
+            self.assertTrue(cfg.isAccepting())
+        self.assertEqual(18, cache.hits + cache.misses)
+        self.assertTrue(8 >= len(cache))
+        self.assertTrue(0 < cache.hits)
+        cache.clear()
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, len(cache))
+        au.disableTransitionCache()
+        self.assertTrue(au.transitionCache is None)
+
+    def testTransitionCacheLRU (self):
+        cache = TransitionCache(2)
+        cache.store(1, [1])
+        cache.store(2, [2])
+        self.assertEqual([1], cache.lookup(1))
+        cache.store(3, [3])
+        self.assertEqual(None, cache.lookup(2))
+        self.assertEqual([1], cache.lookup(1))
+        self.assertEqual([3], cache.lookup(3))
+        self.assertEqual(3, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertRaises(ValueError, TransitionCache, 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -524,6 +524,19 @@ class TestUTCTimeZone (unittest.TestCase):
         self.assertTrue(utc_a < utc_p1)
         self.assertTrue(utc_m1 < utc_a)
 
+    def testShared (self):
+        utc = UTCOffsetTimeZone.Shared()
+        self.assertTrue(utc is UTCOffsetTimeZone.Shared('Z'))
+        self.assertTrue(utc is UTCOffsetTimeZone.Shared('-00:00'))
+        self.assertTrue(utc is UTCOffsetTimeZone.Shared(0))
+        self.assertTrue(utc is UTCOffsetTimeZone.Shared(datetime.timedelta(0)))
+        tz = UTCOffsetTimeZone.Shared('+05:30')
+        self.assertEqual('+05:30', tz.tzname(None))
+        self.assertTrue(tz is UTCOffsetTimeZone.Shared(330))
+        self.assertTrue(tz is UTCOffsetTimeZone.Shared('+05:30'))
+        self.assertFalse(tz is UTCOffsetTimeZone('+05:30'))
+        self.assertRaises(ValueError, UTCOffsetTimeZone.Shared, '+14:01')
+
 class TestLocalTimeZone (unittest.TestCase):
     pass
 